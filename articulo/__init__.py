@@ -4,3 +4,4 @@
 Tiny library for extracting html article content."""
 
 from .articulo import Articulo
+from .extractor import Extractor
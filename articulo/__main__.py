@@ -0,0 +1,73 @@
+"""
+This file contains the command line interface of Articulo.
+
+Usage:
+    python -m articulo serve --port 8000 --workers 4
+    python -m articulo serve --socket /tmp/articulo.sock
+"""
+
+import argparse
+from typing import Union
+
+from .budget import Budget
+from .constants import content_strategies
+from .server import serve
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Creates parser of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="articulo")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser(
+        "serve", help="Serve extraction over HTTP with a pool of warm workers"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument(
+        "--socket", dest="socket_path", help="Unix socket path, replaces host and port"
+    )
+    serve_parser.add_argument("--workers", type=int, default=2)
+    serve_parser.add_argument("--threshold", type=float, default=0.7)
+    serve_parser.add_argument("--strategy", choices=content_strategies, default="title")
+    serve_parser.add_argument("--prefilter", action="store_true")
+    serve_parser.add_argument("--prefer-json-ld", action="store_true")
+    serve_parser.add_argument("--prefer-alternate", action="store_true")
+    serve_parser.add_argument(
+        "--deadline", type=float, help="Seconds a single article can take"
+    )
+    serve_parser.add_argument("--max-bytes", type=int, help="Max size of the html")
+    serve_parser.add_argument("--verbose", action="store_true")
+    return parser
+
+
+def main(argv: Union[list[str], None] = None) -> None:
+    """
+    Runs the command.
+    """
+    args = create_parser().parse_args(argv)
+
+    options = {
+        "threshold": args.threshold,
+        "strategy": args.strategy,
+        "prefilter": args.prefilter,
+        "prefer_json_ld": args.prefer_json_ld,
+        "prefer_alternate": args.prefer_alternate,
+    }
+    if args.deadline is not None or args.max_bytes is not None:
+        options["budget"] = Budget(deadline=args.deadline, max_bytes=args.max_bytes)
+
+    serve(
+        host=args.host,
+        port=args.port,
+        socket_path=args.socket_path,
+        workers=args.workers,
+        options=options,
+        verbose=args.verbose,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,31 +3,53 @@
 """This is Articulo.
 Tiny library for extracting html article content."""
 
-import re
-from functools import cached_property
-from typing import Union
-from urllib.parse import urlparse, urlunparse
-
-import extruct
-import validators
-import requests
+from contextlib import AbstractContextManager, nullcontext
+from copy import copy
+from io import StringIO
+from math import ceil
+from typing import Iterable, TextIO, Union
+from urllib.parse import urlparse
+
 from bs4 import BeautifulSoup, NavigableString, Tag
-from requests import RequestException
 
 from .exceptions import (
+    BudgetExceededException,
     HTTPErrorException,
     MaxIterations,
     NoTitleException,
     NoHTMLException,
-    DecodingException,
 )
 from .utils import (
+    clean_title_text,
     sanitize_html,
     get_json_ld_element,
     is_url,
 )
-
-
+from .constants import (
+    content_strategies,
+    head_prefetch_bytes,
+    reading_words_per_minute,
+)
+from .budget import Budget, BudgetMeter, default_max_depth, get_utf8_size
+from .scoring import score_content
+from .digest import ContentDigest
+from .fingerprint import Fingerprint
+from .head import DocumentHead, MediaCandidate
+from .language import normalize_language
+from .locking import locked_cached_property
+from .http import fetch_head, fetch_html
+from .metrics import Metrics
+from .prefilter import strip_blocks
+from .render import render_content
+from .sanitizer import SanitizerPolicy
+from .stats import TextStats
+from .structured import JsonLdArticle, find_json_ld_article
+from .tuning import ThresholdEvaluation, evaluate_thresholds
+from .template_cache import TemplateCache, find_by_path, get_element_path
+from .urls import UrlResolver, get_article_url, get_page_number
+
+
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
 class Articulo:
     """
     Articulo is the only and basic class of this library.
@@ -35,15 +57,27 @@ class Articulo:
     and instantiate with link as a parameter.
     """
 
-    __max_iterations_count = 100
-
-    def __init__(
+    def __init__(  # pylint: disable=too-many-locals
         self,
         link_or_content: str,
         threshold: float = 0.7,
         verbose: bool = False,
         http_headers: Union[dict, None] = None,
         def_charset: str = "utf-8",
+        *,
+        strategy: str = "title",
+        template_cache: Union[TemplateCache, None] = None,
+        sanitizer_policy: Union[SanitizerPolicy, None] = None,
+        session=None,
+        metrics: Union[Metrics, None] = None,
+        head_only: bool = False,
+        head_max_bytes: int = head_prefetch_bytes,
+        prefer_json_ld: bool = False,
+        prefilter: bool = False,
+        prefer_alternate: bool = False,
+        budget: Union[Budget, None] = None,
+        url: Union[str, None] = None,
+        redirects: Union[list[str], None] = None,
     ) -> None:
         """
         Article object
@@ -54,30 +88,148 @@ class Articulo:
         :verbose (optional): Verbose mode. If enabled than all the operations will be logged.
         :http_headers (optional): Additional headers for HTTP request. There is no default headers.
         :def_charset (optional): Default charset for article html. Default is utf-8.
-        """
+        :strategy (optional): Content search strategy. Default is title.
+            * title - looks for the content around the element matching the article title
+            * score - looks for the content with the highest score
+            * auto - uses score strategy when title strategy does not find anything
+        :template_cache (optional): Cache of the content paths by site domain.
+            Pages of the same site are checked against the remembered path first.
+        :sanitizer_policy (optional): Rules for the article content cleaning.
+        :session (optional): requests.Session used to load the article html.
+        :metrics (optional): Metrics to collect processing counters and timings to.
+        :head_only (optional): Load only the head of the page for the metadata properties.
+            Loading stops at the end of the head or after head_max_bytes are received,
+            so the content is looked for in the received prefix of the page only.
+        :head_max_bytes (optional): Max bytes loaded in the head only mode. Default is 64 KiB.
+        :prefer_json_ld (optional): Read title and text from JSON-LD articleBody and headline
+            when the document has them, without the content search.
+            Markup is still looked for in the document.
+        :prefilter (optional): Cut scripts, styles and svg images out of the html before parsing.
+            Scripts with ld+json structured data are kept.
+        :prefer_alternate (optional): Load only the head of the page first and extract
+            the content from its AMP or print version if there is one.
+            Metadata is still taken from the head of the page itself.
+        :budget (optional): Limits of the processing time, html size, number of elements
+            and sanitizer operations. BudgetExceededException is raised when any is exceeded.
+        :url (optional): Link the content was loaded from, when the content is provided.
+            Relative links of the content are resolved against it and it is the source url.
+        :redirects (optional): Links the url was redirected through, ending with the final link.
+        """
+
+        if strategy not in content_strategies:
+            raise ValueError(
+                f"Unknown strategy {strategy}. Possible values are: {content_strategies}"
+            )
 
         self.__link_or_content = link_or_content
         self.__threshold = threshold
         self.__verbose = verbose
         self.__http_headers = http_headers
         self.__def_charset = def_charset
+        self.__strategy = strategy
+        self.__template_cache = template_cache
+        self.__sanitizer_policy = sanitizer_policy
+        self.__session = session
+        self.__metrics = metrics
+        self.__head_only = head_only
+        self.__head_max_bytes = head_max_bytes
+        self.__prefer_json_ld = prefer_json_ld
+        self.__prefilter = prefilter
+        self.__prefer_alternate = prefer_alternate
+        self.__url = url
+        self.__redirects: list[str] = list(redirects or [])
+        self.__budget_meter = BudgetMeter(budget) if budget is not None else None
+        self.__max_depth = budget.max_depth if budget is not None else default_max_depth
 
     @property
     def title(self):
         """
         Parsed article title
         """
-        return self.__clean_title_text(self.__title_element.text)
+        if self.__json_ld_article is not None:
+            return self.__clean_title_text(self.__json_ld_article.headline)
+        return self.__clean_title_text(self.__title_text)
+
+    @property
+    def source_url(self) -> Union[str, None]:
+        """
+        Link to the document the content is extracted from:
+        the lightweight version of the page or the article link itself.
+        None if the article was created from the content without its link.
+        """
+        if self.__link is None:
+            return None
+        return self.__alternate_url or self.__link
+
+    @property
+    def redirects(self) -> list[str]:
+        """
+        Links the article link was redirected through, ending with the final link.
+        Empty if the article was created from the content without its redirects.
+        """
+        if is_url(self.__link_or_content):
+            self.__html  # pylint: disable=pointless-statement
+        return list(self.__redirects)
+
+    @locked_cached_property
+    def canonical_url(self) -> Union[str, None]:
+        """
+        Canonical link of the article: link with rel=canonical or og:url.
+        """
+        return self.__head.find_canonical()
 
     @property
     def text(self):
         """
         Parsed article main content text.
         """
-        markup = self.__content_markup
-        if markup is None:
+        if self.__content_digest is None:
             return None
-        return self.__content_markup.text
+        return self.__content_digest.text
+
+    @property
+    def fingerprint(self) -> Union[Fingerprint, None]:
+        """
+        Fingerprint of the article main content text.
+        Can be used to find the same or near-duplicate articles with DuplicateIndex.
+        """
+        if self.__content_digest is None:
+            return None
+        return self.__content_digest.fingerprint
+
+    @property
+    def word_count(self) -> Union[int, None]:
+        """
+        Number of words in the article main content text.
+        """
+        if self.__content_digest is None:
+            return None
+        return self.__content_digest.word_count
+
+    @property
+    def reading_time(self) -> Union[int, None]:
+        """
+        Estimated reading time of the article main content in minutes.
+        """
+        if self.__content_digest is None:
+            return None
+        return ceil(self.__content_digest.word_count / reading_words_per_minute)
+
+    def evaluate_thresholds(
+        self, thresholds: Iterable[float]
+    ) -> list[ThresholdEvaluation]:
+        """
+        Chooses the content container with every threshold over the single parse,
+        e.g. for the threshold tuning. Content is looked for around the article title
+        and is not sanitized.
+        Returns the container and its text length for every threshold.
+        """
+        return evaluate_thresholds(
+            self.__title_chain,
+            self.__text_stats,
+            thresholds,
+            self.__max_depth,
+        )
 
     @property
     def markup(self):
@@ -88,7 +240,42 @@ class Articulo:
             return None
         return str(self.__content_markup)
 
-    @cached_property
+    @locked_cached_property
+    def markdown(self):
+        """
+        Article main content as Markdown.
+        """
+        if self.__content_markup is None:
+            return None
+        out = StringIO()
+        self.write_to(out)
+        return out.getvalue()
+
+    @locked_cached_property
+    def plain_text(self):
+        """
+        Article main content text with paragraphs separated by empty lines.
+        """
+        if self.__content_markup is None:
+            return None
+        out = StringIO()
+        self.write_to(out, "text")
+        return out.getvalue()
+
+    def write_to(self, out: TextIO, output_format: str = "markdown") -> None:
+        """
+        Writes article main content into the text stream.
+        Nothing is written if there is no content found.
+
+        Params:
+        :out: Text stream, e.g. opened file.
+        :output_format (optional): Output format, markdown or text. Default is markdown.
+        """
+        if self.__content_markup is None:
+            return
+        render_content(self.__content_markup, out, output_format)
+
+    @locked_cached_property
     def description(self):
         """
         Article short description.
@@ -98,57 +285,41 @@ class Articulo:
             ["description", "og:description", "twitter:description"],
         )
 
-    @cached_property
+    @locked_cached_property
     def preview(self):
         """
-        Dict with article icons.
-        Keys are sizes and values are links to icons.
+        Link to article meta preview image.
+        The biggest og:image is preferred over twitter:image.
         """
-        preview = self.__try_get_meta_content(
-            ["name", "property"], ["og:image", "twitter:image", "twitter:image:src"]
-        )
+        previews = self.__head.previews
+        return previews[0].url if previews else None
 
-        if preview is not None:
-            preview = self.__get_absolute_link(preview)
-        return preview
+    @locked_cached_property
+    def icons(self) -> list[MediaCandidate]:
+        """
+        All the article icons sorted from the best to the worst.
+        Scalable and bigger icons go first, mask icons go last.
+        """
+        return self.__head.icons
 
-    @cached_property
+    @locked_cached_property
     def icon(self):
         """
         Link to article icon.
         The biggest possible icon will be returned if there are
         multiple icons and size attribute provided.
         In other case will be returned first icon.
+        Apple touch and mask icons are used only if there are no regular icons.
         """
-        icon_src = None
-        last_biggest_size = 0
-
-        soup = BeautifulSoup(self.__html, features="lxml")
-        icons_meta = soup.findAll("link", attrs={"rel": "icon"})
-        for icon in icons_meta:
-            href: Union[str, None] = icon.get("href")
-            sizes: Union[str, None] = icon.get("sizes")
-
-            if href is None:
-                continue
-
-            if sizes is None:
-                if icon_src is None:
-                    icon_src = self.__get_absolute_link(href)
-                continue
-
-            for size in sizes.split(" "):
-                if re.match(r"\d+x\d+", size):
-                    [width, _] = [int(i) for i in size.split("x")]
-                    if width > last_biggest_size:
-                        icon_src = self.__get_absolute_link(href)
-                        last_biggest_size = width
-                else:
-                    self.__log(f"Invalid size attribute: {size} for icon {href}")
-                    icon_src = self.__get_absolute_link(href)
-        return icon_src
+        icons = self.icons
+        if not icons:
+            return None
+        regular_icon = next(
+            (icon for icon in icons if icon.kind in ("icon", "shortcut icon")), icons[0]
+        )
+        return regular_icon.url
 
-    @cached_property
+    @locked_cached_property
     def keywords(self):
         """
         List of article's keywords.
@@ -156,23 +327,70 @@ class Articulo:
         kw_str = self.__try_get_meta_content(["name"], ["keywords"], "")
         return [] if len(kw_str) == 0 else [kw.strip() for kw in kw_str.split(",")]
 
-    @cached_property
+    @locked_cached_property
+    def lang(self) -> Union[str, None]:
+        """
+        Primary language subtag of the article, e.g. en or ru.
+        Declared language of the document is preferred,
+        otherwise the language is guessed from the article text.
+        """
+        html = self.__soup.html
+        declared = [
+            html.get("lang") if html is not None else None,
+            self.__try_get_meta_content(["property"], ["og:locale"]),
+            self.__try_get_meta_content(
+                ["http-equiv"], ["content-language", "Content-Language"]
+            ),
+        ]
+        for value in declared:
+            language = normalize_language(value)
+            if language is not None:
+                return language
+
+        if self.__content_digest is None:
+            return None
+        return self.__content_digest.language
+
+    @locked_cached_property
     def rss(self):
         """
         Link to article's RSS feed.
         """
-        soup = BeautifulSoup(self.__html, features="lxml")
-        links = soup.findAll("link", attrs={"type": "application/rss+xml"})
+        links = self.__head.find_links("application/rss+xml")
 
         if len(links) == 0:
-            links = soup.findAll("link", attrs={"type": "application/atom+xml"})
+            links = self.__head.find_links("application/atom+xml")
 
-        if len(links) == 0:
-            return links
+        return [
+            self.__get_absolute_link(link.get("href")) for link in links if link.get("href")
+        ]
 
-        return [self.__get_absolute_link(link.attrs.get("href")) for link in links]
+    @locked_cached_property
+    def next_pages(self) -> list[str]:
+        """
+        Links to the next pages of a multi-page article:
+        links with rel=next and links to the numbered pages of the same article.
+        """
+        page_url = self.__link or self.__url_resolver.base_url
+        article_url = get_article_url(page_url) if page_url is not None else None
+        pages = []
+        for link in [*self.__head.links, *self.__soup.find_all("a", href=True)]:
+            href = link.get("href")
+            if not href or href.startswith("#"):
+                continue
+            url = self.__get_absolute_link(href)
+            is_next = "next" in [rel.lower() for rel in link.get("rel", [])]
+            is_numbered_page = (
+                link.name == "a"
+                and article_url is not None
+                and get_page_number(url) is not None
+                and get_article_url(url) == article_url
+            )
+            if (is_next or is_numbered_page) and url != page_url and url not in pages:
+                pages.append(url)
+        return pages
 
-    @cached_property
+    @locked_cached_property
     def has_paywall(self):
         """
         Check if article has paywall.
@@ -189,27 +407,56 @@ class Articulo:
             )
         return False
 
-    @cached_property
+    @locked_cached_property
     def __content_markup(self):
         """
         Parses article HTML and returns the main article content markup using recursion.
         """
-        soup = BeautifulSoup(self.__html, features="lxml")
-        raw_content = self.__look_for_best_parent(soup.body, 0)
-        if raw_content is None:
-            return raw_content
+        with self.__measure("content"):
+            raw_content = self.__find_raw_content()
+            if raw_content is None:
+                return raw_content
 
-        sanitized_content = self.__sanitize_content(raw_content)
-        return sanitized_content
+            sanitized_content = self.__sanitize_content(raw_content)
+            return sanitized_content
 
-    @cached_property
+    @locked_cached_property
+    def __content_digest(self) -> Union[ContentDigest, None]:
+        """
+        Text and fingerprint of the article content built in a single pass.
+        """
+        if self.__json_ld_article is not None:
+            return ContentDigest([self.__json_ld_article.body])
+        if self.__content_markup is None:
+            return None
+        return ContentDigest(self.__content_markup.strings)
+
+    @locked_cached_property
+    def __json_ld_article(self) -> Union[JsonLdArticle, None]:
+        """
+        Complete article found in JSON-LD of the document if it is preferred.
+        """
+        if not self.__prefer_json_ld:
+            return None
+
+        html = self.__html
+        with self.__measure("json_ld"):
+            article = find_json_ld_article(html)
+        if self.__metrics is not None:
+            self.__metrics.incr("json_ld.miss" if article is None else "json_ld.hit")
+        return article
+
+    @locked_cached_property
     def __microformat(self):
+        # Extruct pulls a lot of heavy dependencies, so it is imported on demand
+        import extruct  # pylint: disable=import-outside-toplevel
+
         try:
-            return extruct.extract(self.__html, base_url=self.__link_or_content)
+            return extruct.extract(self.__html, base_url=self.__page_url)
         except ValueError:
             return {}
 
-    @cached_property
+    @locked_cached_property
     def __title_element(self):
         """
         Parses article html and returns article title.
@@ -218,7 +465,7 @@ class Articulo:
         * any tag at the body with matching content - as a reference point for the article content
         """
 
-        soup = BeautifulSoup(self.__html, features="lxml")
+        soup = self.__soup
         title = soup.find("title")
 
         if title is None:
@@ -233,71 +480,213 @@ class Articulo:
             title_text = title_meta.get("content")
 
         possible_titles = soup.findAll(["h1", "h2", "h3", "h4", "h5", "h6", "p"])
+        normalized_title_text = self.__clean_title_text(title_text)
 
         for p_title in possible_titles:
-            if not isinstance(p_title.text, str) or len(p_title.text.strip()) == 0:
+            # Elements without words have nothing but whitespaces inside
+            if self.__text_stats.words(p_title) == 0:
                 continue
             pt_text = self.__clean_title_text(p_title.text)
-            normalized_title_text = self.__clean_title_text(title_text)
 
             if normalized_title_text in pt_text or pt_text in normalized_title_text:
                 return p_title
 
         return title
 
-    @cached_property
+    @locked_cached_property
+    def __title_text(self) -> str:
+        """
+        Text of the article title element.
+        """
+        return self.__title_element.text
+
+    @locked_cached_property
+    def __title_ancestors(self) -> set[int]:
+        """
+        Ids of all the elements containing the article title element.
+        """
+        return {id(parent) for parent in self.__title_element.parents}
+
+    @locked_cached_property
+    def __title_chain(self) -> list[Tag]:
+        """
+        Ancestors of the article title from the body down to the title's parent.
+        Empty if the title is not inside the body.
+        """
+        body = self.__soup.body
+        chain = [self.__title_element.parent]
+        for parent in self.__title_element.parent.parents:
+            if chain[-1] is body:
+                return chain[::-1]
+            chain.append(parent)
+        return chain[::-1] if chain[-1] is body else []
+
+    @locked_cached_property
+    def __head(self) -> DocumentHead:
+        """
+        Metadata of the article html collected in a single pass.
+        """
+        if self.__alternate_url is not None:
+            return self.__original_head
+        return DocumentHead(self.__soup, self.__get_absolute_link)
+
+    @locked_cached_property
+    def __original_head(self) -> DocumentHead:
+        """
+        Metadata of the article page loaded without the body.
+        """
+        soup = self.__original_head_soup
+        resolver = UrlResolver.from_document(self.__page_url, soup)
+        return DocumentHead(soup, resolver.resolve)
+
+    @locked_cached_property
+    def __original_head_soup(self) -> BeautifulSoup:
+        """
+        Parsed head of the article page.
+        """
+        html = self.__get_html_by_url(self.__link_or_content, head_only=True)
+        with self.__measure("parse"):
+            return BeautifulSoup(html, features="lxml")
+
+    @locked_cached_property
+    def __alternate_url(self) -> Union[str, None]:
+        """
+        Link to the lightweight version of the article page if it is preferred.
+        """
+        if (
+            not self.__prefer_alternate
+            or self.__head_only
+            or not is_url(self.__link_or_content)
+        ):
+            return None
+
+        alternate_url = self.__original_head.find_light_alternate()
+        if alternate_url is not None:
+            self.__log(f"Found lightweight version of the article: {alternate_url}")
+        return alternate_url
+
+    @locked_cached_property
+    def __url_resolver(self) -> UrlResolver:
+        """
+        Resolver of the relative links found in the article html.
+        """
+        if self.__alternate_url is not None:
+            soup = self.__original_head_soup
+        else:
+            soup = self.__soup
+        # Links are relative to the final link of the redirects, known after loading
+        return UrlResolver.from_document(self.__page_url, soup)
+
+    @property
+    def __page_url(self) -> Union[str, None]:
+        """
+        Final link of the loaded article page or None if the page was not loaded.
+        """
+        if self.__redirects:
+            return self.__redirects[-1]
+        return self.__link
+
+    @property
+    def __link(self) -> Union[str, None]:
+        """
+        Link to the article or the link its content was loaded from.
+        None if the article was created from the content without its link.
+        """
+        if is_url(self.__link_or_content):
+            return self.__link_or_content
+        return self.__url
+
+    @locked_cached_property
+    def __domain(self) -> Union[str, None]:
+        """
+        Domain of the article link or None if article was created from the content without its link.
+        """
+        if self.__link is None:
+            return None
+        return urlparse(self.__link).netloc
+
+    @locked_cached_property
+    def __soup(self) -> BeautifulSoup:
+        """
+        Parsed article html, shared by the title and the content search.
+        """
+        html = self.__html
+        with self.__measure("parse"):
+            return BeautifulSoup(html, features="lxml")
+
+    @locked_cached_property
+    def __text_stats(self) -> TextStats:
+        """
+        Text statistics for every element of the article html.
+        """
+        return TextStats(self.__soup, self.__budget_meter)
+
+    @locked_cached_property
     def __html(self) -> Union[str, None]:
         """
         Loads article html from link provided at the moment of an Articulo object instantiation.
         Returns full page html or None if request was not successful.
         """
         if is_url(self.__link_or_content):
-            text = self.__get_html_by_url()
+            text = self.__get_html_by_url(self.source_url, self.__head_only)
         else:
             text = self.__link_or_content
 
         if text is None or len(text) == 0:
             raise NoHTMLException(self.__link_or_content)
 
+        if self.__budget_meter is not None and not is_url(self.__link_or_content):
+            # Loaded html is charged while it is received
+            max_bytes = self.__budget_meter.budget.max_bytes
+            self.__budget_meter.charge("bytes", get_utf8_size(text, max_bytes))
+
+        if self.__prefilter:
+            with self.__measure("prefilter"):
+                text = strip_blocks(text)
         return text
 
-    def __get_html_by_url(self):
+    def __get_html_by_url(self, url: str, head_only: bool = False):
         """
         Gets the article content from the url
         """
-        self.__log(f"Start loading article from {self.__link_or_content}...")
-        response = requests.get(
-            self.__link_or_content, timeout=2000, headers=self.__http_headers
-        )
-        response.encoding = self.__def_charset
-
+        self.__log(f"Start loading article from {url}...")
+        redirects: list[str] = []
         try:
-            response.raise_for_status()
-        except RequestException as exc:
+            with self.__measure("fetch"):
+                if head_only:
+                    html = fetch_head(
+                        url,
+                        self.__http_headers,
+                        self.__def_charset,
+                        self.__head_max_bytes,
+                        self.__session,
+                        redirects=redirects,
+                        meter=self.__budget_meter,
+                    )
+                else:
+                    html = fetch_html(
+                        url,
+                        self.__http_headers,
+                        self.__def_charset,
+                        self.__session,
+                        redirects=redirects,
+                        meter=self.__budget_meter,
+                    )
+        except HTTPErrorException:
             self.__log("Error loading an article.")
-            raise HTTPErrorException(
-                f"Http error: {response.reason}", response.status_code
-            ) from exc
+            raise
         self.__log("Article loaded.")
-
-        try:
-            return response.content.decode(self.__def_charset)
-        except ValueError as exc:
-            raise DecodingException(self.__link_or_content, self.__def_charset) from exc
+        if url == self.__link_or_content:
+            self.__redirects = redirects
+        return html
 
     def __try_find_meta(
         self, attr_keys: list[str], attr_values: list[str]
-    ) -> Union[Tag, NavigableString, None]:
+    ) -> Union[Tag, None]:
         """
         Looks for metatags content by their names
         """
-        soup = BeautifulSoup(self.__html, features="lxml")
-        for key in attr_keys:
-            for val in attr_values:
-                if soup.findAll("meta", attrs={key: val}):
-                    return soup.find("meta", attrs={key: val})
-
-        return None
+        return self.__head.find_meta(attr_keys, attr_values)
 
     def __try_get_meta_content(
         self, attr_keys: list[str], attr_values: list[str], defval=None
@@ -308,46 +697,123 @@ class Articulo:
 
         return soup.get("content")
 
+    def __find_raw_content(self) -> Union[Tag, None]:
+        """
+        Looks for the main article content element with the selected strategy.
+        """
+        if self.__strategy == "score":
+            return self.__score_content()
+
+        try:
+            raw_content = self.__find_by_title()
+        except BudgetExceededException:
+            raise
+        except (MaxIterations, NoTitleException):
+            if self.__strategy != "auto":
+                raise
+            raw_content = None
+
+        if raw_content is None and self.__strategy == "auto":
+            self.__log("Title strategy found nothing. Falling back to scoring...")
+            raw_content = self.__score_content()
+        return raw_content
+
+    def __find_by_title(self) -> Union[Tag, None]:
+        """
+        Looks for the best parent element of the article title.
+        Tries the path remembered for the site first, if there is a template cache.
+        """
+        body = self.__soup.body
+        domain = self.__domain
+        if self.__template_cache is None or domain is None:
+            return self.__look_for_best_parent(body, 0)
+
+        path = self.__template_cache.get(domain)
+        if path is not None:
+            cached_content = find_by_path(body, path)
+            if cached_content is not None and self.__is_best_parent(cached_content):
+                self.__log(f"Found article content by the path cached for {domain}.")
+                self.__template_cache.record_hit()
+                return cached_content
+
+        self.__template_cache.record_miss()
+        raw_content = self.__look_for_best_parent(body, 0)
+        if raw_content is not None:
+            self.__template_cache.put(domain, get_element_path(raw_content, body))
+        return raw_content
+
+    def __is_best_parent(self, element: Tag) -> bool:
+        """
+        Checks that the cached element contains the article title
+        and passes the threshold check by itself, so only the element is visited.
+        """
+        if element is not self.__title_element.parent and (
+            id(element) not in self.__title_ancestors
+        ):
+            return False
+        return self.__passes_threshold(element)
+
+    def __passes_threshold(self, parent: Tag) -> bool:
+        """
+        Checks if the element is the best parent of the article title by itself.
+        """
+        if parent is self.__title_element.parent:
+            return True
+
+        for child in parent.children:
+            if id(child) in self.__title_ancestors:
+                information_loss_coeff = 1.0 - (
+                    self.__text_stats.chars(child) / self.__text_stats.chars(parent)
+                )
+                return information_loss_coeff > self.__threshold
+        return False
+
+    def __score_content(self) -> Union[Tag, None]:
+        """
+        Looks for the element with the highest content score.
+        """
+        self.__log("Scoring article content...")
+        if self.__soup.body is None:
+            return None
+        return score_content(self.__soup.body, self.__text_stats)
+
     def __look_for_best_parent(self, parent: Tag, iter_counter: int):
         """
         Recursively searches for the best parent element containing the main article content.
         """
         self.__log(
-            f'Looking for an element containing "{self.__title_element.text}" title inside {parent.name.upper()} tag...'  # pylint: disable=line-too-long
+            f'Looking for an element containing "{self.__title_text}" title inside {parent.name.upper()} tag...'  # pylint: disable=line-too-long
         )
 
-        if parent == self.__title_element.parent:
+        if parent is self.__title_element.parent:
             self.__log(
                 f"{parent.name.upper()} is equal to title's parent element. Best possible parent is found."  # pylint: disable=line-too-long
             )
             return parent
 
-        if iter_counter >= self.__max_iterations_count:
+        if iter_counter >= self.__max_depth:
             raise MaxIterations(
                 "Cannot find the best parent element within the maximum iterations."
             )  # pylint: disable=line-too-long
-
-        best_parent = None
+        if self.__budget_meter is not None:
+            self.__budget_meter.check_deadline()
 
         for child in parent.children:
             if isinstance(child, NavigableString):
                 self.__log(f'Skipping the "{child}" string...')
                 continue
 
-            if (
-                child.find(self.__title_element.name, string=self.__title_element.text)
-                is None
-            ):
+            if id(child) not in self.__title_ancestors:
                 self.__log(
-                    f'Not found "{self.__title_element.text}" inside {child.name.upper()} tag. Skipping...'  # pylint: disable=line-too-long
+                    f'Not found "{self.__title_text}" inside {child.name.upper()} tag. Skipping...'  # pylint: disable=line-too-long
                 )
                 continue
 
             self.__log(
-                f'Found a {child.name.upper()} child tag with "{self.__title_element.text} inside."'  # pylint: disable=line-too-long
+                f'Found a {child.name.upper()} child tag with "{self.__title_text} inside."'  # pylint: disable=line-too-long
             )
-            best_parent_content_length = len(parent.text)
-            child_content_length = len(child.text)
+            best_parent_content_length = self.__text_stats.chars(parent)
+            child_content_length = self.__text_stats.chars(child)
 
             information_loss_coeff = 1.0 - (
                 child_content_length / best_parent_content_length
@@ -356,20 +822,11 @@ class Articulo:
                 self.__log(
                     f"Content loss coefficient: {information_loss_coeff}. The best possible parent is {parent.name.upper()}."  # pylint: disable=line-too-long
                 )
-                best_parent = parent
-                break
-
-            iter_counter += 1
-
-        if best_parent:
-            return best_parent
+                return parent
 
-        # Recursively search in child elements
-        for child in parent.children:
-            if isinstance(child, Tag):
-                result = self.__look_for_best_parent(child, iter_counter)
-                if result:
-                    return result
+            # Only one child can contain the title element,
+            # so there is no need to look inside the others.
+            return self.__look_for_best_parent(child, iter_counter + 1)
 
         return None
 
@@ -378,25 +835,34 @@ class Articulo:
         Sanitizes article content from unnecessary tags.
         """
         self.__log("Sanitizing article content...")
-        return sanitize_html(content)
+        # Sanitizing works in place, so the copy is sanitized
+        # to keep the parsed document intact for the other properties.
+        return sanitize_html(
+            copy(content), self.__sanitizer_policy, self.__budget_meter
+        )
 
     def __get_absolute_link(self, link: str) -> str:
         """
         Makes absolute link from relative
         """
-        if validators.url(link) is not True and validators.url(self.__link_or_content) is True:
-            parsed_url = urlparse(self.__link_or_content)
-            parsed_url = parsed_url._replace(path=link)
-            return str(urlunparse(parsed_url))
-        return link
+        return self.__url_resolver.resolve(link)
 
     def __clean_title_text(self, text: str):
         """
         Cleans text from special and newline characters
         """
-        nbsp = "\xa0"
-        pt_text = re.sub(r"\n+.+", "", text.strip()).replace(nbsp, " ").strip()
-        return pt_text
+        return clean_title_text(text)
+
+    def __measure(self, stage: str) -> AbstractContextManager:
+        """
+        Measures duration of the processing stage if there are metrics to collect to.
+        Deadline of the budget is checked before and after the stage.
+        """
+        if self.__budget_meter is not None:
+            return self.__budget_meter.measure(stage, self.__metrics)
+        if self.__metrics is None:
+            return nullcontext()
+        return self.__metrics.measure(stage)
 
     def __log(self, message: str) -> None:
         """
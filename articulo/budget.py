@@ -0,0 +1,140 @@
+"""
+This file contains the resource budgets of the article processing.
+Budget limits the processing time, the size of the loaded html,
+the number of the parsed elements and the number of the sanitizer operations,
+so a single pathological page cannot stall the worker processing it.
+Every limit is checked with a counter comparison at the points
+where the corresponding resource is spent.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple, Union
+
+from .exceptions import BudgetExceededException
+from .metrics import Metrics
+
+# Max depth of the best parent search, it used to be the only limit
+default_max_depth = 100
+
+# Characters encoded at once while the size of the text is counted
+utf8_chunk_chars = 64 * 1024
+
+
+def get_utf8_size(text: str, limit: Union[int, None] = None) -> int:
+    """
+    Returns size of the text in utf-8 bytes without encoding the whole text at once.
+    Counting stops as soon as the size exceeds the limit.
+    """
+    # Every character takes at least one byte
+    if text.isascii() or (limit is not None and len(text) > limit):
+        return len(text)
+    size = 0
+    for start in range(0, len(text), utf8_chunk_chars):
+        size += len(text[start : start + utf8_chunk_chars].encode("utf8"))
+        if limit is not None and size > limit:
+            break
+    return size
+
+
+class Budget(NamedTuple):
+    """
+    Resource limits of a single article. None means there is no limit.
+    Budget is immutable, so it can be shared by all the articles of an extractor.
+
+    * deadline - seconds the loading and processing of the article can take
+    * max_nodes - max number of elements of the parsed document
+    * max_bytes - max size of the article html in bytes
+    * max_sanitizer_ops - max number of nodes the sanitizer can visit
+    * max_depth - max number of levels the best parent search can descend
+    """
+
+    deadline: Union[float, None] = None
+    max_nodes: Union[int, None] = None
+    max_bytes: Union[int, None] = None
+    max_sanitizer_ops: Union[int, None] = None
+    max_depth: int = default_max_depth
+
+
+class BudgetMeter:
+    """
+    Spending of the budget by a single article.
+    Time is counted from the start of the first measured stage.
+    Stage timings are collected, so the exception tells where the time was spent.
+    """
+
+    def __init__(self, budget: Budget) -> None:
+        self.budget = budget
+        self.timings: dict[str, float] = {}
+        self.__spent: dict[str, int] = {}
+        self.__started_at: Union[float, None] = None
+        # Start times of the stages being measured
+        self.__running: dict[str, float] = {}
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds passed since the processing started.
+        """
+        if self.__started_at is None:
+            return 0.0
+        return time.perf_counter() - self.__started_at
+
+    def check_deadline(self) -> None:
+        """
+        Raises BudgetExceededException if the deadline has passed.
+        """
+        if (
+            self.budget.deadline is not None
+            and self.__started_at is not None
+            and time.perf_counter() - self.__started_at > self.budget.deadline
+        ):
+            self.__exceed("deadline", self.budget.deadline)
+
+    def charge(self, resource: str, amount: int) -> None:
+        """
+        Spends the amount of the resource: nodes, bytes or sanitizer_ops.
+        Raises BudgetExceededException if the resource limit is exceeded.
+        """
+        limit = getattr(self.budget, f"max_{resource}")
+        spent = self.__spent.get(resource, 0) + amount
+        self.__spent[resource] = spent
+        if limit is not None and spent > limit:
+            self.__exceed(resource, limit)
+
+    def spent(self, resource: str) -> int:
+        """
+        Returns amount of the resource spent so far.
+        """
+        return self.__spent.get(resource, 0)
+
+    @contextmanager
+    def measure(
+        self, stage: str, metrics: Union[Metrics, None] = None
+    ) -> Iterator[None]:
+        """
+        Measures duration of the stage and checks the deadline before and after it.
+        Duration is added to the metrics as well if they are provided.
+        """
+        started_at = time.perf_counter()
+        if self.__started_at is None:
+            self.__started_at = started_at
+        self.__running[stage] = started_at
+        try:
+            self.check_deadline()
+            yield
+        finally:
+            self.__running.pop(stage, None)
+            duration = time.perf_counter() - started_at
+            self.timings[stage] = self.timings.get(stage, 0.0) + duration
+            if metrics is not None:
+                metrics.add_timing(stage, duration)
+        self.check_deadline()
+
+    def __exceed(self, resource: str, limit: float) -> None:
+        # Stages interrupted by the exception are counted up to this moment
+        timings = dict(self.timings)
+        now = time.perf_counter()
+        for stage, started_at in self.__running.items():
+            timings[stage] = timings.get(stage, 0.0) + now - started_at
+        raise BudgetExceededException(resource, limit, timings)
@@ -0,0 +1,77 @@
+"""
+This file contains the memo of the article links.
+Many links lead to the same article: short links redirect to it,
+AMP versions and links with tracking parameters point to it with the canonical link.
+Memo maps every known link of the processed articles to the canonical link,
+so the batch can skip the links of the articles it has already processed.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Iterable, Union
+
+from .articulo import Articulo
+from .urls import normalize_url
+
+
+class CanonicalMemo:
+    """
+    Bounded memo of the links mapped to the canonical links of the articles.
+    The least recently used links are evicted when the memo is full.
+    Memo is safe to share between threads.
+    """
+
+    def __init__(self, max_size: int = 100_000, normalize: bool = False) -> None:
+        """
+        Params:
+        :max_size (optional): Max number of the links kept. Default is 100000.
+        :normalize (optional): Normalize the links, so the links differing by scheme,
+            tracking parameters or AMP suffix are the same link. Default is False.
+        """
+        if max_size < 1:
+            raise ValueError("Max size should be positive")
+
+        self.max_size = max_size
+        self.normalize = normalize
+        self.__canonicals: OrderedDict[str, str] = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__canonicals)
+
+    def find(self, url: str) -> Union[str, None]:
+        """
+        Returns canonical link of the processed article the link leads to or None.
+        """
+        key = self.__get_key(url)
+        with self.__lock:
+            canonical = self.__canonicals.get(key)
+            if canonical is not None:
+                self.__canonicals.move_to_end(key)
+            return canonical
+
+    def add(self, urls: Iterable[str], canonical: str) -> None:
+        """
+        Maps the links and the canonical link itself to the canonical link.
+        """
+        keys = [self.__get_key(url) for url in [*urls, canonical]]
+        with self.__lock:
+            for key in keys:
+                self.__canonicals[key] = canonical
+                self.__canonicals.move_to_end(key)
+            while len(self.__canonicals) > self.max_size:
+                self.__canonicals.popitem(last=False)
+
+    def add_article(self, url: str, article: Articulo) -> str:
+        """
+        Maps the link of the loaded article, its redirects and the canonical link
+        to the canonical link. The final link is used if there is no canonical one.
+        Returns the canonical link.
+        """
+        redirects = article.redirects
+        canonical = article.canonical_url or (redirects[-1] if redirects else url)
+        self.add([url, *redirects], canonical)
+        return canonical
+
+    def __get_key(self, url: str) -> str:
+        return normalize_url(url) if self.normalize else url
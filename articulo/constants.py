@@ -2,41 +2,150 @@
 This file contains the constants used in the project.
 """
 
-important_content_tags = [
+important_content_tags = frozenset(
+    [
+        "p",
+        "a",
+        "span",
+        "img",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "blockquote",
+        "li",
+        "ul",
+        "ol",
+        "pre",
+        "code",
+        "figure",
+        "figcaption",
+        "strong",
+        "em",
+        "table",
+        "thead",
+        "tbody",
+        "tr",
+        "td",
+        "th",
+    ]
+)
+
+tags_to_completely_remove = frozenset(
+    [
+        "script",
+        "style",
+        "noscript",
+        "input",
+        "button",
+        "label",
+        "form",
+    ]
+)
+
+# Max bytes of the page loaded when only its head is needed
+head_prefetch_bytes = 64 * 1024
+
+# Max size of the decompressed response body
+max_response_bytes = 32 * 1024 * 1024
+
+# Max ratio of the decompressed and the transferred response sizes
+max_compression_ratio = 100
+
+# Compression ratio is not checked for the smaller bodies
+compression_ratio_floor = 1024 * 1024
+
+# Average reading speed used to estimate the article reading time
+reading_words_per_minute = 200
+
+# Content search strategies
+content_strategies = [
+    "title",
+    "score",
+    "auto",
+]
+
+# Tags, which text is scored when looking for the content without a title
+scored_paragraph_tags = [
     "p",
-    "a",
-    "span",
-    "img",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "blockquote",
-    "li",
-    "ul",
-    "ol",
     "pre",
-    "code",
-    "figure",
-    "figcaption",
-    "strong",
-    "em",
-    "table",
-    "thead",
-    "tbody",
-    "tr",
     "td",
-    "th",
+    "blockquote",
 ]
 
-tags_to_completely_remove = [
-    'script',
-    'style',
-    'noscript',
-    'input',
-    'button',
-    'label',
-    'form',
+# Score hints for the content candidates by their tag name
+content_tag_hints = {
+    "article": 10,
+    "main": 10,
+    "div": 5,
+    "section": 5,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "form": -3,
+    "ol": -3,
+    "ul": -3,
+    "li": -3,
+    "aside": -5,
+    "footer": -5,
+    "header": -5,
+    "nav": -5,
+    "h1": -5,
+    "h2": -5,
+    "h3": -5,
+    "h4": -5,
+    "h5": -5,
+    "h6": -5,
+    "th": -5,
+}
+
+# Words in class and id attributes, that point to the article content
+positive_content_hints = [
+    "article",
+    "body",
+    "content",
+    "entry",
+    "main",
+    "page",
+    "post",
+    "story",
+    "text",
 ]
+
+# Words in class and id attributes, that point to the non-content blocks
+negative_content_hints = [
+    "ad",
+    "banner",
+    "comment",
+    "footer",
+    "footnote",
+    "masthead",
+    "menu",
+    "meta",
+    "nav",
+    "promo",
+    "related",
+    "share",
+    "sidebar",
+    "social",
+    "sponsor",
+    "widget",
+]
+
+# Article properties returned by the service and the pipeline by default
+result_fields = (
+    "title",
+    "text",
+    "markup",
+    "description",
+    "preview",
+    "icon",
+    "lang",
+    "keywords",
+    "canonical_url",
+    "source_url",
+    "word_count",
+    "reading_time",
+)
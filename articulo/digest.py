@@ -0,0 +1,72 @@
+"""
+This file contains the digest of the article content.
+Digest is built in a single traversal of the content strings:
+it joins the text, counts the words and feeds the word tokens to the fingerprint
+and the language detector at the same time.
+Words are counted the same way as in the text statistics: split by whitespaces.
+"""
+
+import re
+from typing import Iterable, Union
+
+from articulo.fingerprint import Fingerprint, FingerprintBuilder
+from articulo.language import LanguageDetector
+from articulo.stats import NodeStats
+
+# Tokens of the fingerprint and the language detection
+word_re = re.compile(r"\w+")
+
+
+class ContentDigest:  # pylint: disable=too-few-public-methods
+    """
+    Text of the article content and everything computed from its words.
+    """
+
+    def __init__(self, strings: Iterable[str]) -> None:
+        """
+        Params:
+        :strings: Strings of the content in the document order.
+        """
+        parts = []
+        self.__fingerprint_builder = FingerprintBuilder()
+        self.__language_detector = LanguageDetector()
+        text_stats = NodeStats()
+        # Word split between the strings, e.g. "some<b>thing</b>"
+        pending_word = ""
+
+        for string in strings:
+            parts.append(string)
+            text_stats.add_string(string)
+            words = word_re.findall(string)
+            if not words:
+                if string:
+                    pending_word = self.__flush(pending_word)
+                continue
+
+            if pending_word:
+                if word_re.match(string):
+                    words[0] = pending_word + words[0]
+                else:
+                    self.__add_word(pending_word)
+                pending_word = ""
+
+            if word_re.match(string[-1]):
+                pending_word = words.pop()
+            for word in words:
+                self.__add_word(word)
+
+        self.__flush(pending_word)
+        self.text = "".join(parts)
+        self.word_count = text_stats.words
+        self.fingerprint: Fingerprint = self.__fingerprint_builder.build()
+        self.language: Union[str, None] = self.__language_detector.detect()
+
+    def __add_word(self, word: str) -> None:
+        word = word.lower()
+        self.__fingerprint_builder.update(word)
+        self.__language_detector.update(word)
+
+    def __flush(self, pending_word: str) -> str:
+        if pending_word:
+            self.__add_word(pending_word)
+        return ""
@@ -36,7 +36,7 @@ class HTTPErrorException(ArticuloException):
 class MaxIterations(ArticuloException):
     """
     Exception, raises when there is no parent
-    element found during 100 iterations.
+    element found within the max depth, 100 by default.
     """
 
 
@@ -65,3 +65,39 @@ class DecodingException(ArticuloException):
 
     def __init__(self, url: str, charset: str) -> None:
         super().__init__(f"Document {url} cannot be decoded with {charset} charset")
+
+
+class ResponseTooLargeException(ArticuloException):
+    """
+    Exception, raised when the article response
+    exceeds the size or compression ratio limits.
+    """
+
+    def __init__(self, url: str, reason: str) -> None:
+        super().__init__(f"Response from {url} is dropped: {reason}")
+
+
+class TransportException(ArticuloException):
+    """
+    Exception, raised when the article cannot be loaded
+    because the connection failed, timed out or was broken.
+    """
+
+    def __init__(self, url: str, reason: str) -> None:
+        self.url = url
+        self.reason = reason
+        super().__init__(f"Cannot load {url}: {reason}")
+
+
+class BudgetExceededException(MaxIterations):
+    """
+    Exception, raised when the article processing
+    exceeds one of the limits of its budget.
+    Timings contain durations of the stages passed so far.
+    """
+
+    def __init__(self, resource: str, limit: float, timings: dict[str, float]) -> None:
+        self.resource = resource
+        self.limit = limit
+        self.timings = timings
+        super().__init__(f"Article processing exceeded the {resource} limit of {limit}")
@@ -0,0 +1,141 @@
+"""
+This file contains the extractor - preconfigured factory of articles.
+It is meant for high-volume usage, when a lot of articles are
+processed with the same configuration.
+"""
+
+from threading import local
+from typing import Union
+
+from .articulo import Articulo
+from .budget import Budget
+from .constants import content_strategies, head_prefetch_bytes
+from .metrics import Metrics
+from .sanitizer import SanitizerPolicy, default_policy
+from .template_cache import TemplateCache
+from .utils import is_url
+
+
+class Extractor:  # pylint: disable=too-many-instance-attributes
+    """
+    Extractor holds configuration and state shared by all the articles
+    it creates: HTTP session, sanitizer policy, template cache and metrics.
+    Configure it once and call with a link or content of every article.
+    Extractor can be used from several threads and from asyncio code.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        verbose: bool = False,
+        http_headers: Union[dict, None] = None,
+        def_charset: str = "utf-8",
+        *,
+        strategy: str = "title",
+        template_cache: Union[TemplateCache, None] = None,
+        sanitizer_policy: Union[SanitizerPolicy, None] = None,
+        session=None,
+        head_only: bool = False,
+        head_max_bytes: int = head_prefetch_bytes,
+        prefer_json_ld: bool = False,
+        prefilter: bool = False,
+        prefer_alternate: bool = False,
+        budget: Union[Budget, None] = None,
+    ) -> None:
+        """
+        Params are the same as for Articulo.
+        :session (optional): requests.Session shared by all the threads.
+            If it is not provided, every thread creates its own session on the first request.
+        """
+        if strategy not in content_strategies:
+            raise ValueError(
+                f"Unknown strategy {strategy}. Possible values are: {content_strategies}"
+            )
+
+        self.threshold = threshold
+        self.verbose = verbose
+        self.http_headers = http_headers
+        self.def_charset = def_charset
+        self.strategy = strategy
+        self.template_cache = template_cache
+        self.sanitizer_policy = sanitizer_policy or default_policy
+        self.head_only = head_only
+        self.head_max_bytes = head_max_bytes
+        self.prefer_json_ld = prefer_json_ld
+        self.prefilter = prefilter
+        self.prefer_alternate = prefer_alternate
+        self.budget = budget
+        self.metrics = Metrics()
+        self.__session = session
+        self.__local = local()
+
+    @property
+    def session(self):
+        """
+        HTTP session shared by all the articles of the current thread.
+        requests.Session is not thread-safe, so sessions are not shared between threads
+        unless the session is provided explicitly.
+        """
+        if self.__session is not None:
+            return self.__session
+
+        session = getattr(self.__local, "session", None)
+        if session is None:
+            # pylint: disable-next=import-outside-toplevel
+            import requests
+
+            session = self.__local.session = requests.Session()
+        return session
+
+    def __call__(self, link_or_content: str) -> Articulo:
+        """
+        Creates an article with the extractor configuration.
+        Article is lazy, so nothing is loaded or parsed until its properties are requested.
+        """
+        self.metrics.incr("articles")
+        return Articulo(
+            link_or_content,
+            threshold=self.threshold,
+            verbose=self.verbose,
+            http_headers=self.http_headers,
+            def_charset=self.def_charset,
+            strategy=self.strategy,
+            template_cache=self.template_cache,
+            sanitizer_policy=self.sanitizer_policy,
+            session=self.__session_for(link_or_content),
+            metrics=self.metrics,
+            head_only=self.head_only,
+            head_max_bytes=self.head_max_bytes,
+            prefer_json_ld=self.prefer_json_ld,
+            prefilter=self.prefilter,
+            prefer_alternate=self.prefer_alternate,
+            budget=self.budget,
+        )
+
+    async def extract_async(self, link_or_content: str) -> Articulo:
+        """
+        Creates an article and runs its extraction in a worker thread,
+        so the event loop is not blocked by loading and parsing.
+        Properties of the returned article are ready to be read.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import asyncio
+
+        article = self(link_or_content)
+        await asyncio.to_thread(self.__prepare, article)
+        return article
+
+    @staticmethod
+    def __prepare(article: Articulo) -> None:
+        # Reading the title and the text runs the whole extraction
+        article.title  # pylint: disable=pointless-statement
+        article.text  # pylint: disable=pointless-statement
+
+    def __session_for(self, link_or_content: str):
+        """
+        Returns the session only for the links, so the content
+        processing does not import the HTTP client.
+        """
+        if not is_url(link_or_content):
+            return None
+        return self.session
@@ -0,0 +1,270 @@
+"""
+This file contains the feed-driven extraction.
+RSS and Atom feeds are parsed incrementally and every new feed item
+is extracted concurrently with the shared extractor.
+"""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from io import BytesIO
+from typing import IO, Iterable, Iterator, NamedTuple, Union
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from .articulo import Articulo
+from .canonical import CanonicalMemo
+from .exceptions import ArticuloException, HTTPErrorException
+from .extractor import Extractor
+from .http import wrap_transport_errors
+from .utils import is_url
+
+FeedSource = Union[str, bytes, IO[bytes]]
+
+
+class FeedItem(NamedTuple):
+    """
+    Single item of RSS or Atom feed.
+    """
+
+    link: Union[str, None]
+    guid: Union[str, None]
+    title: Union[str, None]
+    published: Union[str, None]
+    summary: Union[str, None]
+
+
+class FeedResult(NamedTuple):
+    """
+    Result of the feed item extraction.
+    Article is None if its extraction failed with an error.
+    """
+
+    item: FeedItem
+    article: Union[Articulo, None]
+    error: Union[Exception, None]
+
+
+def get_local_name(element) -> str:
+    """
+    Returns element tag name without namespace.
+    """
+    return etree.QName(element).localname
+
+
+def get_child_text(element, name: str) -> Union[str, None]:
+    """
+    Returns stripped text of the first child with the name.
+    """
+    for child in element:
+        if isinstance(child.tag, str) and get_local_name(child) == name:
+            return (child.text or "").strip() or None
+    return None
+
+
+def get_atom_link(entry) -> Union[str, None]:
+    """
+    Returns link to the Atom entry page.
+    """
+    for child in entry:
+        if not isinstance(child.tag, str) or get_local_name(child) != "link":
+            continue
+        if child.get("rel", "alternate") == "alternate" and child.get("href"):
+            return child.get("href")
+    return None
+
+
+def parse_item(element, base_url: Union[str, None]) -> FeedItem:
+    """
+    Creates feed item from RSS item or Atom entry element.
+    """
+    if get_local_name(element) == "entry":
+        link = get_atom_link(element)
+        guid = get_child_text(element, "id")
+        published = get_child_text(element, "published") or get_child_text(
+            element, "updated"
+        )
+        summary = get_child_text(element, "summary") or get_child_text(
+            element, "content"
+        )
+    else:
+        link = get_child_text(element, "link")
+        guid = get_child_text(element, "guid")
+        published = get_child_text(element, "pubDate") or get_child_text(
+            element, "date"
+        )
+        summary = get_child_text(element, "description")
+
+    if link is not None and base_url is not None:
+        link = urljoin(base_url, link)
+
+    return FeedItem(
+        link=link,
+        guid=guid or link,
+        title=get_child_text(element, "title"),
+        published=published,
+        summary=summary,
+    )
+
+
+def iter_feed_items(
+    source: FeedSource, base_url: Union[str, None] = None
+) -> Iterator[FeedItem]:
+    """
+    Parses RSS or Atom feed incrementally and yields its items.
+    Processed items are removed from the tree, so memory usage does not
+    grow with the feed size.
+
+    Params:
+    :source: Feed content as bytes, path to the feed file or binary stream.
+    :base_url (optional): Feed url used to make relative item links absolute.
+    """
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+
+    for _, element in etree.iterparse(
+        source, events=("end",), recover=True, resolve_entities=False
+    ):
+        if not isinstance(element.tag, str):
+            continue
+        if get_local_name(element) not in ("item", "entry"):
+            continue
+
+        yield parse_item(element, base_url)
+
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+class FeedReader:
+    """
+    Reads feeds and extracts their articles.
+    Remembers GUIDs of the processed items, so every item is extracted only once.
+    With the canonical memo, items linking to already processed articles are skipped too.
+    """
+
+    def __init__(
+        self,
+        extractor: Union[Extractor, None] = None,
+        seen_guids: Union[Iterable[str], None] = None,
+        max_workers: int = 8,
+        canonical_memo: Union[CanonicalMemo, None] = None,
+    ) -> None:
+        """
+        Params:
+        :extractor (optional): Extractor used to load and parse articles.
+        :seen_guids (optional): GUIDs of the items that are already processed.
+        :max_workers (optional): Max number of articles extracted at the same time.
+        :canonical_memo (optional): Memo of the links of the processed articles.
+        """
+        self.extractor = extractor or Extractor()
+        self.seen_guids = set(seen_guids or [])
+        self.max_workers = max_workers
+        self.canonical_memo = canonical_memo
+
+    def discover(self, link_or_content: str) -> list[str]:
+        """
+        Returns links to the feeds of the page.
+        """
+        return self.extractor(link_or_content).rss
+
+    def items(self, source: FeedSource, base_url: Union[str, None] = None):
+        """
+        Yields feed items that were not seen before.
+        Yielded items are remembered as seen.
+        If source is a link, the feed is loaded and parsed while it is downloaded.
+        Raises TransportException if the connection to the feed fails.
+        """
+        for item in self.__iter_new_items(source, base_url):
+            self.seen_guids.add(item.guid)
+            yield item
+
+    def extract(
+        self, source: FeedSource, base_url: Union[str, None] = None
+    ) -> Iterator[FeedResult]:
+        """
+        Extracts articles of all the new feed items concurrently.
+        Items are submitted for extraction as soon as they are parsed,
+        results are yielded in the order of completion.
+        Items are remembered as seen only when their articles are extracted,
+        so the failed ones are tried again on the next read of the feed.
+        """
+        submitted: set[str] = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: set[Future] = set()
+            for item in self.__iter_new_items(source, base_url):
+                if item.guid in submitted:
+                    continue
+                submitted.add(item.guid)
+                if item.link is None or self.__is_processed(item.link):
+                    self.seen_guids.add(item.guid)
+                    continue
+                pending.add(executor.submit(self.__extract_item, item))
+                if len(pending) >= self.max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield self.__complete(future.result())
+
+            for future in as_completed(pending):
+                yield self.__complete(future.result())
+
+    def extract_site(self, link_or_content: str) -> Iterator[FeedResult]:
+        """
+        Discovers feeds of the page and extracts articles of all of them.
+        """
+        for feed_url in self.discover(link_or_content):
+            yield from self.extract(feed_url)
+
+    def __iter_new_items(
+        self, source: FeedSource, base_url: Union[str, None]
+    ) -> Iterator[FeedItem]:
+        if isinstance(source, str) and is_url(source):
+            yield from self.__iter_remote_items(source)
+            return
+
+        for item in iter_feed_items(source, base_url):
+            if item.guid is None or item.guid in self.seen_guids:
+                continue
+            yield item
+
+    def __iter_remote_items(self, feed_url: str) -> Iterator[FeedItem]:
+        session = self.extractor.session
+        # Feed is parsed while it is downloaded, so the body can fail while it is read too
+        with wrap_transport_errors(feed_url), session.get(
+            feed_url, timeout=2000, headers=self.extractor.http_headers, stream=True
+        ) as response:
+            if not response.ok:
+                raise HTTPErrorException(
+                    f"Http error: {response.reason}", response.status_code
+                )
+            response.raw.decode_content = True
+            yield from self.__iter_new_items(response.raw, feed_url)
+
+    def __extract_item(self, item: FeedItem) -> FeedResult:
+        article = self.extractor(item.link)
+        try:
+            # Reading the text runs the whole extraction in the worker thread
+            article.text  # pylint: disable=pointless-statement
+            if self.canonical_memo is not None:
+                self.canonical_memo.add_article(item.link, article)
+        # Connection errors are raised as TransportException too
+        except ArticuloException as exc:
+            return FeedResult(item, None, exc)
+        return FeedResult(item, article, None)
+
+    def __complete(self, result: FeedResult) -> FeedResult:
+        if result.error is None:
+            self.seen_guids.add(result.item.guid)
+        return result
+
+    def __is_processed(self, link: str) -> bool:
+        return (
+            self.canonical_memo is not None
+            and self.canonical_memo.find(link) is not None
+        )
@@ -0,0 +1,178 @@
+"""
+This file contains the fingerprints of the extracted article text
+and the index used to detect near-duplicate articles.
+Fingerprint consists of an exact hash of the normalized text
+and a 64-bit SimHash of the word shingles.
+"""
+
+import hashlib
+from collections import deque
+from threading import Lock
+from typing import Hashable, NamedTuple, Union
+
+simhash_bits = 64
+shingle_size = 3
+
+
+def hash_shingle(shingle: str) -> int:
+    """
+    Returns stable 64-bit hash of the shingle.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(shingle.encode("utf8"), digest_size=8).digest(), "big"
+    )
+
+
+def hamming_distance(first: int, second: int) -> int:
+    """
+    Returns number of different bits of two hashes.
+    """
+    return (first ^ second).bit_count()
+
+
+class Fingerprint(NamedTuple):
+    """
+    Fingerprint of the article text.
+    """
+
+    exact: str
+    simhash: int
+    tokens: int
+
+    def distance(self, other: "Fingerprint") -> int:
+        """
+        Returns SimHash distance to the other fingerprint.
+        """
+        return hamming_distance(self.simhash, other.simhash)
+
+
+class FingerprintBuilder:
+    """
+    Builds fingerprint from the stream of normalized words.
+    Bits of the shingle hashes are counted with bit-sliced counters,
+    so adding a shingle takes a few integer operations instead of 64.
+    """
+
+    def __init__(self) -> None:
+        self.__exact = hashlib.sha1()
+        self.__window: deque[str] = deque(maxlen=shingle_size)
+        self.__planes: list[int] = []
+        self.__shingles = 0
+        self.__tokens = 0
+
+    def update(self, token: str) -> None:
+        """
+        Adds the next word of the text.
+        """
+        self.__exact.update(token.encode("utf8") + b" ")
+        self.__tokens += 1
+        self.__window.append(token)
+        if len(self.__window) == shingle_size:
+            self.__add_hash(hash_shingle(" ".join(self.__window)))
+
+    def build(self) -> Fingerprint:
+        """
+        Returns fingerprint of all the words added.
+        """
+        if 0 < self.__tokens < shingle_size:
+            # Text is too short for a single shingle, so it is used as a whole
+            self.__add_hash(hash_shingle(" ".join(self.__window)))
+
+        simhash = 0
+        for bit in range(simhash_bits):
+            count = 0
+            for plane_index, plane in enumerate(self.__planes):
+                count |= ((plane >> bit) & 1) << plane_index
+            if count * 2 > self.__shingles:
+                simhash |= 1 << bit
+
+        return Fingerprint(self.__exact.hexdigest(), simhash, self.__tokens)
+
+    def __add_hash(self, value: int) -> None:
+        # Bit-sliced increment: every plane holds one bit of the 64 counters
+        self.__shingles += 1
+        carry = value
+        for index, plane in enumerate(self.__planes):
+            self.__planes[index] = plane ^ carry
+            carry &= plane
+            if not carry:
+                return
+        if carry:
+            self.__planes.append(carry)
+
+
+class DuplicateIndex:
+    """
+    In-memory index of fingerprints answering if a near-duplicate was seen.
+    SimHash is split into bands, so any fingerprint within the max distance
+    shares at least one band with the stored one and only a few candidates are compared.
+    Index is safe to share between threads.
+    """
+
+    def __init__(self, max_distance: int = 3) -> None:
+        """
+        Params:
+        :max_distance (optional): Max SimHash distance of near-duplicates. Default is 3.
+        """
+        if not 0 <= max_distance < simhash_bits:
+            raise ValueError(f"Max distance should be between 0 and {simhash_bits - 1}")
+
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        self.__band_width = simhash_bits // bands
+        self.__band_shifts = [band * self.__band_width for band in range(bands)]
+        self.__band_mask = (1 << self.__band_width) - 1
+        self.__exact: dict[str, Hashable] = {}
+        self.__bands: list[dict[int, list[tuple[int, Hashable]]]] = [
+            {} for _ in range(bands)
+        ]
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__exact)
+
+    def add(self, fingerprint: Fingerprint, key: Hashable) -> None:
+        """
+        Adds fingerprint of the article with the key, e.g. article url.
+        """
+        with self.__lock:
+            self.__add(fingerprint, key)
+
+    def find(self, fingerprint: Fingerprint) -> Union[Hashable, None]:
+        """
+        Returns key of the same or a near-duplicate article or None.
+        """
+        with self.__lock:
+            return self.__find(fingerprint)
+
+    def seen(self, fingerprint: Fingerprint, key: Hashable) -> Union[Hashable, None]:
+        """
+        Returns key of the near-duplicate if it was seen before.
+        Otherwise adds the fingerprint and returns None.
+        """
+        # Lookup and insertion are done at once, so concurrent duplicates are noticed
+        with self.__lock:
+            duplicate_key = self.__find(fingerprint)
+            if duplicate_key is None:
+                self.__add(fingerprint, key)
+            return duplicate_key
+
+    def __add(self, fingerprint: Fingerprint, key: Hashable) -> None:
+        if fingerprint.exact in self.__exact:
+            return
+        self.__exact[fingerprint.exact] = key
+        for band, shift in zip(self.__bands, self.__band_shifts):
+            band_value = (fingerprint.simhash >> shift) & self.__band_mask
+            band.setdefault(band_value, []).append((fingerprint.simhash, key))
+
+    def __find(self, fingerprint: Fingerprint) -> Union[Hashable, None]:
+        key = self.__exact.get(fingerprint.exact)
+        if key is not None:
+            return key
+
+        for band, shift in zip(self.__bands, self.__band_shifts):
+            band_value = (fingerprint.simhash >> shift) & self.__band_mask
+            for simhash, candidate_key in band.get(band_value, []):
+                if hamming_distance(simhash, fingerprint.simhash) <= self.max_distance:
+                    return candidate_key
+        return None
@@ -0,0 +1,230 @@
+"""
+This file contains the collector of the document metadata.
+All the meta and link elements are collected in a single pass
+over the parsed document, so every metadata property
+reads from the same index instead of scanning the document again.
+"""
+
+import re
+from typing import Callable, NamedTuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+icon_size_re = re.compile(r"(\d+)[xX](\d+)")
+
+# Meta attributes the meta elements are indexed by
+meta_keys = ("name", "property", "http-equiv", "itemprop")
+
+# Icon kinds by rank, the lower is the better
+icon_kinds = {"icon": 0, "shortcut icon": 0, "apple-touch-icon": 1, "mask-icon": 2}
+
+# Preview kinds by rank, the lower is the better
+preview_kinds = {"og:image": 0, "twitter:image": 1}
+
+
+class MediaCandidate(NamedTuple):
+    """
+    Icon or preview image found in the document metadata.
+    Width and height are None if they are not declared.
+    """
+
+    url: str
+    kind: str
+    width: Union[int, None] = None
+    height: Union[int, None] = None
+    any_size: bool = False
+
+    @property
+    def area(self) -> int:
+        """
+        Declared area of the image or 0 if the size is unknown.
+        """
+        return (self.width or 0) * (self.height or 0)
+
+
+def parse_sizes(
+    sizes: Union[str, None],
+) -> tuple[Union[int, None], Union[int, None], bool]:
+    """
+    Parses sizes attribute of an icon link.
+    Returns the biggest declared width and height and whether the icon is scalable.
+    """
+    width, height, any_size = None, None, False
+    for size in (sizes or "").split():
+        if size.lower() == "any":
+            any_size = True
+            continue
+        match = icon_size_re.fullmatch(size)
+        if match is None:
+            continue
+        size_width, size_height = int(match.group(1)), int(match.group(2))
+        if width is None or size_width * size_height > width * height:
+            width, height = size_width, size_height
+    return width, height, any_size
+
+
+def get_icon_kind(link: Tag) -> Union[str, None]:
+    """
+    Returns icon kind by the rel attribute of the link or None if link is not an icon.
+    """
+    rel = [value.lower() for value in link.get("rel", [])]
+    if "apple-touch-icon" in rel or "apple-touch-icon-precomposed" in rel:
+        return "apple-touch-icon"
+    if "mask-icon" in rel:
+        return "mask-icon"
+    if "icon" in rel:
+        return "shortcut icon" if "shortcut" in rel else "icon"
+    return None
+
+
+def parse_dimension(value: Union[str, None]) -> Union[int, None]:
+    """
+    Parses image dimension from meta content.
+    """
+    if value is None or not value.strip().isdigit():
+        return None
+    return int(value.strip())
+
+
+class DocumentHead:
+    """
+    Metadata of the document: meta elements, links, icons and preview images.
+    """
+
+    def __init__(self, soup: BeautifulSoup, resolve: Callable[[str], str]) -> None:
+        """
+        Params:
+        :soup: Parsed document.
+        :resolve: Function making absolute links from relative ones.
+        """
+        self.links: list[Tag] = []
+        self.__resolve = resolve
+        self.__meta: dict[tuple[str, str], Tag] = {}
+        icons: list[MediaCandidate] = []
+        previews: list[MediaCandidate] = []
+
+        for element in soup.find_all(["meta", "link"]):
+            if element.name == "link":
+                self.links.append(element)
+                icon = self.__get_icon(element, resolve)
+                if icon is not None:
+                    icons.append(icon)
+                continue
+
+            for key in meta_keys:
+                value = element.get(key)
+                if value is not None and (key, value) not in self.__meta:
+                    self.__meta[(key, value)] = element
+
+            previews = self.__add_preview(element, previews, resolve)
+
+        # Sorting is stable, so candidates of the same rank keep the document order.
+        # Mask icons are monochrome silhouettes, so they go after all the others.
+        self.icons = sorted(
+            icons,
+            key=lambda icon: (
+                icon.kind == "mask-icon",
+                not icon.any_size,
+                -icon.area,
+                icon_kinds[icon.kind],
+            ),
+        )
+        self.previews = sorted(
+            previews, key=lambda preview: (preview_kinds[preview.kind], -preview.area)
+        )
+
+    def find_meta(
+        self, attr_keys: list[str], attr_values: list[str]
+    ) -> Union[Tag, None]:
+        """
+        Returns the first meta element matching any of the attributes.
+        Attributes are checked in the order they are provided.
+        """
+        for key in attr_keys:
+            for value in attr_values:
+                meta = self.__meta.get((key, value))
+                if meta is not None:
+                    return meta
+        return None
+
+    def find_links(self, link_type: str) -> list[Tag]:
+        """
+        Returns all the links with the type.
+        """
+        return [link for link in self.links if link.get("type") == link_type]
+
+    def find_canonical(self) -> Union[str, None]:
+        """
+        Returns absolute canonical link of the page:
+        link with rel=canonical or, if there is none, og:url.
+        """
+        for link in self.links:
+            href = link.get("href")
+            if href and "canonical" in [value.lower() for value in link.get("rel", [])]:
+                return self.__resolve(href)
+
+        meta = self.find_meta(["property", "name"], ["og:url"])
+        content = meta.get("content") if meta is not None else None
+        return self.__resolve(content) if content else None
+
+    def find_light_alternate(self) -> Union[str, None]:
+        """
+        Returns absolute link to the lightweight version of the page:
+        AMP version or, if there is no AMP version, print version.
+        """
+        print_version = None
+        for link in self.links:
+            href = link.get("href")
+            if not href:
+                continue
+            rel = [value.lower() for value in link.get("rel", [])]
+            if "amphtml" in rel:
+                return self.__resolve(href)
+            if (
+                print_version is None
+                and "alternate" in rel
+                and "print" in link.get("media", "").lower()
+            ):
+                print_version = self.__resolve(href)
+        return print_version
+
+    @staticmethod
+    def __get_icon(
+        link: Tag, resolve: Callable[[str], str]
+    ) -> Union[MediaCandidate, None]:
+        kind = get_icon_kind(link)
+        href = link.get("href")
+        if kind is None or not href:
+            return None
+        width, height, any_size = parse_sizes(link.get("sizes"))
+        return MediaCandidate(resolve(href), kind, width, height, any_size)
+
+    @staticmethod
+    def __add_preview(
+        meta: Tag, previews: list[MediaCandidate], resolve: Callable[[str], str]
+    ) -> list[MediaCandidate]:
+        name = meta.get("property") or meta.get("name")
+        content = meta.get("content")
+        if name is None or not content:
+            return previews
+
+        if name in ("og:image", "og:image:url"):
+            previews.append(MediaCandidate(resolve(content), "og:image"))
+        elif name in ("twitter:image", "twitter:image:src"):
+            previews.append(MediaCandidate(resolve(content), "twitter:image"))
+        elif name in ("og:image:width", "og:image:height"):
+            # Structured properties describe the last declared image
+            last_og_image = next(
+                (
+                    index
+                    for index in range(len(previews) - 1, -1, -1)
+                    if previews[index].kind == "og:image"
+                ),
+                None,
+            )
+            if last_og_image is not None:
+                field = "width" if name == "og:image:width" else "height"
+                previews[last_og_image] = previews[last_og_image]._replace(
+                    **{field: parse_dimension(content)}
+                )
+        return previews
@@ -0,0 +1,296 @@
+"""
+This file contains the loading of the article html over HTTP.
+Response is read as a stream: it is decompressed and decoded chunk by chunk,
+so neither the compressed nor the decompressed body is buffered as a whole
+and oversized or suspiciously compressed responses are dropped early.
+Besides loading the whole page, only the head of the page can be loaded:
+the connection is closed as soon as the head is received or the byte budget is exhausted.
+"""
+
+import codecs
+import re
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+from .budget import BudgetMeter
+from .constants import (
+    compression_ratio_floor,
+    max_compression_ratio,
+    max_response_bytes,
+)
+from .exceptions import (
+    DecodingException,
+    HTTPErrorException,
+    ResponseTooLargeException,
+    TransportException,
+)
+
+head_end_marker = "</head"
+head_end_re = re.compile(head_end_marker, re.IGNORECASE)
+
+# Size of the decompressed chunks read from the response
+response_chunk_size = 64 * 1024
+
+# Size of the response chunks read while looking for the end of the head
+head_chunk_size = 8192
+
+
+def get_client(session=None):
+    """
+    Returns the session or the requests module if there is no session.
+    HTTP client is imported only when it is needed.
+    """
+    if session is not None:
+        return session
+    # pylint: disable-next=import-outside-toplevel
+    import requests
+
+    return requests
+
+
+def get_transport_errors() -> tuple[type[Exception], ...]:
+    """
+    Returns exceptions the HTTP client raises when the connection fails.
+    Errors of the streamed body are raised by urllib3 itself.
+    """
+    # pylint: disable=import-outside-toplevel
+    import requests
+    import urllib3
+
+    return (requests.RequestException, urllib3.exceptions.HTTPError)
+
+
+@contextmanager
+def wrap_transport_errors(url: str) -> Iterator[None]:
+    """
+    Raises TransportException instead of the connection errors of the HTTP client,
+    so the callers handle them with the other article errors.
+    """
+    try:
+        yield
+    # Clause is evaluated only when an exception is raised
+    except get_transport_errors() as exc:
+        raise TransportException(url, str(exc) or type(exc).__name__) from exc
+
+
+def get_accept_encoding() -> str:
+    """
+    Returns content codings the HTTP client can decompress.
+    Brotli and Zstandard are advertised only if their packages are installed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    return ACCEPT_ENCODING
+
+
+def get_request_headers(headers: Union[dict, None]) -> dict:
+    """
+    Returns request headers with the supported content codings.
+    Accept-Encoding provided by the user is kept.
+    """
+    if headers and any(key.lower() == "accept-encoding" for key in headers):
+        return dict(headers)
+    return {"Accept-Encoding": get_accept_encoding(), **(headers or {})}
+
+
+def check_response(response) -> None:
+    """
+    Raises HTTPErrorException if the response is not successful.
+    """
+    if not response.ok:
+        raise HTTPErrorException(f"Http error: {response.reason}", response.status_code)
+
+
+def record_redirects(response, redirects: Union[list[str], None]) -> None:
+    """
+    Appends urls of the redirect chain ending with the final url to the list.
+    """
+    if redirects is not None:
+        redirects.extend(previous.url for previous in response.history)
+        redirects.append(response.url)
+
+
+def iter_body(
+    response,
+    url: str,
+    chunk_size: int = response_chunk_size,
+    max_bytes: int = max_response_bytes,
+    max_ratio: float = max_compression_ratio,
+    *,
+    meter: Union[BudgetMeter, None] = None,
+) -> Iterator[bytes]:
+    """
+    Yields decompressed chunks of the streamed response body.
+    Raises ResponseTooLargeException as soon as the decompressed body
+    exceeds max bytes or the compression ratio exceeds max ratio.
+    If the budget meter is provided, every chunk is charged to it.
+    """
+    received = 0
+    for chunk in response.raw.stream(chunk_size, decode_content=True):
+        received += len(chunk)
+        if received > max_bytes:
+            raise ResponseTooLargeException(url, f"body exceeds {max_bytes} bytes")
+
+        # Bytes read from the connection, i.e. before decompression
+        transferred = response.raw.tell()
+        if (
+            received > compression_ratio_floor
+            and transferred > 0
+            and received / transferred > max_ratio
+        ):
+            raise ResponseTooLargeException(
+                url, f"compression ratio exceeds {max_ratio}"
+            )
+        if meter is not None:
+            meter.charge("bytes", len(chunk))
+            meter.check_deadline()
+        yield chunk
+
+
+def decode_chunks(
+    chunks: Iterator[bytes], url: str, charset: str, final: bool = True
+) -> Iterator[str]:
+    """
+    Decodes the chunks incrementally.
+    Bytes of a character split between the chunks are decoded with the next chunk.
+    If the chunks are not final, bytes of the last incomplete character are dropped.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(charset)()
+    except LookupError as exc:
+        raise DecodingException(url, charset) from exc
+
+    try:
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        if final:
+            yield decoder.decode(b"", final=True)
+    except ValueError as exc:
+        raise DecodingException(url, charset) from exc
+
+
+def fetch_html(
+    url: str,
+    headers: Union[dict, None],
+    charset: str,
+    session=None,
+    *,
+    redirects: Union[list[str], None] = None,
+    meter: Union[BudgetMeter, None] = None,
+) -> str:
+    """
+    Loads the whole page and decodes it with the charset.
+    If the redirects list is provided, the redirect chain is appended to it.
+    Received bytes are charged to the budget meter if it is provided.
+    Raises TransportException if the connection fails.
+    """
+    with wrap_transport_errors(url), get_client(session).get(
+        url, timeout=2000, headers=get_request_headers(headers), stream=True
+    ) as response:
+        check_response(response)
+        record_redirects(response, redirects)
+        chunks = iter_body(response, url, meter=meter)
+        return "".join(decode_chunks(chunks, url, charset))
+
+
+def fetch_body(
+    url: str,
+    headers: Union[dict, None],
+    session=None,
+    *,
+    redirects: Union[list[str], None] = None,
+    meter: Union[BudgetMeter, None] = None,
+) -> Iterator[bytes]:
+    """
+    Loads the whole page without decoding it.
+    Yields decompressed chunks of the body as they are received, so they can be
+    written to their destination without holding the whole body in memory.
+    Page is requested when the first chunk is requested.
+    If the redirects list is provided, the redirect chain is appended to it.
+    Raises TransportException if the connection fails.
+    """
+    with wrap_transport_errors(url), get_client(session).get(
+        url, timeout=2000, headers=get_request_headers(headers), stream=True
+    ) as response:
+        check_response(response)
+        record_redirects(response, redirects)
+        yield from iter_body(response, url, meter=meter)
+
+
+def fetch_head(
+    url: str,
+    headers: Union[dict, None],
+    charset: str,
+    max_bytes: int,
+    session=None,
+    *,
+    redirects: Union[list[str], None] = None,
+    meter: Union[BudgetMeter, None] = None,
+) -> str:
+    """
+    Loads the page until the end of its head or until max bytes are received.
+    Range request is tried first, so the servers supporting it
+    do not send anything beyond the budget.
+    If the redirects list is provided, the redirect chain is appended to it.
+    Received bytes are charged to the budget meter if it is provided.
+    Returns the received prefix of the page.
+    Raises TransportException if the connection fails.
+    """
+    client = get_client(session)
+    headers = get_request_headers(headers)
+    range_headers = {**headers, "Range": f"bytes=0-{max_bytes - 1}"}
+
+    with wrap_transport_errors(url):
+        with client.get(
+            url, timeout=2000, headers=range_headers, stream=True
+        ) as response:
+            # Range is not satisfiable for empty pages, the plain request tells the truth
+            if response.status_code != 416:
+                check_response(response)
+                record_redirects(response, redirects)
+                return read_head(response, url, charset, max_bytes, meter)
+
+        with client.get(url, timeout=2000, headers=headers, stream=True) as response:
+            check_response(response)
+            record_redirects(response, redirects)
+            return read_head(response, url, charset, max_bytes, meter)
+
+
+def limit_chunks(chunks: Iterator[bytes], max_bytes: int) -> Iterator[bytes]:
+    """
+    Yields the chunks until max bytes are yielded.
+    """
+    received = 0
+    for chunk in chunks:
+        chunk = chunk[: max_bytes - received]
+        received += len(chunk)
+        yield chunk
+        if received >= max_bytes:
+            return
+
+
+def read_head(
+    response,
+    url: str,
+    charset: str,
+    max_bytes: int,
+    meter: Union[BudgetMeter, None] = None,
+) -> str:
+    """
+    Reads and decodes the streamed response until the end of the head
+    or until max bytes are read.
+    Bytes of a character split by the budget are dropped.
+    """
+    chunks = limit_chunks(
+        iter_body(response, url, head_chunk_size, meter=meter), max_bytes
+    )
+    html = ""
+    for text in decode_chunks(chunks, url, charset, final=False):
+        # Marker may be split between chunks, so the search starts a bit earlier
+        search_from = max(0, len(html) - len(head_end_marker))
+        html += text
+        head_end = head_end_re.search(html, search_from)
+        if head_end is not None:
+            return html[: head_end.start()]
+    return html
@@ -0,0 +1,126 @@
+"""
+This file contains the language detection of the article text.
+Language is guessed from the words of the content while its text is built:
+the dominant script of the words narrows the candidates and
+the most frequent stop words and distinctive letters pick the language.
+"""
+
+from typing import Union
+
+# Languages by the script of their words
+script_languages = {
+    "latin": ("en", "de", "fr", "es", "it", "pt", "nl"),
+    "cyrillic": ("ru", "uk"),
+}
+
+# Language of the script, when there are no hints in the text
+script_default_languages = {"cyrillic": "ru"}
+
+language_stop_words = {
+    "en": "the and of to is in that it was for with as on are this be by from have not",
+    "de": "der die und das ist nicht ein eine mit sich auf dem den des zu auch von",
+    "fr": "le la les et est des une dans que pour pas sur qui au du avec sont il",
+    "es": "el la los las y es en que por para una con del se no al como su",
+    "it": "il di che la le è e non per una sono gli del della con ma come",
+    "pt": "o a os as e é de que não para uma com do da em um se por",
+    "nl": "de het een en van is dat niet op te zijn met voor die er ook",
+    "ru": "и в не на что он с как это по но из к у за от же все так его для",
+    "uk": "і в не на що він з як це до та але від за же все так його для є",
+}
+
+# Letters used only by some languages of the script
+language_letters = {
+    "de": "äöüß",
+    "fr": "çèêëîïôœùû",
+    "es": "ñ",
+    "pt": "ãõ",
+    "ru": "ыэъё",
+    "uk": "іїєґ",
+}
+
+
+def index_stop_words(stop_words: dict[str, str]) -> dict[str, tuple[str, ...]]:
+    """
+    Returns languages of every stop word.
+    """
+    index: dict[str, tuple[str, ...]] = {}
+    for language, words in stop_words.items():
+        for word in words.split():
+            index[word] = (*index.get(word, ()), language)
+    return index
+
+
+stop_words_index = index_stop_words(language_stop_words)
+
+letters_index = {
+    letter: language
+    for language, letters in language_letters.items()
+    for letter in letters
+}
+
+
+def get_script(word: str) -> Union[str, None]:
+    """
+    Returns script of the word by its first letter.
+    """
+    letter = word[0]
+    if "\u0400" <= letter <= "\u04ff":
+        return "cyrillic"
+    if letter < "\u0250" and letter.isalpha():
+        return "latin"
+    return None
+
+
+def normalize_language(value: Union[str, None]) -> Union[str, None]:
+    """
+    Returns primary language subtag of the language tag or locale,
+    e.g. en for en-US or ru for ru_RU.
+    """
+    if not value:
+        return None
+    language = value.strip().replace("_", "-").split("-")[0].lower()
+    return language or None
+
+
+class LanguageDetector:
+    """
+    Collects language hints from the lowercased words of the text.
+    """
+
+    def __init__(self) -> None:
+        self.__scripts: dict[str, int] = {}
+        self.__scores: dict[str, int] = {}
+
+    def update(self, word: str) -> None:
+        """
+        Adds the next lowercased word of the text.
+        """
+        script = get_script(word)
+        if script is None:
+            return
+        self.__scripts[script] = self.__scripts.get(script, 0) + 1
+
+        for language in stop_words_index.get(word, ()):
+            self.__scores[language] = self.__scores.get(language, 0) + 1
+
+        if not word.isascii():
+            for language in {letters_index.get(letter) for letter in word}:
+                if language is not None:
+                    self.__scores[language] = self.__scores.get(language, 0) + 1
+
+    def detect(self) -> Union[str, None]:
+        """
+        Returns the most probable language of the text or None if it is unknown.
+        """
+        if not self.__scripts:
+            return None
+
+        script = max(self.__scripts, key=self.__scripts.__getitem__)
+        # The first language of the script wins the tie
+        language = max(
+            script_languages[script],
+            key=lambda language: self.__scores.get(language, 0),
+        )
+        if self.__scores.get(language, 0) == 0:
+            return script_default_languages.get(script)
+        return language
@@ -0,0 +1,57 @@
+"""
+This file contains the thread-safe caching of the computed properties.
+functools.cached_property does not lock since python 3.12 and locks
+all the instances of the class at once before it, so parallel
+readers of the same article either repeat the expensive parsing
+or wait for the parsing of other articles.
+"""
+
+from functools import cached_property
+from threading import RLock
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+
+# Instance attribute holding the locks of the instance properties
+locks_attr = "__property_locks__"
+
+
+# pylint: disable-next=invalid-name,too-few-public-methods
+class locked_cached_property(cached_property[T]):
+    """
+    Caches the property value in the instance like functools.cached_property.
+    The value is computed at most once: concurrent readers of the same
+    instance property wait for the first one, while other properties
+    and other instances are not blocked.
+    Only the locking differs from the base class, so linters and type checkers
+    see the value returned by the decorated function.
+    """
+
+    @overload
+    def __get__(
+        self, instance: None, owner: Any = None
+    ) -> "locked_cached_property[T]": ...
+
+    @overload
+    def __get__(self, instance: object, owner: Any = None) -> T: ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        cache = instance.__dict__
+        try:
+            return cache[self.attrname]
+        except KeyError:
+            pass
+
+        # dict.setdefault is atomic, so every property gets a single lock
+        locks = cache.get(locks_attr) or cache.setdefault(locks_attr, {})
+        lock = locks.get(self.attrname) or locks.setdefault(self.attrname, RLock())
+        with lock:
+            try:
+                return cache[self.attrname]
+            except KeyError:
+                value = self.func(instance)
+                cache[self.attrname] = value
+                return value
@@ -0,0 +1,59 @@
+"""
+This file contains the metrics collected while articles are processed.
+"""
+
+import time
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator
+
+
+class Metrics:
+    """
+    Counters and total durations of the article processing stages.
+    Metrics are safe to update from several threads.
+    """
+
+    def __init__(self) -> None:
+        self.__counters: dict[str, int] = {}
+        self.__timings: dict[str, float] = {}
+        self.__lock = Lock()
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """
+        Increments counter by name.
+        """
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def get(self, name: str) -> int:
+        """
+        Returns counter value by name.
+        """
+        return self.__counters.get(name, 0)
+
+    def add_timing(self, stage: str, seconds: float) -> None:
+        """
+        Adds duration of the stage and counts the stage run.
+        """
+        with self.__lock:
+            self.__timings[stage] = self.__timings.get(stage, 0.0) + seconds
+        self.incr(f"{stage}.count")
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """
+        Measures duration of the code block as a stage.
+        """
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_timing(stage, time.perf_counter() - started_at)
+
+    def as_dict(self) -> dict:
+        """
+        Returns all counters and timings as a dict.
+        """
+        with self.__lock:
+            return {"counters": dict(self.__counters), "timings": dict(self.__timings)}
@@ -0,0 +1,141 @@
+"""
+This file contains the assembling of articles split into several pages.
+Next pages are discovered from the links of the loaded pages and
+all the pages discovered at once are loaded concurrently,
+so the latency grows with the number of discovery steps, not pages.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+from .articulo import Articulo
+from .exceptions import ArticuloException
+from .extractor import Extractor
+from .locking import locked_cached_property
+from .urls import get_page_number
+
+
+class MultiPageArticle:
+    """
+    Article split into several pages.
+    Content of all the pages is joined in the order of the pages.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        extractor: Union[Extractor, None] = None,
+        max_pages: int = 10,
+        max_workers: int = 4,
+    ) -> None:
+        """
+        Params:
+        :url: Link to the first page of the article.
+        :extractor (optional): Extractor used to load and parse the pages.
+        :max_pages (optional): Max number of pages including the first one. Default is 10.
+        :max_workers (optional): Max number of pages loaded at the same time. Default is 4.
+        """
+        self.url = url
+        self.extractor = extractor or Extractor()
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+
+    @property
+    def title(self):
+        """
+        Article title from the first page.
+        """
+        return self.pages[0].title
+
+    @locked_cached_property
+    def markup(self) -> Union[str, None]:
+        """
+        Main content html markup of all the pages.
+        """
+        return self.__join([page.markup for page in self.pages])
+
+    @locked_cached_property
+    def text(self) -> Union[str, None]:
+        """
+        Main content text of all the pages.
+        """
+        return self.__join([page.text for page in self.pages])
+
+    @property
+    def urls(self) -> list[str]:
+        """
+        Links to all the loaded pages in the order of the pages.
+        """
+        return [url for url, _ in self.__loaded_pages]
+
+    @property
+    def pages(self) -> list[Articulo]:
+        """
+        All the loaded pages in the order of the pages.
+        """
+        return [page for _, page in self.__loaded_pages]
+
+    @locked_cached_property
+    def __loaded_pages(self) -> list[tuple[str, Articulo]]:
+        """
+        Loads all the pages of the article.
+        Links are followed only once and pages with the same content
+        as one of the loaded pages are skipped, so cycles are not followed.
+        """
+        first_page = self.extractor(self.url)
+        # Errors of the first page are errors of the whole article
+        self.__prepare(first_page)
+
+        first_number = get_page_number(self.url) or 1
+        seen_urls = {self.url}
+        seen_texts = {self.__get_text_key(first_page)}
+        pages = [(first_number, 0, self.url, first_page)]
+        step = [(first_number, first_page)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while step and len(pages) < self.max_pages:
+                links = []
+                for number, page in step:
+                    for link in page.next_pages:
+                        if link in seen_urls:
+                            continue
+                        seen_urls.add(link)
+                        links.append((get_page_number(link) or number + 1, link))
+                links = links[: self.max_pages - len(pages)]
+
+                loaded = executor.map(self.__load, [link for _, link in links])
+                step = []
+                for (number, link), page in zip(links, loaded):
+                    if page is None or self.__get_text_key(page) in seen_texts:
+                        continue
+                    seen_texts.add(self.__get_text_key(page))
+                    pages.append((number, len(pages), link, page))
+                    step.append((number, page))
+
+        pages.sort(key=lambda page: page[:2])
+        return [(url, page) for _, _, url, page in pages]
+
+    def __load(self, url: str) -> Union[Articulo, None]:
+        page = self.extractor(url)
+        try:
+            self.__prepare(page)
+        # Connection errors are raised as TransportException too
+        except ArticuloException:
+            return None
+        return page
+
+    @staticmethod
+    def __prepare(page: Articulo) -> None:
+        # Reading the content and the links runs the extraction in the worker thread
+        page.markup  # pylint: disable=pointless-statement
+        page.next_pages  # pylint: disable=pointless-statement
+
+    @staticmethod
+    def __get_text_key(page: Articulo):
+        fingerprint = page.fingerprint
+        return fingerprint.exact if fingerprint is not None else None
+
+    @staticmethod
+    def __join(parts: list[Union[str, None]]) -> Union[str, None]:
+        parts = [part for part in parts if part is not None]
+        return "\n".join(parts) if parts else None
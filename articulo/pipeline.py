@@ -0,0 +1,332 @@
+"""
+This file contains the multi-process extraction pipeline.
+Pages are loaded by the threads of the main process and parsed by the worker processes.
+Response bodies are handed over through shared memory: the loading side writes
+the body into a shared block as it is received and only a small descriptor of the block
+is sent to the worker, which decodes the text right from the block.
+So multi-megabyte bodies are neither held in memory twice nor pickled on their way to the parser.
+Block is released as soon as the extraction of its article is finished.
+If a worker dies, only the jobs running at that moment fail and the pool is started again.
+"""
+
+import codecs
+import multiprocessing
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, NamedTuple, Union
+
+from .articulo import Articulo
+from .constants import max_response_bytes, result_fields
+from .exceptions import (
+    DecodingException,
+    NoHTMLException,
+    ResponseTooLargeException,
+)
+from .http import fetch_body
+from .server import get_restart_context
+
+
+class BodyDescriptor(NamedTuple):
+    """
+    Location of the response body in shared memory.
+    """
+
+    url: str
+    redirects: tuple[str, ...]
+    name: str
+    size: int
+    charset: str
+
+
+class PipelineResult(NamedTuple):
+    """
+    Result of the article extraction.
+    Result holds the requested article properties or None if the extraction failed.
+    Error holds type and message of the exception.
+    """
+
+    url: str
+    result: Union[dict, None]
+    error: Union[dict, None]
+
+
+class SharedBody:  # pylint: disable=too-few-public-methods
+    """
+    Response body written into a shared memory block as it is received.
+    Block is created with the max size of the body, but only the written pages
+    of the block take memory.
+    Block is owned by the loading side, which releases it when the body is not needed anymore.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        chunks: Iterable[bytes],
+        charset: str,
+        redirects: Iterable[str] = (),
+        max_size: int = max_response_bytes,
+    ) -> None:
+        """
+        Params:
+        :url: Link to the page.
+        :chunks: Chunks of the response body, e.g. the chunks being received.
+        :charset: Charset of the body.
+        :redirects (optional): Links the page was redirected through, ending with the final link.
+            Links are read after all the chunks are received.
+        :max_size (optional): Max size of the body. Default is the max response size.
+        """
+        self.__memory: Union[SharedMemory, None] = SharedMemory(
+            create=True, size=max_size
+        )
+        size = 0
+        try:
+            for chunk in chunks:
+                if size + len(chunk) > max_size:
+                    raise ResponseTooLargeException(
+                        url, f"body exceeds {max_size} bytes"
+                    )
+                self.__memory.buf[size : size + len(chunk)] = chunk
+                size += len(chunk)
+        except BaseException:
+            self.release()
+            raise
+        self.descriptor = BodyDescriptor(
+            url, tuple(redirects), self.__memory.name, size, charset
+        )
+
+    def release(self) -> None:
+        """
+        Frees the block. Body cannot be read after that.
+        """
+        if self.__memory is None:
+            return
+        self.__memory.close()
+        self.__memory.unlink()
+        self.__memory = None
+
+
+def read_shared_body(descriptor: BodyDescriptor) -> str:
+    """
+    Decodes the body right from the shared memory block.
+    """
+    memory = SharedMemory(name=descriptor.name)
+    try:
+        with memory.buf[: descriptor.size] as body:
+            return codecs.decode(body, descriptor.charset)
+    except (LookupError, ValueError) as exc:
+        raise DecodingException(descriptor.url, descriptor.charset) from exc
+    finally:
+        memory.close()
+
+
+def extract_shared_body(
+    descriptor: BodyDescriptor, options: dict, fields: tuple[str, ...]
+) -> tuple[Union[dict, None], Union[dict, None]]:
+    """
+    Extracts the article from the shared body in a worker process.
+    Relative links are resolved against the final link of the page.
+    Returns the requested properties or the error.
+    """
+    try:
+        html = read_shared_body(descriptor)
+        if not html:
+            raise NoHTMLException(descriptor.url)
+        article = Articulo(
+            html, url=descriptor.url, redirects=list(descriptor.redirects), **options
+        )
+        return {field: getattr(article, field) for field in fields}, None
+    # Worker survives errors of a single article
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return None, get_error(exc)
+
+
+def release_bodies(bodies: Iterable[SharedBody], fetching: Iterable[Future]) -> None:
+    """
+    Releases the bodies left when the extraction is stopped,
+    including the bodies of the loads finished after that.
+    """
+    for body in bodies:
+        body.release()
+    for future in fetching:
+        if not future.cancelled() and future.exception() is None:
+            future.result().release()
+
+
+def get_result(url: str, future: Future) -> PipelineResult:
+    """
+    Returns the result of the finished extraction or the error it failed with.
+    """
+    try:
+        return PipelineResult(url, *future.result())
+    # Worker may die, e.g. be killed for running out of memory
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return PipelineResult(url, None, get_error(exc))
+
+
+def get_error(exc: Exception) -> dict:
+    """
+    Returns type and message of the exception.
+    """
+    return {"type": type(exc).__name__, "message": str(exc)}
+
+
+class Pipeline:  # pylint: disable=too-few-public-methods
+    """
+    Loads pages in threads and extracts articles in worker processes.
+    Bodies are passed to the workers through shared memory.
+    """
+
+    def __init__(
+        self,
+        http_headers: Union[dict, None] = None,
+        def_charset: str = "utf-8",
+        *,
+        options: Union[dict, None] = None,
+        fields: Iterable[str] = result_fields,
+        fetch_workers: int = 8,
+        parse_workers: Union[int, None] = None,
+        session=None,
+    ) -> None:
+        """
+        Params:
+        :http_headers (optional): Additional headers for HTTP requests.
+        :def_charset (optional): Charset of the pages. Default is utf-8.
+        :options (optional): Articulo params used by the workers, e.g. threshold or budget.
+        :fields (optional): Article properties to return. Default is all the result fields.
+        :fetch_workers (optional): Max number of pages loaded at the same time. Default is 8.
+        :parse_workers (optional): Number of worker processes. Default is number of CPUs.
+        :session (optional): requests.Session shared by the loading threads.
+        """
+        fields = tuple(fields)
+        unknown = [field for field in fields if field not in result_fields]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields {unknown}. Possible values are: {result_fields}"
+            )
+
+        self.http_headers = http_headers
+        self.def_charset = def_charset
+        self.options = options or {}
+        self.fields = fields
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or multiprocessing.cpu_count()
+        self.session = session
+
+    def extract(self, urls: Iterable[str]) -> Iterator[PipelineResult]:
+        """
+        Extracts articles of all the links.
+        Results are yielded in the order of completion.
+        Number of the bodies waiting in shared memory is bounded,
+        so the links are loaded only as fast as the workers parse them.
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        urls = iter(urls)
+        fetching: dict[Future, str] = {}
+        # Loaded bodies wait here, so the pool holds only the running jobs
+        # and a dying worker breaks nothing but them
+        loaded: deque[tuple[str, SharedBody]] = deque()
+        parsing: dict[Future, tuple[str, SharedBody, ProcessPoolExecutor]] = {}
+
+        # Workers share the tracker of the shared memory with the main process,
+        # otherwise their own trackers would unlink the blocks they attached to
+        resource_tracker.ensure_running()
+        # Workers are forked before the loading threads are started
+        parser = self.__create_parser(context)
+        fetcher = ThreadPoolExecutor(self.fetch_workers)
+        try:
+            while True:
+                # Two bodies per worker are enough to keep the workers busy
+                while (
+                    len(fetching) + len(loaded) + len(parsing) < self.parse_workers * 2
+                ):
+                    url = next(urls, None)
+                    if url is None:
+                        break
+                    fetching[fetcher.submit(self.__fetch, url)] = url
+                parser = self.__submit_loaded(parser, loaded, parsing)
+                if not fetching and not parsing:
+                    return
+
+                done = wait([*fetching, *parsing], return_when=FIRST_COMPLETED).done
+                for future in done:
+                    if future in fetching:
+                        url = fetching.pop(future)
+                        try:
+                            loaded.append((url, future.result()))
+                        # Failed page does not stop the other ones
+                        # pylint: disable-next=broad-exception-caught
+                        except Exception as exc:
+                            yield PipelineResult(url, None, get_error(exc))
+                        continue
+
+                    url, body, pool = parsing.pop(future)
+                    body.release()
+                    # All the jobs of the broken pool fail, the first of them replaces it
+                    if pool is parser and isinstance(
+                        future.exception(), BrokenProcessPool
+                    ):
+                        parser = self.__restart_parser(parser)
+                    yield get_result(url, future)
+        finally:
+            # Blocks may be released only when nobody reads them
+            parser.shutdown(cancel_futures=True)
+            fetcher.shutdown(cancel_futures=True)
+            release_bodies(
+                [
+                    *(item[1] for item in loaded),
+                    *(item[1] for item in parsing.values()),
+                ],
+                fetching,
+            )
+
+    def __submit_loaded(
+        self,
+        parser: ProcessPoolExecutor,
+        loaded: deque[tuple[str, SharedBody]],
+        parsing: dict[Future, tuple[str, SharedBody, ProcessPoolExecutor]],
+    ) -> ProcessPoolExecutor:
+        """
+        Submits the loaded bodies while there are idle workers.
+        Returns the pool, which is started again if it is found broken.
+        """
+        while loaded and len(parsing) < self.parse_workers:
+            url, body = loaded[0]
+            try:
+                future = parser.submit(
+                    extract_shared_body, body.descriptor, self.options, self.fields
+                )
+            except BrokenProcessPool:
+                # Worker died while it was idle, so the job goes to the new pool
+                parser = self.__restart_parser(parser)
+                continue
+            loaded.popleft()
+            parsing[future] = (url, body, parser)
+        return parser
+
+    def __create_parser(self, context) -> ProcessPoolExecutor:
+        parser = ProcessPoolExecutor(self.parse_workers, mp_context=context)
+        # Pool starts all the workers at the first job
+        parser.submit(int).result()
+        return parser
+
+    def __restart_parser(
+        self, broken_parser: ProcessPoolExecutor
+    ) -> ProcessPoolExecutor:
+        broken_parser.shutdown(wait=False, cancel_futures=True)
+        # Loading threads are running, so the new workers are not forked from this process
+        return self.__create_parser(get_restart_context())
+
+    def __fetch(self, url: str) -> SharedBody:
+        redirects: list[str] = []
+        chunks = fetch_body(url, self.http_headers, self.session, redirects=redirects)
+        return SharedBody(url, chunks, self.def_charset, redirects)
@@ -0,0 +1,111 @@
+"""
+This file contains the filter of the raw article html applied before parsing.
+Scripts, styles and inline svg images often make the most of the page,
+but they are never a part of the article text. The filter cuts them out
+of the html in one linear scan, so they are not turned into tree nodes at all.
+"""
+
+import re
+
+# Blocks cut out of the html before parsing
+prefiltered_tags = ("script", "style", "svg")
+
+# Content of these elements is text for the parser, so blocks never start inside it
+raw_text_tags = ("title", "textarea", "xmp", "iframe", "noembed", "noframes")
+
+# Name of the tag ends with a space, a slash or the end of the tag,
+# so custom elements like <svg-icon> are not taken for the blocks
+tag_name_end = r"(?=[\s/>])"
+
+# Quoted attribute values may contain ">" and "<".
+# Outside of the quotes the tag ends at the first "<", so a tag that is never closed
+# is scanned only up to the next tag and the scan stays linear on malformed pages.
+attributes_pattern = r"""(?:[^<>"']|"[^"]*"|'[^']*')*"""
+quoted_lt_pattern = r"""(?:"[^"<]*<[^"]*"|'[^'<]*<[^']*')"""
+
+# Comments, raw text elements and other tags with "<" in attribute values
+# are matched as a whole, so the tags inside them are left intact.
+# Comment or raw text element that is never closed runs to the end of the html.
+block_start_re = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    rf"|<(?P<raw>{'|'.join(raw_text_tags)}){tag_name_end}{attributes_pattern}>"
+    r".*?(?:</(?P=raw)\s*>|\Z)"
+    rf"|<plaintext{tag_name_end}.*"
+    rf"|<(?P<block>{'|'.join(prefiltered_tags)}){tag_name_end}{attributes_pattern}>"
+    rf"|<[a-z][^\s/<>]*\s{attributes_pattern}?{quoted_lt_pattern}{attributes_pattern}>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Scripts and styles are raw text, so the first closing tag ends them
+raw_text_end_res = {
+    name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in ("script", "style")
+}
+
+svg_tag_re = re.compile(
+    rf"<(/?)svg{tag_name_end}(?:[^<>\"']|\"[^\"]*\"|'[^']*')*?(/?)>", re.IGNORECASE
+)
+
+json_ld_type_re = re.compile(
+    r"""\btype\s*=\s*["']?application/ld\+json""", re.IGNORECASE
+)
+
+# Empty comment keeps the text around the removed block split the same way
+# as the block did, so the text of the parsed document does not change.
+block_placeholder = "<!---->"
+
+
+def find_block_end(html: str, name: str, content_start: int) -> int:
+    """
+    Returns position right after the closing tag of the block
+    or the end of the html if the block is not closed.
+    """
+    if name in raw_text_end_res:
+        match = raw_text_end_res[name].search(html, content_start)
+        return match.end() if match else len(html)
+
+    # Svg images may be nested
+    depth = 1
+    for match in svg_tag_re.finditer(html, content_start):
+        if match.group(1):
+            depth -= 1
+        elif not match.group(2):
+            depth += 1
+        if depth == 0:
+            return match.end()
+    return len(html)
+
+
+def strip_blocks(html: str, keep_json_ld: bool = True) -> str:
+    """
+    Removes script, style and svg blocks from the html.
+
+    Params:
+    :html: Raw article html.
+    :keep_json_ld (optional): Keep ld+json scripts with structured data. Default is True.
+    """
+    parts = []
+    position = 0
+    while True:
+        match = block_start_re.search(html, position)
+        if match is None:
+            break
+
+        name = match.group("block")
+        open_tag = match.group(0)
+        if name is None or open_tag.endswith("/>"):
+            # Comment, raw text element, tag with "<" in attributes or self-closed block
+            parts.append(html[position : match.end()])
+            position = match.end()
+            continue
+
+        name = name.lower()
+        block_end = find_block_end(html, name, match.end())
+        if keep_json_ld and name == "script" and json_ld_type_re.search(open_tag):
+            parts.append(html[position:block_end])
+        else:
+            parts.append(html[position : match.start()])
+            parts.append(block_placeholder)
+        position = block_end
+
+    parts.append(html[position:])
+    return "".join(parts)
@@ -0,0 +1,344 @@
+"""
+This file contains renderers of the article content tree.
+Renderers walk the content tree once and write the result
+straight into the output stream, so there is no intermediate
+html serialization and no need to re-parse the markup.
+"""
+
+import re
+from typing import TextIO
+
+from bs4 import NavigableString, Tag
+
+from articulo.stats import counted_string_types
+
+# Formats supported by the content renderer
+render_formats = frozenset(["markdown", "text"])
+
+block_tags = frozenset(
+    [
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "figcaption",
+        "figure",
+        "footer",
+        "header",
+        "hr",
+        "main",
+        "nav",
+        "p",
+        "section",
+        "table",
+    ]
+)
+
+heading_levels = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+
+inline_markers = {"strong": "**", "b": "**", "em": "*", "i": "*"}
+
+whitespaces_re = re.compile(r"\s+")
+
+backticks_re = re.compile(r"`+")
+
+# Characters starting Markdown markup anywhere in the text
+markdown_special_re = re.compile(r"([\\`*_\[\]])")
+
+# Text starting a heading, a quote or a list item at the start of a line
+line_start_markup_re = re.compile(r"^(?:([#>+=-])|(\d+)([.)]))")
+
+
+def escape_markdown(text: str, line_start: bool = False, in_table: bool = False) -> str:
+    """
+    Escapes the characters, that would be read as Markdown markup.
+    Pipes are escaped only inside table cells and the block markers only at the line start.
+    """
+    text = markdown_special_re.sub(r"\\\1", text)
+    if in_table:
+        text = text.replace("|", "\\|")
+    if line_start:
+        text = line_start_markup_re.sub(
+            lambda match: f"\\{match[1]}" if match[1] else f"{match[2]}\\{match[3]}",
+            text,
+        )
+    return text
+
+
+def get_code_fence(code: str, min_length: int) -> str:
+    """
+    Returns the fence of backticks longer than any run of backticks in the code.
+    """
+    longest_run = max((len(run) for run in backticks_re.findall(code)), default=0)
+    return "`" * max(min_length, longest_run + 1)
+
+
+# Renderer is a state machine of the output layout driven by the single public method
+# pylint: disable-next=too-many-instance-attributes,too-few-public-methods
+class ContentRenderer:
+    """
+    Renders article content tree into a text stream
+    as Markdown or as plain text with paragraphs preserved.
+    """
+
+    def __init__(self, out: TextIO, output_format: str = "markdown") -> None:
+        """
+        Params:
+        :out: Text stream the result is written to.
+        :output_format (optional): Output format, markdown or text. Default is markdown.
+        """
+        if output_format not in render_formats:
+            raise ValueError(
+                f"Unknown format {output_format}. Possible values are: {sorted(render_formats)}"  # pylint: disable=line-too-long
+            )
+
+        self.__out = out
+        self.__markdown = output_format == "markdown"
+        self.__prefixes: list[str] = []
+        self.__pending_breaks = 0
+        self.__pending_space = False
+        self.__no_space = True
+        self.__started = False
+        self.__line_start = True
+        self.__after_marker = False
+        self.__inline_depth = 0
+        self.__list_depth = 0
+
+    def render(self, content: Tag) -> None:
+        """
+        Renders the content tree into the output stream.
+        """
+        self.__render_children(content)
+        if self.__started:
+            self.__out.write("\n")
+
+    def __render_children(self, element: Tag) -> None:
+        for child in element.children:
+            self.__render_element(child)
+
+    def __render_element(self, element) -> None:  # pylint: disable=too-many-branches
+        if isinstance(element, NavigableString):
+            if element.__class__ in counted_string_types:
+                self.__write_text(element)
+            return
+
+        name = element.name
+        if name == "br":
+            self.__break(1)
+        elif name == "img":
+            if self.__markdown and element.get("src"):
+                self.__write_inline(f"![{element.get('alt', '')}]({element['src']})")
+        elif name in heading_levels:
+            self.__break(2)
+            if self.__markdown:
+                self.__write_inline("#" * heading_levels[name] + " ", space_after=False)
+            self.__render_children(element)
+            self.__break(2)
+        elif name == "pre":
+            self.__render_preformatted(element)
+        elif name in ("ul", "ol"):
+            self.__render_list(element)
+        elif name == "li":
+            self.__render_list_item(element, "- ")
+        elif name == "blockquote":
+            self.__render_block(element, "> " if self.__markdown else "")
+        elif name == "tr":
+            self.__render_table_row(element)
+        elif name == "code" and self.__markdown:
+            self.__render_code(element)
+        elif name in inline_markers and self.__markdown:
+            marker = inline_markers[name]
+            self.__write_inline(marker, space_after=False)
+            self.__render_children(element)
+            self.__write_inline(marker, space_before=False)
+        elif name == "a" and self.__markdown and element.get("href"):
+            self.__write_inline("[", space_after=False)
+            self.__render_children(element)
+            self.__write_inline(f"]({element['href']})", space_before=False)
+        elif name in block_tags:
+            self.__render_block(element)
+        else:
+            self.__render_children(element)
+
+    def __render_block(self, element: Tag, prefix: str = "") -> None:
+        self.__break(2)
+        if self.__after_marker and prefix:
+            # Block starts on the line of the list marker
+            self.__write_inline(prefix, space_after=False)
+            self.__after_marker = True
+        self.__prefixes.append(prefix)
+        self.__render_children(element)
+        self.__prefixes.pop()
+        self.__break(2)
+
+    def __render_list(self, element: Tag) -> None:
+        self.__break(2 if self.__list_depth == 0 else 1)
+        self.__list_depth += 1
+        position = 1
+        for child in element.children:
+            if isinstance(child, Tag) and child.name == "li":
+                marker = f"{position}. " if element.name == "ol" else "- "
+                self.__render_list_item(child, marker)
+                position += 1
+            else:
+                self.__render_element(child)
+        self.__list_depth -= 1
+        self.__break(2 if self.__list_depth == 0 else 1)
+
+    def __render_list_item(self, element: Tag, marker: str) -> None:
+        self.__break(1)
+        if self.__markdown:
+            self.__write_inline(marker, space_after=False)
+            self.__after_marker = True
+            self.__prefixes.append(" " * len(marker))
+        else:
+            self.__prefixes.append("")
+        self.__render_children(element)
+        self.__prefixes.pop()
+        self.__after_marker = False
+        self.__break(1)
+
+    def __render_preformatted(self, element: Tag) -> None:
+        self.__break(2)
+        code = element.get_text().strip("\n")
+        lines = code.split("\n")
+        if self.__markdown:
+            fence = get_code_fence(code, 3)
+            lines = [fence, *lines, fence]
+        for index, line in enumerate(lines):
+            if index > 0:
+                self.__break(1)
+            self.__write_raw(line)
+        self.__break(2)
+
+    def __render_code(self, element: Tag) -> None:
+        code = whitespaces_re.sub(" ", element.get_text()).strip()
+        if not code:
+            return
+        fence = get_code_fence(code, 1)
+        # Code starting or ending with a backtick is padded, so it does not join the fence
+        if code[0] == "`" or code[-1] == "`":
+            code = f" {code} "
+        self.__write_inline(f"{fence}{code}{fence}")
+
+    def __render_table_row(self, element: Tag) -> None:
+        self.__break(1)
+        cells = [
+            child
+            for child in element.children
+            if isinstance(child, Tag) and child.name in ("td", "th")
+        ]
+        self.__inline_depth += 1
+        for index, cell in enumerate(cells):
+            if self.__markdown:
+                self.__write_inline(
+                    "| " if index == 0 else " | ", space_before=False, space_after=False
+                )
+            elif index > 0:
+                self.__write_inline("\t", space_before=False, space_after=False)
+            self.__render_children(cell)
+        if self.__markdown and cells:
+            self.__write_inline(" |", space_before=False)
+        self.__inline_depth -= 1
+
+        if self.__markdown and cells and self.__is_first_row(element):
+            self.__break(1)
+            self.__write_raw("|" + " --- |" * len(cells))
+        self.__break(1)
+
+    @staticmethod
+    def __is_first_row(row: Tag) -> bool:
+        previous_row = row.find_previous("tr")
+        return previous_row is None or (
+            previous_row.find_parent("table") is not row.find_parent("table")
+        )
+
+    def __break(self, count: int) -> None:
+        """
+        Requests line breaks before the next written text.
+        Breaks right after a list marker are skipped, so the item text stays on its line.
+        """
+        if self.__after_marker:
+            return
+        if self.__inline_depth > 0:
+            self.__pending_space = True
+            return
+        self.__pending_space = False
+        if self.__started:
+            self.__pending_breaks = max(self.__pending_breaks, count)
+
+    def __write_text(self, text: str) -> None:
+        """
+        Writes text with whitespaces collapsed and Markdown markup escaped.
+        """
+        collapsed = whitespaces_re.sub(" ", text)
+        words = collapsed.strip()
+        if collapsed[:1] == " ":
+            self.__pending_space = True
+        if words and self.__markdown:
+            # Text right after a list marker would start a nested block as well
+            line_start = (
+                self.__pending_breaks > 0
+                or not self.__started
+                or self.__line_start
+                or self.__after_marker
+            )
+            words = escape_markdown(words, line_start, self.__inline_depth > 0)
+        if words:
+            self.__write_inline(words)
+            self.__pending_space = collapsed[-1:] == " "
+
+    def __write_inline(
+        self, text: str, space_before: bool = True, space_after: bool = True
+    ) -> None:
+        """
+        Writes inline text starting a new line if there are pending line breaks.
+        Pending space is written before the text unless it follows a whitespace
+        or an opening marker.
+        """
+        if self.__pending_breaks > 0 or not self.__started:
+            self.__start_line()
+        elif space_before and self.__pending_space and not self.__no_space:
+            self.__out.write(" ")
+        # Closing markers keep the pending space for the text after them
+        if space_before:
+            self.__pending_space = False
+        self.__no_space = not space_after or text[-1:].isspace()
+        self.__line_start = False
+        self.__after_marker = False
+        self.__out.write(text)
+
+    def __write_raw(self, text: str) -> None:
+        """
+        Writes text as is, without collapsing whitespaces.
+        """
+        if self.__pending_breaks > 0 or not self.__started:
+            self.__start_line()
+        self.__no_space = text[-1:].isspace()
+        self.__line_start = False
+        self.__after_marker = False
+        self.__out.write(text)
+
+    def __start_line(self) -> None:
+        prefix = "".join(self.__prefixes)
+        if self.__started:
+            for _ in range(self.__pending_breaks - 1):
+                self.__out.write("\n" + prefix.rstrip())
+            self.__out.write("\n")
+        self.__out.write(prefix)
+        self.__pending_breaks = 0
+        self.__pending_space = False
+        self.__no_space = True
+        self.__line_start = True
+        self.__started = True
+
+
+def render_content(content: Tag, out: TextIO, output_format: str = "markdown") -> None:
+    """
+    Renders the content tree into the output stream.
+    """
+    ContentRenderer(out, output_format).render(content)
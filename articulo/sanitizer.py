@@ -0,0 +1,116 @@
+"""
+This file contains the sanitizer policy used to clean the article content.
+Policy is compiled into a dispatch table of per-tag actions once,
+so the cleaning takes a single traversal of the content tree.
+"""
+
+from collections.abc import Iterable
+from typing import Union
+
+from bs4 import Comment, Tag
+
+from articulo.budget import BudgetMeter
+from articulo.constants import important_content_tags, tags_to_completely_remove
+
+# Keep the tag with its content
+KEEP = "keep"
+# Remove the tag but keep its content
+UNWRAP = "unwrap"
+# Remove the tag with all of its content
+DROP = "drop"
+
+sanitizer_actions = frozenset([KEEP, UNWRAP, DROP])
+
+
+class SanitizerPolicy:
+    """
+    Set of rules defining how every tag of the article content is cleaned.
+    By default important content tags are kept, tags to completely remove
+    are dropped and all the other tags are unwrapped.
+    """
+
+    def __init__(
+        self,
+        actions: Union[dict[str, str], None] = None,
+        allowed_attrs: Union[dict[str, Iterable[str]], None] = None,
+        default_action: str = UNWRAP,
+        keep_tags: Iterable[str] = important_content_tags,
+        drop_tags: Iterable[str] = tags_to_completely_remove,
+    ) -> None:
+        """
+        Params:
+        :actions (optional): Actions by tag name, that override the default ones.
+        :allowed_attrs (optional): Attributes whitelist by tag name.
+            Whitelist for "*" key is used for tags without their own whitelist.
+            All the attributes are kept if there is no whitelist.
+        :default_action (optional): Action for the tags not mentioned anywhere.
+        :keep_tags (optional): Tags to keep. Default is important content tags.
+        :drop_tags (optional): Tags to drop. Default is tags to completely remove.
+        """
+        dispatch_table = {tag: KEEP for tag in keep_tags}
+        dispatch_table.update({tag: DROP for tag in drop_tags})
+        dispatch_table.update(actions or {})
+
+        for action in [default_action, *dispatch_table.values()]:
+            if action not in sanitizer_actions:
+                raise ValueError(
+                    f"Unknown sanitizer action {action}. Possible values are: {sorted(sanitizer_actions)}"  # pylint: disable=line-too-long
+                )
+
+        self.__dispatch_table = dispatch_table
+        self.__default_action = default_action
+        self.__allowed_attrs = (
+            None
+            if allowed_attrs is None
+            else {tag: frozenset(attrs) for tag, attrs in allowed_attrs.items()}
+        )
+
+    def action(self, tag_name: str) -> str:
+        """
+        Returns action for the tag.
+        """
+        return self.__dispatch_table.get(tag_name, self.__default_action)
+
+    def sanitize(self, content: Tag, meter: Union[BudgetMeter, None] = None) -> Tag:
+        """
+        Sanitizes content in place and returns it.
+        Nodes to visit are charged to the budget meter before the cleaning starts.
+        """
+        dispatch_table = self.__dispatch_table
+        default_action = self.__default_action
+        allowed_attrs = self.__allowed_attrs
+        default_attrs = None if allowed_attrs is None else allowed_attrs.get("*")
+
+        elements = list(content.descendants)
+        if meter is not None:
+            meter.charge("sanitizer_ops", len(elements))
+
+        for element in elements:
+            if element.decomposed:
+                continue
+
+            if isinstance(element, Comment):
+                element.extract()
+                continue
+
+            if not isinstance(element, Tag):
+                continue
+
+            action = dispatch_table.get(element.name, default_action)
+            if action == DROP:
+                element.decompose()
+            elif action == UNWRAP:
+                element.unwrap()
+            elif allowed_attrs is not None:
+                whitelist = allowed_attrs.get(element.name, default_attrs)
+                if whitelist is not None:
+                    element.attrs = {
+                        key: value
+                        for key, value in element.attrs.items()
+                        if key in whitelist
+                    }
+
+        return content
+
+
+default_policy = SanitizerPolicy()
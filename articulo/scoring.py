@@ -0,0 +1,88 @@
+"""
+This file contains the content scoring used to find the article content
+when there is no element matching the article title.
+Scores are calculated in a single pass over the document
+using the precomputed text statistics.
+"""
+
+import re
+from typing import Union
+
+from bs4 import BeautifulSoup, Tag
+
+from articulo.constants import (
+    content_tag_hints,
+    negative_content_hints,
+    positive_content_hints,
+    scored_paragraph_tags,
+)
+from articulo.stats import TextStats
+
+min_paragraph_length = 25
+class_hint_weight = 25
+
+positive_hints_re = re.compile(r"\b(" + "|".join(positive_content_hints) + r")\b", re.I)
+negative_hints_re = re.compile(r"\b(" + "|".join(negative_content_hints) + r")\b", re.I)
+
+
+def get_class_weight(element: Tag) -> int:
+    """
+    Scores element by the words in its class and id attributes.
+    """
+    weight = 0
+    for hint in [" ".join(element.get("class", [])), element.get("id", "")]:
+        if not hint:
+            continue
+        if negative_hints_re.search(hint):
+            weight -= class_hint_weight
+        if positive_hints_re.search(hint):
+            weight += class_hint_weight
+    return weight
+
+
+def score_paragraph(paragraph: Tag, stats: TextStats) -> float:
+    """
+    Scores paragraph by the length of its text.
+    Returns 0 for paragraphs that are too short to be the article content.
+    """
+    length = stats.chars(paragraph)
+    if length < min_paragraph_length:
+        return 0.0
+    return 1.0 + min(length / 100, 3.0)
+
+
+def score_content(root: Tag, stats: TextStats) -> Union[Tag, None]:
+    """
+    Looks for the element with the highest content score.
+    Every paragraph gives its score to the parent and a half of it to the grandparent.
+    Candidates are adjusted by tag and class hints and penalized for the link density.
+    """
+    scores: dict[int, float] = {}
+    candidates: dict[int, Tag] = {}
+
+    for paragraph in root.find_all(scored_paragraph_tags):
+        paragraph_score = score_paragraph(paragraph, stats)
+        if paragraph_score == 0:
+            continue
+
+        ancestors = [paragraph.parent, paragraph.parent.parent]
+        for level, ancestor in enumerate(ancestors):
+            # The document itself is never a candidate
+            if not isinstance(ancestor, Tag) or isinstance(ancestor, BeautifulSoup):
+                break
+            if id(ancestor) not in candidates:
+                candidates[id(ancestor)] = ancestor
+                scores[id(ancestor)] = content_tag_hints.get(
+                    ancestor.name, 0
+                ) + get_class_weight(ancestor)
+            scores[id(ancestor)] += paragraph_score / (level + 1)
+
+    best_candidate = None
+    best_score = 0.0
+    for key, candidate in candidates.items():
+        score = scores[key] * (1.0 - stats.link_density(candidate))
+        if score > best_score:
+            best_candidate = candidate
+            best_score = score
+
+    return best_candidate
@@ -0,0 +1,449 @@
+"""
+This file contains the extraction service: a long-running pool of warm worker processes
+behind a local HTTP endpoint, served over TCP or a Unix socket.
+Heavy modules are imported once before the workers are forked,
+so a job pays neither the interpreter startup nor the imports.
+Workers replacing a crashed pool are forked by a fork server instead,
+because forking the process running the server threads may deadlock.
+Jobs and results are JSON, so the service can be called from any language.
+
+Endpoints:
+* POST /extract - extracts the article from {"url": ...} or {"html": ...}
+* GET /stats - queue depth, job counters and per-stage latencies
+* GET /health - liveness check
+"""
+
+import json
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib import import_module
+from socketserver import ThreadingMixIn, UnixStreamServer
+from threading import Lock, current_thread, main_thread
+from typing import Any, Union
+
+from .articulo import Articulo
+from .constants import result_fields
+from .exceptions import ArticuloException
+from .metrics import Metrics
+from .utils import is_url
+
+# Modules imported before the workers are forked
+preloaded_modules = ("lxml.etree", "bs4", "requests", "extruct")
+
+# Articulo params the service can be configured with
+service_options = (
+    "threshold",
+    "strategy",
+    "def_charset",
+    "http_headers",
+    "prefilter",
+    "prefer_json_ld",
+    "prefer_alternate",
+    "budget",
+)
+
+max_job_bytes = 64 * 1024 * 1024
+
+# Session of the worker process, created on the first job loading an article
+worker_session = None
+
+
+def preload_modules() -> None:
+    """
+    Imports the heavy modules, so the forked workers inherit them.
+    Modules that are not installed are skipped.
+    """
+    for name in preloaded_modules:
+        try:
+            import_module(name)
+        except ImportError:
+            continue
+
+
+def get_restart_context():
+    """
+    Returns the context of the pools started while the server threads are running.
+    Fork server is a single-threaded process with the heavy modules preloaded,
+    so its forks are safe and warm. Spawn is used where there is no fork server.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([*preloaded_modules, __name__])
+    return context
+
+
+def get_worker_session():
+    """
+    Returns HTTP session of the worker process.
+    """
+    global worker_session  # pylint: disable=global-statement
+    if worker_session is None:
+        # pylint: disable-next=import-outside-toplevel
+        import requests
+
+        worker_session = requests.Session()
+    return worker_session
+
+
+def warm_up(_: int) -> int:
+    """
+    Runs in every worker when the pool is started. Returns the worker pid.
+    """
+    return os.getpid()
+
+
+def run_job(job: dict, options: dict, submitted_at: float) -> dict:
+    """
+    Extracts the article in a worker process.
+    Returns the response with the result or the error and the stage timings.
+    """
+    started_at = time.time()
+    metrics = Metrics()
+    link_or_content = job.get("url") or job.get("html")
+    article = Articulo(
+        link_or_content,
+        session=get_worker_session() if "url" in job else None,
+        metrics=metrics,
+        **options,
+    )
+
+    response: dict[str, Any] = {}
+    try:
+        response["result"] = {
+            field: getattr(article, field) for field in job.get("fields", result_fields)
+        }
+    except ArticuloException as exc:
+        response["error"] = {"type": type(exc).__name__, "message": str(exc)}
+    # Worker survives errors of a single article
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        response["error"] = {"type": type(exc).__name__, "message": str(exc)}
+        response["unexpected"] = True
+
+    response["timings"] = metrics.as_dict()["timings"]
+    response["timings"]["queue"] = max(0.0, started_at - submitted_at)
+    return response
+
+
+def validate_job(job: Any) -> dict:
+    """
+    Checks the job has either url or html and only the known fields.
+    Raises ValueError if the job is invalid.
+    """
+    if not isinstance(job, dict):
+        raise ValueError("Job should be a JSON object")
+    if ("url" in job) == ("html" in job):
+        raise ValueError("Job should have either url or html")
+    if "url" in job and not (isinstance(job["url"], str) and is_url(job["url"])):
+        raise ValueError("Url should be a valid link")
+    if "html" in job and not (isinstance(job["html"], str) and job["html"]):
+        raise ValueError("Html should be a non-empty string")
+
+    fields = job.get("fields", [])
+    if not isinstance(fields, list):
+        raise ValueError("Fields should be a list")
+    unknown = [field for field in fields if field not in result_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields {unknown}. Possible values are: {result_fields}"
+        )
+    return job
+
+
+class ExtractionService:
+    """
+    Pool of warm worker processes extracting articles.
+    Workers are forked at start, after the heavy modules are imported.
+    If a worker dies, e.g. is killed for running out of memory,
+    the jobs it broke fail and the pool is started again.
+    Service is safe to call from several threads.
+    """
+
+    def __init__(self, workers: int = 2, options: Union[dict, None] = None) -> None:
+        """
+        Params:
+        :workers (optional): Number of worker processes. Default is 2.
+        :options (optional): Articulo params used for every job, e.g. threshold or budget.
+        """
+        options = options or {}
+        unknown = [key for key in options if key not in service_options]
+        if unknown:
+            raise ValueError(
+                f"Unknown options {unknown}. Possible values are: {service_options}"
+            )
+
+        self.workers = workers
+        self.options = options
+        self.metrics = Metrics()
+        self.__in_flight = 0
+        self.__lock = Lock()
+        self.__restart_lock = Lock()
+        self.__pool: Union[ProcessPoolExecutor, None] = None
+
+    def start(self) -> None:
+        """
+        Imports the heavy modules and forks the workers.
+        """
+        preload_modules()
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        self.__pool = self.__create_pool(context)
+
+    def close(self) -> None:
+        """
+        Stops the workers.
+        """
+        if self.__pool is not None:
+            self.__pool.shutdown(cancel_futures=True)
+            self.__pool = None
+
+    def __enter__(self) -> "ExtractionService":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def extract(self, job: dict) -> dict:
+        """
+        Extracts the article in one of the workers and waits for the response.
+        Raises ValueError if the job is invalid.
+        """
+        if self.__pool is None:
+            raise RuntimeError("Service is not started")
+        validate_job(job)
+
+        started_at = time.perf_counter()
+        with self.__lock:
+            self.__in_flight += 1
+        pool = self.__pool
+        try:
+            future = pool.submit(run_job, job, self.options, time.time())
+            response = future.result()
+        except BrokenProcessPool:
+            self.__restart(pool)
+            response = {
+                "error": {
+                    "type": "WorkerCrashed",
+                    "message": "Worker process died while running the job",
+                },
+                "unavailable": True,
+                "timings": {},
+            }
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+
+        self.metrics.incr("jobs")
+        if "error" in response:
+            self.metrics.incr("errors")
+        for stage, seconds in response.pop("timings").items():
+            self.metrics.add_timing(stage, seconds)
+        self.metrics.add_timing("job", time.perf_counter() - started_at)
+        return response
+
+    def stats(self) -> dict:
+        """
+        Returns queue depth, job counters and mean latency of every stage in milliseconds.
+        """
+        with self.__lock:
+            in_flight = self.__in_flight
+        metrics = self.metrics.as_dict()
+        counters = metrics["counters"]
+        stages = {
+            stage: {
+                "count": counters.get(f"{stage}.count", 0),
+                "mean_ms": 1000 * seconds / max(1, counters.get(f"{stage}.count", 0)),
+            }
+            for stage, seconds in metrics["timings"].items()
+        }
+        return {
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - self.workers),
+            "jobs": counters.get("jobs", 0),
+            "errors": counters.get("errors", 0),
+            "restarts": counters.get("restarts", 0),
+            "stages": stages,
+        }
+
+    def __create_pool(self, context) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(self.workers, mp_context=context)
+        # Pool starts all the workers at the first job
+        list(pool.map(warm_up, range(self.workers)))
+        return pool
+
+    def __restart(self, broken_pool: ProcessPoolExecutor) -> None:
+        """
+        Replaces the broken pool with a new one.
+        Jobs running in the broken pool fail together,
+        so the pool is replaced only by the first of them.
+        """
+        with self.__restart_lock:
+            if self.__pool is not broken_pool:
+                return
+            broken_pool.shutdown(wait=False, cancel_futures=True)
+            self.__pool = self.__create_pool(get_restart_context())
+        self.metrics.incr("restarts")
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON endpoints of the extraction service.
+    """
+
+    server_version = "articulo"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Returns the service stats or the health status.
+        """
+        if self.path == "/stats":
+            self.__send(200, self.server.service.stats())
+        elif self.path == "/health":
+            self.__send(200, {"status": "ok"})
+        else:
+            self.__send(404, {"error": {"type": "NotFound", "message": self.path}})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Extracts the article from the JSON job.
+        """
+        if self.path != "/extract":
+            self.__send(404, {"error": {"type": "NotFound", "message": self.path}})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            # Negative length would read the socket until the client closes it
+            if length < 0:
+                raise ValueError(f"Invalid Content-Length {length}")
+            if length > max_job_bytes:
+                raise ValueError(f"Job exceeds {max_job_bytes} bytes")
+            job = json.loads(self.rfile.read(length) or b"null")
+            response = self.server.service.extract(job)
+        except ValueError as exc:
+            self.__send(400, {"error": {"type": "BadRequest", "message": str(exc)}})
+            return
+
+        if response.pop("unavailable", False):
+            self.__send(503, response)
+        elif response.pop("unexpected", False):
+            self.__send(500, response)
+        elif "error" in response:
+            self.__send(422, response)
+        else:
+            self.__send(200, response)
+
+    def address_string(self) -> str:
+        # Clients of Unix sockets have no address
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return "unix"
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def __send(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server of the extraction service listening on a TCP port.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        service: ExtractionService,
+        verbose: bool = False,
+    ) -> None:
+        self.service = service
+        self.verbose = verbose
+        super().__init__(address, ServiceRequestHandler)
+
+
+class ServiceUnixServer(ThreadingMixIn, UnixStreamServer):
+    """
+    HTTP server of the extraction service listening on a Unix socket.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, path: str, service: ExtractionService, verbose: bool = False
+    ) -> None:
+        self.service = service
+        self.verbose = verbose
+        super().__init__(path, ServiceRequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def create_server(
+    service: ExtractionService,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Union[str, None] = None,
+    verbose: bool = False,
+) -> Union[ServiceHTTPServer, ServiceUnixServer]:
+    """
+    Creates the server listening on the Unix socket if its path is provided
+    or on the TCP port otherwise.
+    """
+    if socket_path is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise ValueError("Unix sockets are not supported on this platform")
+        # Socket file left by a stopped server
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return ServiceUnixServer(socket_path, service, verbose)
+    return ServiceHTTPServer((host, port), service, verbose)
+
+
+def raise_interrupt(*_) -> None:
+    """
+    Stops serving on the termination signal the same way as on Ctrl+C.
+    """
+    raise KeyboardInterrupt
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    socket_path: Union[str, None] = None,
+    *,
+    workers: int = 2,
+    options: Union[dict, None] = None,
+    verbose: bool = False,
+) -> None:
+    """
+    Starts the service and serves the requests until interrupted or terminated.
+    """
+    with ExtractionService(workers, options) as service:
+        # Workers are already forked, so only the server handles the termination
+        if current_thread() is main_thread():
+            signal.signal(signal.SIGTERM, raise_interrupt)
+        with create_server(service, host, port, socket_path, verbose) as server:
+            address = socket_path or f"http://{host}:{server.server_address[1]}"
+            print(f"Articulo is serving on {address} with {workers} workers")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
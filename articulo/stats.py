@@ -0,0 +1,153 @@
+"""
+This file contains the text statistics of a parsed document.
+Statistics are computed once for the whole tree, so the
+content search does not have to concatenate element texts again and again.
+"""
+
+from typing import Union
+
+from bs4 import CData, NavigableString, Tag
+
+from .budget import BudgetMeter
+
+# The same string types that bs4 takes into account for the `Tag.text` property
+counted_string_types = (NavigableString, CData)
+
+# Elements are charged to the budget in batches, so the walk is stopped
+# soon after the limit is exceeded without a check at every element
+budget_charge_interval = 1024
+
+
+class NodeStats:
+    """
+    Text statistics of a single element, including all of its descendants.
+    Edges of the text are tracked, so a word split by the inline tags,
+    like foo<b>bar</b>, is counted once, the same as in the element text.
+    """
+
+    __slots__ = ("chars", "words", "link_chars", "starts_in_word", "ends_in_word")
+
+    def __init__(self) -> None:
+        self.chars = 0
+        self.words = 0
+        self.link_chars = 0
+        self.starts_in_word = False
+        self.ends_in_word = False
+
+    def add(self, other: "NodeStats") -> None:
+        """
+        Appends the counters of the text following the text of this element.
+        """
+        if other.chars == 0:
+            return
+        if self.chars == 0:
+            self.starts_in_word = other.starts_in_word
+        elif self.ends_in_word and other.starts_in_word:
+            # Word continues in the appended text
+            self.words -= 1
+        self.chars += other.chars
+        self.words += other.words
+        self.link_chars += other.link_chars
+        self.ends_in_word = other.ends_in_word
+
+    def add_string(self, string: str) -> None:
+        """
+        Appends the counters of the string following the text of this element.
+        """
+        string_stats = NodeStats()
+        string_stats.chars = len(string)
+        string_stats.words = len(string.split())
+        string_stats.starts_in_word = string_stats.chars > 0 and not string[0].isspace()
+        string_stats.ends_in_word = string_stats.chars > 0 and not string[-1].isspace()
+        self.add(string_stats)
+
+
+class TextStats:
+    """
+    Text statistics for every element of the document tree.
+    Counters are computed in a single traversal in document order:
+    * chars - length of the element text, equal to len(element.text)
+    * words - number of whitespace-separated words in the element text,
+      equal to len(element.text.split())
+    * link_chars - length of the text placed inside links
+    """
+
+    def __init__(self, root: Tag, meter: Union[BudgetMeter, None] = None) -> None:
+        """
+        Params:
+        :root: Root of the tree.
+        :meter (optional): Budget meter the walked elements are charged to.
+            Deadline is checked during the walk too.
+        """
+        self.__stats: dict[int, NodeStats] = {}
+        # Keeping references to the elements, so their ids stay valid
+        self.__elements: list[Tag] = [root]
+        self.__stats[id(root)] = NodeStats()
+
+        # Elements whose text is not complete yet, from the root to the current one.
+        # Texts are appended in document order, so words are joined across the tags.
+        open_elements = [root]
+        for element in root.descendants:
+            while open_elements[-1] is not element.parent:
+                self.__close(open_elements.pop(), open_elements[-1])
+            if isinstance(element, Tag):
+                self.__elements.append(element)
+                self.__stats[id(element)] = NodeStats()
+                open_elements.append(element)
+                if (
+                    meter is not None
+                    and len(self.__elements) % budget_charge_interval == 0
+                ):
+                    meter.charge("nodes", budget_charge_interval)
+                    meter.check_deadline()
+            elif element.__class__ in counted_string_types:
+                self.__stats[id(element.parent)].add_string(element)
+
+        while len(open_elements) > 1:
+            self.__close(open_elements.pop(), open_elements[-1])
+        if meter is not None:
+            meter.charge("nodes", len(self.__elements) % budget_charge_interval)
+        if root.name == "a":
+            self.__stats[id(root)].link_chars = self.__stats[id(root)].chars
+
+    def __close(self, element: Tag, parent: Tag) -> None:
+        element_stats = self.__stats[id(element)]
+        if element.name == "a":
+            element_stats.link_chars = element_stats.chars
+        self.__stats[id(parent)].add(element_stats)
+
+    def __getitem__(self, element: Tag) -> NodeStats:
+        return self.__stats[id(element)]
+
+    def __contains__(self, element: Tag) -> bool:
+        return id(element) in self.__stats
+
+    def __len__(self) -> int:
+        return len(self.__elements)
+
+    def chars(self, element: Tag) -> int:
+        """
+        Returns the length of the element text.
+        """
+        return self[element].chars
+
+    def words(self, element: Tag) -> int:
+        """
+        Returns the number of words in the element text.
+        """
+        return self[element].words
+
+    def link_chars(self, element: Tag) -> int:
+        """
+        Returns the length of the element text placed inside links.
+        """
+        return self[element].link_chars
+
+    def link_density(self, element: Tag) -> float:
+        """
+        Returns the share of the element text placed inside links.
+        """
+        element_stats = self[element]
+        if element_stats.chars == 0:
+            return 0.0
+        return element_stats.link_chars / element_stats.chars
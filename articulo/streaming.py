@@ -0,0 +1,361 @@
+"""
+This file contains the bounded-memory extraction for gigantic documents.
+Document is parsed with lxml iterparse twice:
+* the first pass finds the title element and counts text length of its ancestors,
+  processed elements are removed from the tree as soon as they are counted;
+* the second pass keeps only the chosen content container and stops right after it.
+So peak memory is proportional to the content container, not to the whole page.
+"""
+
+import os
+from io import BytesIO
+from typing import IO, NamedTuple, Union
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from .exceptions import NoTitleException
+from .sanitizer import SanitizerPolicy
+from .utils import clean_title_text, sanitize_html
+
+StreamSource = Union[str, os.PathLike, bytes, IO[bytes]]
+
+title_candidate_tags = frozenset(["h1", "h2", "h3", "h4", "h5", "h6", "p"])
+
+# Tags which text is not a part of the document text, the same as for bs4
+non_text_tags = frozenset(["script", "style", "template"])
+
+title_meta_names = ("og:title", "twitter:title")
+
+# Tags which whitespaces are preserved by bs4
+preserve_whitespace_tags = frozenset(["pre", "textarea"])
+
+ascii_spaces = " \n\t\x0c\r"
+
+
+def get_text_length(text: Union[str, None], preserve_whitespace: bool) -> int:
+    """
+    Returns length of the text the same way it is counted in bs4 tree,
+    where whitespace-only strings are collapsed into a single character.
+    """
+    if not text:
+        return 0
+    if not preserve_whitespace and not text.strip(ascii_spaces):
+        return 1
+    return len(text)
+
+
+class StreamResult(NamedTuple):
+    """
+    Result of the streaming extraction.
+    Markup and text are None if there is no content found.
+    """
+
+    title: str
+    markup: Union[str, None]
+    text: Union[str, None]
+
+
+class _Frame:  # pylint: disable=too-few-public-methods
+    """
+    Open element of the document during the first pass.
+    """
+
+    __slots__ = ("element", "path", "chars", "children", "pending", "keep", "preserve")
+
+    def __init__(
+        self, element, path: tuple[int, ...], keep: bool, preserve: bool
+    ) -> None:
+        self.element = element
+        self.path = path
+        self.chars = 0
+        self.children = 0
+        # The last processed child, which tail may be not parsed yet
+        self.pending = None
+        # Children are kept while the title candidate text is needed
+        self.keep = keep
+        self.preserve = preserve
+
+    def settle(self) -> None:
+        """
+        Counts the pending child with its tail and removes it from the tree.
+        """
+        if self.pending is None:
+            return
+        child, child_chars = self.pending
+        self.chars += child_chars + get_text_length(child.tail, self.preserve)
+        if not self.keep:
+            self.element.remove(child)
+        self.pending = None
+
+
+def open_source(source: StreamSource):
+    """
+    Returns source ready for the next parsing pass.
+    """
+    if isinstance(source, bytes):
+        return BytesIO(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if not source.seekable():
+        raise ValueError("Streaming extraction requires a seekable stream.")
+    source.seek(0)
+    return source
+
+
+def get_tag(element) -> Union[str, None]:
+    """
+    Returns lowercased tag name or None for comments and processing instructions.
+    """
+    return element.tag.lower() if isinstance(element.tag, str) else None
+
+
+class _TitleLocator:
+    """
+    State of the first pass: open elements, the title and the chain of its ancestors.
+    Title is picked from the title tag and the title meta the same way as in Articulo.
+    Meta may come after the first matching element, so the title is resolved again
+    on every title meta and the match is dropped if it does not fit the new title.
+    """
+
+    def __init__(self) -> None:
+        self.stack: list[_Frame] = []
+        # Open ancestors of the matched title element
+        self.chain: list[_Frame] = []
+        self.chain_chars: dict[tuple[int, ...], int] = {}
+        self.title_tag_text: Union[str, None] = None
+        self.title_meta: dict[str, str] = {}
+        self.title: Union[str, None] = None
+        self.title_text: Union[str, None] = None
+
+    def start(self, element) -> None:
+        """
+        Opens the element.
+        """
+        parent = self.stack[-1] if self.stack else None
+        if parent is not None:
+            parent.settle()
+            parent.children += 1
+        path = (*parent.path, parent.children - 1) if parent else ()
+        tag = get_tag(element)
+        keep = (parent is not None and parent.keep) or tag in title_candidate_tags
+        preserve = (parent is not None and parent.preserve) or (
+            tag in preserve_whitespace_tags
+        )
+        self.stack.append(_Frame(element, path, keep, preserve))
+
+    def skip(self, element) -> None:
+        """
+        Counts the comment or processing instruction as a child without text.
+        """
+        if self.stack:
+            self.stack[-1].settle()
+            self.stack[-1].pending = (element, 0)
+
+    def end(self, element) -> None:
+        """
+        Closes the element, counts its text and checks if it is the title.
+        """
+        frame = self.stack.pop()
+        frame.settle()
+        tag = get_tag(element)
+        chars = frame.chars
+        if tag not in non_text_tags:
+            chars += get_text_length(element.text, frame.preserve)
+
+        if tag == "title" and self.title_tag_text is None:
+            self.title_tag_text = "".join(element.itertext())
+            self.__resolve_title()
+        elif tag == "meta":
+            self.__read_meta(element)
+        elif tag in title_candidate_tags and self.title_text is None and chars > 0:
+            self.__match(element)
+
+        # Depth of the frame is the length of its path
+        depth = len(frame.path)
+        if depth < len(self.chain) and self.chain[depth] is frame:
+            self.chain_chars[frame.path] = chars
+
+        if not (self.stack and self.stack[-1].keep):
+            # Children are counted already, so they are not needed anymore
+            del element[:]
+        if self.stack:
+            self.stack[-1].pending = (element, chars)
+
+    def result(self) -> tuple[str, list[tuple[tuple[int, ...], str, int]]]:
+        """
+        Returns the title and the chain of title ancestors as (path, tag, chars) tuples.
+        """
+        if self.title_tag_text is None:
+            raise NoTitleException("stream")
+
+        if self.title_text is None:
+            # Without matching element the title tag is the reference point
+            return clean_title_text(self.title_tag_text), []
+        return clean_title_text(self.title_text), [
+            (ancestor.path, get_tag(ancestor.element), self.chain_chars[ancestor.path])
+            for ancestor in self.chain
+        ]
+
+    def __read_meta(self, element) -> None:
+        content = element.get("content")
+        if content is None:
+            return
+        for key in ("property", "name"):
+            name = element.get(key)
+            if name in title_meta_names and f"{key}:{name}" not in self.title_meta:
+                self.title_meta[f"{key}:{name}"] = content
+                self.__resolve_title()
+
+    def __resolve_title(self) -> None:
+        if self.title_tag_text is None:
+            return
+        self.title = clean_title_text(self.__pick_title())
+        if self.title_text is not None and not self.__fits(self.title_text):
+            self.title_text = None
+            self.chain = []
+            self.chain_chars = {}
+
+    def __pick_title(self) -> str:
+        for key in ("property", "name"):
+            for name in title_meta_names:
+                if f"{key}:{name}" in self.title_meta:
+                    return self.title_meta[f"{key}:{name}"]
+        return self.title_tag_text or ""
+
+    def __match(self, element) -> None:
+        candidate_text = "".join(element.itertext())
+        if candidate_text.strip() and self.__fits(candidate_text):
+            self.title_text = candidate_text
+            self.chain = list(self.stack)
+
+    def __fits(self, candidate_text: str) -> bool:
+        candidate = clean_title_text(candidate_text)
+        return self.title is not None and (
+            self.title in candidate or candidate in self.title
+        )
+
+
+class StreamExtractor:  # pylint: disable=too-few-public-methods
+    """
+    Extracts article content from a document too big to keep in memory as a whole.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        encoding: str = "utf-8",
+        sanitizer_policy: Union[SanitizerPolicy, None] = None,
+    ) -> None:
+        """
+        Params:
+        :threshold (optional): Max information loss coefficient, the same as for Articulo.
+        :encoding (optional): Document encoding. Default is utf-8.
+        :sanitizer_policy (optional): Rules for the article content cleaning.
+        """
+        self.threshold = threshold
+        self.encoding = encoding
+        self.sanitizer_policy = sanitizer_policy
+
+    def extract(self, source: StreamSource) -> StreamResult:
+        """
+        Extracts title and content of the document.
+
+        Params:
+        :source: Path to the document, its bytes or a seekable binary stream.
+        """
+        title, chain = self.__locate(source)
+        container_path = self.__choose_container(chain)
+        if container_path is None:
+            return StreamResult(title, None, None)
+
+        markup = self.__read_container(source, container_path)
+        container_tag = next(tag for path, tag, _ in chain if path == container_path)
+        content = BeautifulSoup(markup, features="lxml").find(container_tag)
+        if content is None:
+            return StreamResult(title, None, None)
+
+        sanitized = sanitize_html(content, self.sanitizer_policy)
+        return StreamResult(title, str(sanitized), sanitized.text)
+
+    def __parse(self, source: StreamSource):
+        return etree.iterparse(
+            open_source(source),
+            events=("start", "end", "comment", "pi"),
+            html=True,
+            encoding=self.encoding,
+            huge_tree=True,
+        )
+
+    def __locate(self, source: StreamSource):
+        """
+        First pass: finds the title element and counts text of its ancestors.
+        Returns the title and the chain of title ancestors as (path, tag, chars) tuples.
+        """
+        locator = _TitleLocator()
+        for event, element in self.__parse(source):
+            if event == "start":
+                locator.start(element)
+            elif event in ("comment", "pi"):
+                locator.skip(element)
+            else:
+                locator.end(element)
+        return locator.result()
+
+    def __choose_container(self, chain) -> Union[tuple[int, ...], None]:
+        """
+        Applies the information loss rule to the chain of title ancestors
+        starting from the body, the same way the DOM search does.
+        """
+        body_index = next(
+            (index for index, (_, tag, _) in enumerate(chain) if tag == "body"), None
+        )
+        if body_index is None:
+            return None
+
+        for index in range(body_index, len(chain)):
+            path, _, parent_chars = chain[index]
+            if index == len(chain) - 1:
+                return path
+            child_chars = chain[index + 1][2]
+            information_loss_coeff = 1.0 - (child_chars / parent_chars)
+            if information_loss_coeff > self.threshold:
+                return path
+        return None
+
+    def __read_container(self, source: StreamSource, container_path) -> str:
+        """
+        Second pass: keeps only the container subtree and serializes it.
+        Parsing stops right after the container is closed.
+        """
+        stack: list[list] = []
+        capture_depth = None
+
+        for event, element in self.__parse(source):
+            if event == "start":
+                if stack:
+                    stack[-1][1] += 1
+                    path = (*stack[-1][2], stack[-1][1] - 1)
+                else:
+                    path = ()
+                stack.append([element, 0, path])
+                if capture_depth is None and path == container_path:
+                    capture_depth = len(stack)
+                continue
+
+            if event != "end":
+                continue
+
+            depth = len(stack)
+            stack.pop()
+            if capture_depth is not None and depth == capture_depth:
+                return etree.tostring(
+                    element, method="html", encoding="unicode", with_tail=False
+                )
+            if capture_depth is None:
+                del element[:]
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+
+        return ""
@@ -0,0 +1,101 @@
+"""
+This file contains the lookup of the article in the structured data.
+Publishers often embed the whole article into JSON-LD, so the article
+can be read from the ld+json scripts found by a plain text scan
+without parsing the document and searching for the content.
+"""
+
+import json
+import re
+from html import unescape
+from typing import Iterator, NamedTuple, Union
+
+json_ld_script_re = re.compile(
+    r"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Tags ending a line of the article body
+line_break_re = re.compile(
+    r"<br\s*/?>|</(?:p|div|li|h[1-6]|blockquote|pre|tr)\s*>", re.IGNORECASE
+)
+tag_re = re.compile(r"<[^>]*>")
+blank_lines_re = re.compile(r"\n\s*\n\s*")
+
+# Endings of the article body cut by the publisher
+truncated_body_endings = ("...", "…")
+
+
+class JsonLdArticle(NamedTuple):
+    """
+    Article found in JSON-LD.
+    """
+
+    headline: str
+    body: str
+
+
+def iter_json_ld_items(html: str) -> Iterator[dict]:
+    """
+    Yields all the JSON-LD objects of the document including @graph members.
+    Scripts which are not valid json are skipped.
+    """
+    for match in json_ld_script_re.finditer(html):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+
+        pending = [data]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, list):
+                pending.extend(reversed(item))
+            elif isinstance(item, dict):
+                yield item
+                if isinstance(item.get("@graph"), list):
+                    pending.extend(reversed(item["@graph"]))
+
+
+def get_plain_text(value: str) -> str:
+    """
+    Returns the text of the JSON-LD value without tags and HTML entities.
+    Publishers often put the article markup into articleBody as is,
+    so line breaking tags are kept as new lines.
+    """
+    if "<" in value:
+        value = tag_re.sub("", line_break_re.sub("\n", value))
+        value = blank_lines_re.sub("\n", value)
+    if "&" in value:
+        value = unescape(value)
+    return value.strip()
+
+
+def is_complete_article(item: dict) -> bool:
+    """
+    Checks if the JSON-LD object has a headline and an article body
+    and the article is not marked as paywalled.
+    """
+    headline, body = item.get("headline"), item.get("articleBody")
+    if not isinstance(headline, str) or not headline.strip():
+        return False
+    if not isinstance(body, str) or not body.strip():
+        return False
+    return item.get("isAccessibleForFree") not in (False, "False", "false")
+
+
+def find_json_ld_article(html: str) -> Union[JsonLdArticle, None]:
+    """
+    Returns the first complete article found in JSON-LD of the document or None.
+    Headline and body are returned as plain text.
+    Bodies of paywalled articles are usually cut, so the cut ones are not trusted.
+    """
+    for item in iter_json_ld_items(html):
+        if not is_complete_article(item):
+            continue
+        headline = get_plain_text(item["headline"])
+        body = get_plain_text(item["articleBody"])
+        if not headline or not body or body.endswith(truncated_body_endings):
+            continue
+        return JsonLdArticle(headline, body)
+    return None
@@ -0,0 +1,154 @@
+"""
+This file contains the cache of the article content locations.
+Pages of the same site usually share one template,
+so the content container found on one page is likely to be
+at the same place on the other pages of the site.
+"""
+
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Union
+
+from bs4 import Tag
+
+PathStep = tuple[str, str, tuple[str, ...]]
+
+
+def get_path_step(element: Tag) -> PathStep:
+    """
+    Returns structural description of the element: tag name, id and classes.
+    """
+    return (element.name, element.get("id", ""), tuple(element.get("class", [])))
+
+
+def get_element_path(element: Tag, root: Tag) -> Union[list[PathStep], None]:
+    """
+    Returns the chain of steps leading from the root to the element.
+    Returns None if the element is not inside the root.
+    """
+    path = []
+    node = element
+    while node is not root:
+        if node is None:
+            return None
+        path.append(get_path_step(node))
+        node = node.parent
+    path.reverse()
+    return path
+
+
+def find_by_path(root: Tag, path: list[PathStep]) -> Union[Tag, None]:
+    """
+    Looks for the element by the chain of steps starting from the root.
+    """
+    node = root
+    for step in path:
+        node = next(
+            (
+                child
+                for child in node.children
+                if isinstance(child, Tag) and get_path_step(child) == step
+            ),
+            None,
+        )
+        if node is None:
+            return None
+    return node
+
+
+class TemplateCache:
+    """
+    LRU cache of the article content paths by site domain.
+    Cache is safe to share between threads.
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        """
+        Params:
+        :max_size (optional): Max number of domains to remember. Default is 1000.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__paths: OrderedDict[str, list[PathStep]] = OrderedDict()
+        # Lookups reorder the paths, so even reads are done under the lock
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__paths)
+
+    def __contains__(self, domain: str) -> bool:
+        return domain in self.__paths
+
+    def get(self, domain: str) -> Union[list[PathStep], None]:
+        """
+        Returns content path remembered for the domain.
+        """
+        with self.__lock:
+            path = self.__paths.get(domain)
+            if path is not None:
+                self.__paths.move_to_end(domain)
+            return path
+
+    def put(self, domain: str, path: list[PathStep]) -> None:
+        """
+        Remembers content path for the domain.
+        The least recently used domain is evicted when the cache is full.
+        """
+        with self.__lock:
+            self.__paths[domain] = path
+            self.__paths.move_to_end(domain)
+            while len(self.__paths) > self.max_size:
+                self.__paths.popitem(last=False)
+
+    def discard(self, domain: str) -> None:
+        """
+        Forgets content path for the domain.
+        """
+        with self.__lock:
+            self.__paths.pop(domain, None)
+
+    def record_hit(self) -> None:
+        """
+        Counts successful usage of a remembered path.
+        """
+        with self.__lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """
+        Counts a lookup that required the full content search.
+        """
+        with self.__lock:
+            self.misses += 1
+
+    def save(self, file_path: str) -> None:
+        """
+        Saves remembered paths to the json file.
+        """
+        with self.__lock:
+            data = [
+                [domain, [list(step) for step in path]]
+                for domain, path in self.__paths.items()
+            ]
+        with open(file_path, "w", encoding="utf8") as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, file_path: str, max_size: int = 1000) -> "TemplateCache":
+        """
+        Creates cache from the json file saved before.
+        """
+        cache = cls(max_size)
+        with open(file_path, "r", encoding="utf8") as file:
+            data = json.load(file)
+        for domain, path in data:
+            cache.put(
+                domain,
+                [
+                    (name, element_id, tuple(classes))
+                    for name, element_id, classes in path
+                ],
+            )
+        return cache
@@ -0,0 +1,72 @@
+"""
+This file contains the evaluation of several thresholds at once.
+Text lengths of the elements are known after the single counting pass,
+so the information loss rule is checked for all the thresholds
+in one walk over the ancestors of the article title.
+"""
+
+from typing import Iterable, NamedTuple, Union
+
+from bs4 import Tag
+
+from .stats import TextStats
+
+
+class ThresholdEvaluation(NamedTuple):
+    """
+    Content container chosen with the threshold and length of its text.
+    Container is None if there is no content found.
+    """
+
+    threshold: float
+    content: Union[Tag, None]
+    chars: int
+
+
+def evaluate_thresholds(
+    chain: list[Tag],
+    stats: TextStats,
+    thresholds: Iterable[float],
+    max_depth: int,
+) -> list[ThresholdEvaluation]:
+    """
+    Chooses the content container for every threshold the same way
+    the best parent search does. Results are in the order of the thresholds.
+    Thresholds that are not resolved within max depth get no content,
+    the ones resolved before it keep their containers.
+
+    Params:
+    :chain: Ancestors of the title from the body down to the title's parent.
+    :stats: Text statistics of the document.
+    :thresholds: Max information loss coefficients to evaluate.
+    :max_depth: Max number of the chain elements to check.
+    """
+    thresholds = list(thresholds)
+    chosen: dict[float, Union[Tag, None]] = {}
+    # Thresholds in descending order, so the smallest pending one is the last
+    pending = sorted(set(thresholds), reverse=True)
+
+    for depth, parent in enumerate(chain):
+        if not pending:
+            break
+        if depth == len(chain) - 1:
+            # Title's parent is the best parent for all the remaining thresholds
+            chosen.update((threshold, parent) for threshold in pending)
+            pending = []
+            break
+        if depth >= max_depth:
+            # Best parent search would give up here, so the pending thresholds have no content
+            break
+
+        information_loss_coeff = 1.0 - (
+            stats.chars(chain[depth + 1]) / stats.chars(parent)
+        )
+        while pending and information_loss_coeff > pending[-1]:
+            chosen[pending.pop()] = parent
+
+    evaluations = []
+    for threshold in thresholds:
+        content = chosen.get(threshold)
+        chars = stats.chars(content) if content is not None else 0
+        evaluations.append(ThresholdEvaluation(threshold, content, chars))
+    return evaluations
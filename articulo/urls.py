@@ -0,0 +1,156 @@
+"""
+This file contains the resolver of the links found in the article html,
+the helpers recognizing pages of a multi-page article
+and the normalization of the article links.
+"""
+
+import re
+from typing import Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+from bs4 import BeautifulSoup
+
+from articulo.utils import is_url
+
+# Query parameters holding the page number of a multi-page article
+page_query_keys = ("page", "p", "pg")
+
+page_path_re = re.compile(r"/page/(\d+)/?$", re.IGNORECASE)
+
+# Query parameters added by ad and analytics tools, they never change the page
+tracking_query_keys = (
+    "fbclid",
+    "gclid",
+    "dclid",
+    "yclid",
+    "msclkid",
+    "igshid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+)
+tracking_query_prefixes = ("utm_",)
+
+# Query parameters and path suffix of AMP versions of the pages
+amp_query_keys = ("amp", "outputtype")
+amp_path_re = re.compile(r"/amp/?$", re.IGNORECASE)
+
+default_ports = {"http": 80, "https": 443}
+
+
+def get_page_number(url: str) -> Union[int, None]:
+    """
+    Returns page number of a multi-page article page, e.g. 2 for ?page=2 or /page/2.
+    """
+    parts = urlsplit(url)
+    for key, value in parse_qsl(parts.query):
+        if key.lower() in page_query_keys and value.isdigit():
+            return int(value)
+    match = page_path_re.search(parts.path)
+    return int(match.group(1)) if match else None
+
+
+def get_article_url(url: str) -> str:
+    """
+    Returns url of the article without the page number and the fragment,
+    so all the pages of the article have the same one.
+    """
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in page_query_keys
+    ]
+    path = page_path_re.sub("", parts.path) or "/"
+    return urlunsplit((parts.scheme, parts.netloc, path, urlencode(query), ""))
+
+
+def is_ignored_query_key(key: str) -> bool:
+    """
+    Checks if the query parameter does not change the article.
+    """
+    key = key.lower()
+    return (
+        key in tracking_query_keys
+        or key in amp_query_keys
+        or key.startswith(tracking_query_prefixes)
+    )
+
+
+def normalize_url(url: str) -> str:
+    """
+    Returns normalized url, so variants of the same article link have the same one:
+    scheme is https, host is lowercased, default port, fragment, trailing slash,
+    AMP suffix and tracking parameters are removed, query parameters are sorted.
+    Normalized url is a key of the article, it is not guaranteed to be loadable.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != default_ports.get(scheme):
+        netloc = f"{netloc}:{port}"
+    if scheme == "http":
+        scheme = "https"
+
+    path = amp_path_re.sub("", parts.path).rstrip("/") or "/"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not is_ignored_query_key(key)
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+class UrlResolver:
+    """
+    Makes absolute links from relative ones using RFC 3986 joining.
+    Base url is defined once per document: <base href> of the document
+    resolved against the page url. Resolved links are memoized.
+    """
+
+    def __init__(
+        self, page_url: Union[str, None], base_href: Union[str, None] = None
+    ) -> None:
+        """
+        Params:
+        :page_url: Url of the page or None if page was not loaded by url.
+        :base_href (optional): Value of the document's <base href>.
+        """
+        base_url = page_url if page_url is not None and is_url(page_url) else None
+        if base_href:
+            base_href = base_href.strip()
+            if base_url is not None:
+                base_url = urljoin(base_url, base_href)
+            elif is_url(base_href):
+                base_url = base_href
+
+        self.base_url = base_url
+        self.__resolved: dict[str, str] = {}
+
+    @classmethod
+    def from_document(
+        cls, page_url: Union[str, None], soup: BeautifulSoup
+    ) -> "UrlResolver":
+        """
+        Creates resolver for the parsed document.
+        """
+        base = soup.find("base", href=True)
+        return cls(page_url, base.get("href") if base is not None else None)
+
+    def resolve(self, link: str) -> str:
+        """
+        Returns absolute link.
+        Link is returned as is if there is no base url to resolve it against.
+        """
+        if self.base_url is None:
+            return link
+
+        resolved = self.__resolved.get(link)
+        if resolved is None:
+            resolved = urljoin(self.base_url, link.strip())
+            self.__resolved[link] = resolved
+        return resolved
@@ -1,35 +1,30 @@
 """
 This file contains the utility functions that are used in the main module.
 """
+
+import re
+from typing import Union
 from urllib.parse import urlparse
 
-from bs4 import Tag, Comment
+from bs4 import Tag
+
+from articulo.budget import BudgetMeter
+from articulo.sanitizer import SanitizerPolicy, default_policy
 
-from articulo.constants import tags_to_completely_remove, important_content_tags
+title_trailing_lines_re = re.compile(r"\n+.+")
 
 
-def sanitize_html(content: Tag) -> Tag:
+def sanitize_html(
+    content: Tag,
+    policy: Union[SanitizerPolicy, None] = None,
+    meter: Union[BudgetMeter, None] = None,
+) -> Tag:
     """
     This function will sanitize the HTML content by removing all the unnecessary tags and comments.
+    Default policy is used if there is no policy provided.
+    Visited nodes are charged to the budget meter if it is provided.
     """
-    # Filtering all the non-important tags.
-    for tag in content.find_all(True):  # find_all(True) will match any tag
-        if tag.decomposed:
-            continue
-        # First, we need to remove all the tags that should be completely removed
-        if tag.name in tags_to_completely_remove:
-            tag.decompose()
-        # Then, we need to unwrap all the tags that has important content
-        # but not needed by themselves
-        elif tag.name not in important_content_tags:
-            tag.unwrap()
-
-    # Removing all the comments
-    comments = content.find_all(string=lambda text: isinstance(text, Comment))
-    for comment in comments:
-        comment.extract()
-
-    return content
+    return (policy or default_policy).sanitize(content, meter)
 
 
 def get_dublincore_element(data, key):
@@ -73,3 +68,11 @@ def is_url(maybe_url):
         return all([result.scheme, result.netloc])
     except AttributeError:
         return False
+
+
+def clean_title_text(text: str) -> str:
+    """
+    Cleans title text from special and newline characters
+    """
+    nbsp = "\xa0"
+    return title_trailing_lines_re.sub("", text.strip()).replace(nbsp, " ").strip()
@@ -0,0 +1,115 @@
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo, Extractor
+from articulo.head import DocumentHead
+from articulo.urls import UrlResolver
+from .utils.helpers import read_html_text
+
+url = "https://info.cern.ch/story"
+
+
+def build_page(links: str) -> str:
+    return f"""
+    <html>
+        <head>
+            <title>http://info.cern.ch</title>
+            {links}
+            <link rel="icon" href="/favicon.ico">
+            <meta property="og:image" content="img/preview.png">
+        </head>
+        <body>
+            <h1>http://info.cern.ch - home of the first website</h1>
+            <p>Heavy version of the page.</p>
+        </body>
+    </html>
+    """
+
+
+def find_alternate(links: str):
+    soup = BeautifulSoup(build_page(links), features="lxml")
+    return DocumentHead(soup, UrlResolver(url).resolve).find_light_alternate()
+
+
+class TestFindLightAlternate:
+    def test_prefers_amp(self):
+        links = """
+        <link rel="alternate" media="print" href="/print/story">
+        <link rel="amphtml" href="/amp/story">
+        """
+        assert find_alternate(links) == "https://info.cern.ch/amp/story"
+
+    def test_print_version(self):
+        links = """
+        <link rel="alternate" hreflang="fr" href="/fr/story">
+        <link rel="alternate" media="only print" href="/print/story">
+        """
+        assert find_alternate(links) == "https://info.cern.ch/print/story"
+
+    @pytest.mark.parametrize(
+        "links",
+        [
+            "",
+            '<link rel="alternate" hreflang="fr" href="/fr/story">',
+            '<link rel="amphtml">',
+        ],
+    )
+    def test_no_alternate(self, links):
+        assert find_alternate(links) is None
+
+
+class TestPreferAlternate:
+    @pytest.fixture
+    def amp_page(self, requests_mock: MockerCore):
+        requests_mock.get(
+            url, text=build_page('<link rel="amphtml" href="/amp/story">')
+        )
+        return requests_mock.get(
+            "https://info.cern.ch/amp/story", text=read_html_text("article_simple.html")
+        )
+
+    def test_extracts_alternate(self, amp_page):
+        article = Articulo(url, prefer_alternate=True)
+        expected = Articulo(read_html_text("article_simple.html"))
+        assert article.text == expected.text
+        assert article.source_url == "https://info.cern.ch/amp/story"
+        assert amp_page.call_count == 1
+
+    def test_metadata_of_original_page(self, amp_page):
+        article = Articulo(url, prefer_alternate=True)
+        assert article.icon == "https://info.cern.ch/favicon.ico"
+        assert article.preview == "https://info.cern.ch/img/preview.png"
+
+    def test_loads_only_head_of_original_page(
+        self, requests_mock: MockerCore, amp_page
+    ):
+        article = Articulo(url, prefer_alternate=True)
+        assert article.text is not None
+        original_requests = [
+            request for request in requests_mock.request_history if request.url == url
+        ]
+        assert len(original_requests) == 1
+        assert original_requests[0].headers["Range"].startswith("bytes=0-")
+
+    def test_no_alternate(self, requests_mock: MockerCore):
+        requests_mock.get(url, text=build_page(""))
+        article = Articulo(url, prefer_alternate=True)
+        assert "Heavy version of the page." in article.text
+        assert article.source_url == url
+        assert article.icon == "https://info.cern.ch/favicon.ico"
+
+    def test_disabled_by_default(self, amp_page):
+        article = Articulo(url)
+        assert "Heavy version of the page." in article.text
+        assert article.source_url == url
+        assert amp_page.call_count == 0
+
+    def test_extractor(self, amp_page):
+        article = Extractor(prefer_alternate=True)(url)
+        assert article.source_url == "https://info.cern.ch/amp/story"
+
+    def test_content(self):
+        article = Articulo(read_html_text("article_simple.html"), prefer_alternate=True)
+        assert article.source_url is None
+        assert article.text is not None
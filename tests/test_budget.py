@@ -0,0 +1,143 @@
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo, Extractor
+from articulo.budget import Budget, BudgetMeter, get_utf8_size
+from articulo.exceptions import BudgetExceededException, MaxIterations
+from articulo.metrics import Metrics
+from articulo.stats import TextStats
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def html() -> str:
+    return read_html_text("article_simple.html")
+
+
+def build_deep_html(depth: int) -> str:
+    return (
+        "<html><head><title>Title</title></head><body>"
+        + "<div>" * depth
+        + "<h1>Title</h1><p>Text</p>"
+        + "</div>" * depth
+        + "</body></html>"
+    )
+
+
+class TestBudgetMeter:
+    def test_charges_resources(self):
+        meter = BudgetMeter(Budget(max_nodes=10))
+        meter.charge("nodes", 6)
+        meter.charge("nodes", 4)
+        assert meter.spent("nodes") == 10
+        with pytest.raises(BudgetExceededException) as exc_info:
+            meter.charge("nodes", 1)
+        assert exc_info.value.resource == "nodes"
+        assert exc_info.value.limit == 10
+
+    def test_unlimited_resource(self):
+        meter = BudgetMeter(Budget())
+        meter.charge("bytes", 10**9)
+        assert meter.spent("bytes") == 10**9
+
+    @pytest.mark.parametrize(
+        ("text", "limit", "expected"),
+        [
+            ("Text", None, 4),
+            ("Тест", None, 8),
+            ("Тест" * 100_000, None, 800_000),
+            ("Тест" * 100_000, 100, 400_000),
+        ],
+    )
+    def test_utf8_size(self, text, limit, expected):
+        assert get_utf8_size(text, limit) == expected
+
+    def test_stops_text_stats_at_max_nodes(self):
+        html = "<div>" + "<p>Text</p>" * 100_000 + "</div>"
+        soup = BeautifulSoup(html, features="lxml")
+        meter = BudgetMeter(Budget(max_nodes=2000))
+        with pytest.raises(BudgetExceededException) as exc_info:
+            TextStats(soup, meter)
+        assert exc_info.value.resource == "nodes"
+        assert meter.spent("nodes") < 10_000
+
+    def test_charges_all_text_stats_nodes(self, html):
+        soup = BeautifulSoup(html, features="lxml")
+        meter = BudgetMeter(Budget())
+        stats = TextStats(soup, meter)
+        assert meter.spent("nodes") == len(stats)
+
+    def test_collects_timings(self):
+        metrics = Metrics()
+        meter = BudgetMeter(Budget(deadline=60))
+        with meter.measure("parse", metrics):
+            pass
+        assert set(meter.timings) == {"parse"}
+        assert metrics.get("parse.count") == 1
+        assert meter.elapsed > 0
+
+    def test_deadline_carries_partial_timings(self):
+        meter = BudgetMeter(Budget(deadline=0))
+        with pytest.raises(BudgetExceededException) as exc_info:
+            with meter.measure("fetch"):
+                pass
+        assert exc_info.value.resource == "deadline"
+        assert set(exc_info.value.timings) == {"fetch"}
+
+
+class TestArticleBudget:
+    def test_generous_budget(self, html):
+        budget = Budget(
+            deadline=60, max_nodes=1000, max_bytes=10**6, max_sanitizer_ops=1000
+        )
+        assert Articulo(html, budget=budget).text == Articulo(html).text
+
+    def test_deadline(self, html):
+        with pytest.raises(BudgetExceededException) as exc_info:
+            Articulo(html, budget=Budget(deadline=0)).text
+        assert exc_info.value.resource == "deadline"
+        assert "content" in exc_info.value.timings
+
+    def test_max_bytes(self, html):
+        with pytest.raises(BudgetExceededException) as exc_info:
+            Articulo(html, budget=Budget(max_bytes=100)).text
+        assert exc_info.value.resource == "bytes"
+
+    def test_max_bytes_while_loading(self, requests_mock: MockerCore, html):
+        url = "https://info.cern.ch/"
+        requests_mock.get(url, text=html)
+        with pytest.raises(BudgetExceededException) as exc_info:
+            Articulo(url, budget=Budget(max_bytes=100)).text
+        assert exc_info.value.resource == "bytes"
+        assert "fetch" in exc_info.value.timings
+
+    def test_max_nodes(self, html):
+        with pytest.raises(BudgetExceededException) as exc_info:
+            Articulo(html, budget=Budget(max_nodes=5)).text
+        assert exc_info.value.resource == "nodes"
+
+    def test_max_sanitizer_ops(self, html):
+        with pytest.raises(BudgetExceededException) as exc_info:
+            Articulo(html, budget=Budget(max_sanitizer_ops=5)).text
+        assert exc_info.value.resource == "sanitizer_ops"
+
+    def test_max_depth(self):
+        html = build_deep_html(20)
+        assert Articulo(html).text is not None
+        with pytest.raises(MaxIterations):
+            Articulo(html, budget=Budget(max_depth=10)).text
+
+    def test_not_swallowed_by_fallback(self, html):
+        article = Articulo(html, strategy="auto", budget=Budget(max_nodes=5))
+        with pytest.raises(BudgetExceededException):
+            article.text
+
+    def test_is_max_iterations(self, html):
+        with pytest.raises(MaxIterations):
+            Articulo(html, budget=Budget(max_nodes=5)).text
+
+    def test_extractor(self, html):
+        extract = Extractor(budget=Budget(max_nodes=5))
+        with pytest.raises(BudgetExceededException):
+            extract(html).text
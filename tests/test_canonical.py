@@ -0,0 +1,139 @@
+import pytest
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.canonical import CanonicalMemo
+from articulo.urls import normalize_url
+from .utils.helpers import read_html_text
+
+url = "https://info.cern.ch/story"
+
+
+def build_page(head: str) -> str:
+    return f"""
+    <html>
+        <head><title>http://info.cern.ch</title>{head}</head>
+        <body><h1>http://info.cern.ch</h1><p>Story.</p></body>
+    </html>
+    """
+
+
+class TestNormalizeUrl:
+    @pytest.mark.parametrize(
+        "variant",
+        [
+            "https://info.cern.ch/story",
+            "http://info.cern.ch/story",
+            "HTTPS://Info.CERN.ch:443/story/",
+            "https://info.cern.ch/story#comments",
+            "https://info.cern.ch/story?utm_source=rss&utm_medium=feed&fbclid=1",
+            "https://info.cern.ch/story/amp",
+            "https://info.cern.ch/story?amp=1",
+        ],
+    )
+    def test_normalizes_variants(self, variant):
+        assert normalize_url(variant) == "https://info.cern.ch/story"
+
+    def test_keeps_meaningful_query(self):
+        assert normalize_url("https://info.cern.ch/?b=2&utm_term=x&a=1") == (
+            "https://info.cern.ch/?a=1&b=2"
+        )
+
+    def test_keeps_custom_port(self):
+        assert (
+            normalize_url("http://info.cern.ch:8080/") == "https://info.cern.ch:8080/"
+        )
+
+
+class TestCanonicalUrl:
+    @pytest.mark.parametrize(
+        "head, expected",
+        [
+            ('<link rel="canonical" href="/story">', url),
+            (
+                '<meta property="og:url" content="https://info.cern.ch/og">',
+                "https://info.cern.ch/og",
+            ),
+            (
+                '<meta property="og:url" content="/og"><link rel="canonical" href="/story">',
+                url,
+            ),
+            ("", None),
+        ],
+    )
+    def test_reads_canonical_url(self, requests_mock: MockerCore, head, expected):
+        requests_mock.get(url + "/amp", text=build_page(head))
+        assert Articulo(url + "/amp").canonical_url == expected
+
+    def test_records_redirects(self, requests_mock: MockerCore):
+        requests_mock.get(
+            "https://cern.ch/s", status_code=301, headers={"Location": url}
+        )
+        requests_mock.get(url, text=build_page(""))
+        article = Articulo("https://cern.ch/s")
+        assert article.redirects == ["https://cern.ch/s", url]
+
+    def test_no_redirects_for_content(self):
+        assert Articulo(read_html_text("article_simple.html")).redirects == []
+
+    def test_content_with_link(self):
+        article = Articulo(
+            build_page('<link rel="canonical" href="/story">'),
+            url="https://cern.ch/s",
+            redirects=["https://cern.ch/s", url + "/amp"],
+        )
+        assert article.source_url == "https://cern.ch/s"
+        assert article.redirects == ["https://cern.ch/s", url + "/amp"]
+        assert article.canonical_url == url
+
+
+class TestCanonicalMemo:
+    def test_maps_links_to_canonical(self):
+        memo = CanonicalMemo()
+        memo.add(["https://cern.ch/s"], url)
+        assert memo.find("https://cern.ch/s") == url
+        assert memo.find(url) == url
+        assert memo.find("http://info.cern.ch/story") is None
+
+    def test_normalizes_links(self):
+        memo = CanonicalMemo(normalize=True)
+        memo.add([], url)
+        assert memo.find("http://info.cern.ch/story/?utm_source=rss") == url
+
+    def test_evicts_least_recently_used(self):
+        memo = CanonicalMemo(max_size=2)
+        memo.add([], "https://info.cern.ch/1")
+        memo.add([], "https://info.cern.ch/2")
+        memo.find("https://info.cern.ch/1")
+        memo.add([], "https://info.cern.ch/3")
+        assert len(memo) == 2
+        assert memo.find("https://info.cern.ch/1") is not None
+        assert memo.find("https://info.cern.ch/2") is None
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            CanonicalMemo(max_size=0)
+
+    def test_adds_article(self, requests_mock: MockerCore):
+        requests_mock.get(
+            "https://cern.ch/s", status_code=301, headers={"Location": url + "/amp"}
+        )
+        requests_mock.get(
+            url + "/amp", text=build_page('<link rel="canonical" href="/story">')
+        )
+        memo = CanonicalMemo()
+        article = Articulo("https://cern.ch/s")
+        assert memo.add_article("https://cern.ch/s", article) == url
+        assert memo.find("https://cern.ch/s") == url
+        assert memo.find(url + "/amp") == url
+        assert memo.find(url) == url
+
+    def test_uses_final_link_without_canonical(self, requests_mock: MockerCore):
+        requests_mock.get(
+            "https://cern.ch/s", status_code=302, headers={"Location": url}
+        )
+        requests_mock.get(url, text=build_page(""))
+        memo = CanonicalMemo()
+        assert (
+            memo.add_article("https://cern.ch/s", Articulo("https://cern.ch/s")) == url
+        )
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, get_ident
+
+import pytest
+from requests_mock import MockerCore
+
+from articulo import Articulo, Extractor
+from articulo.digest import ContentDigest
+from articulo.fingerprint import DuplicateIndex
+from articulo.locking import locked_cached_property
+from articulo.metrics import Metrics
+from articulo.template_cache import TemplateCache
+from .utils.helpers import read_html_text
+
+threads_count = 8
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def html() -> str:
+    return read_html_text("article_with_deeply_nested_content.html")
+
+
+def run_concurrently(func, count: int = threads_count) -> list:
+    """
+    Runs the function in several threads started at the same moment.
+    """
+    barrier = Barrier(count)
+
+    def run():
+        barrier.wait()
+        return func()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(run) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+class SlowValue:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @locked_cached_property
+    def value(self):
+        """
+        Slow value.
+        """
+        self.calls += 1
+        time.sleep(0.05)
+        return get_ident()
+
+    @locked_cached_property
+    def failing(self):
+        self.calls += 1
+        raise ValueError("Not ready")
+
+
+class TestLockedCachedProperty:
+    def test_computes_value_once(self):
+        instance = SlowValue()
+        values = run_concurrently(lambda: instance.value)
+        assert instance.calls == 1
+        assert len(set(values)) == 1
+
+    def test_does_not_cache_errors(self):
+        instance = SlowValue()
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                instance.failing
+        assert instance.calls == 2
+
+    def test_instances_do_not_share_values(self):
+        first, second = SlowValue(), SlowValue()
+        run_concurrently(lambda: (first.value, second.value))
+        assert first.calls == 1
+        assert second.calls == 1
+
+    def test_keeps_docstring(self):
+        assert SlowValue.value.__doc__.strip() == "Slow value."
+
+
+class TestConcurrentArticle:
+    def test_extracts_content_once(self, html):
+        metrics = Metrics()
+        article = Articulo(html, metrics=metrics)
+        results = run_concurrently(
+            lambda: (article.title, article.markup, article.text)
+        )
+        assert len(set(results)) == 1
+        assert metrics.get("parse.count") == 1
+        assert metrics.get("content.count") == 1
+
+    def test_loads_article_once(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        run_concurrently(lambda: article.markup)
+        assert requests_mock.call_count == 1
+
+
+class TestSharedStructures:
+    def test_duplicate_index(self):
+        index = DuplicateIndex()
+        fingerprint = ContentDigest(["Some article text"]).fingerprint
+        keys = iter(range(threads_count))
+        results = run_concurrently(lambda: index.seen(fingerprint, next(keys)))
+        assert results.count(None) == 1
+        assert len(index) == 1
+
+    def test_template_cache(self):
+        cache = TemplateCache(max_size=10)
+
+        def use_cache():
+            for index in range(100):
+                cache.put(f"domain-{index}", [("div", "", ())])
+                cache.get(f"domain-{index - 1}")
+                cache.record_hit()
+
+        run_concurrently(use_cache)
+        assert len(cache) == 10
+        assert cache.hits == threads_count * 100
+
+    def test_metrics(self):
+        metrics = Metrics()
+
+        def count():
+            for _ in range(1000):
+                metrics.incr("articles")
+
+        run_concurrently(count)
+        assert metrics.get("articles") == threads_count * 1000
+
+
+class TestConcurrentExtractor:
+    def test_session_per_thread(self):
+        extract = Extractor()
+        sessions = run_concurrently(lambda: extract.session, count=2)
+        assert sessions[0] is not sessions[1]
+        assert extract.session is extract.session
+
+    def test_provided_session_is_shared(self):
+        session = object()
+        extract = Extractor(session=session)
+        assert run_concurrently(lambda: extract.session, count=2) == [session] * 2
+
+    def test_extracts_concurrently(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        extract = Extractor()
+        titles = run_concurrently(lambda: extract(url).title)
+        assert titles == [Articulo(html).title] * threads_count
+        assert extract.metrics.get("articles") == threads_count
+
+    def test_extract_async(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        extract = Extractor()
+
+        async def extract_all():
+            return await asyncio.gather(
+                extract.extract_async(url), extract.extract_async(html)
+            )
+
+        articles = asyncio.run(extract_all())
+        assert articles[0].markup == articles[1].markup
+        assert extract.metrics.get("fetch.count") == 1
@@ -0,0 +1,58 @@
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.utils import sanitize_html
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+class TestScoreStrategy:
+    def test_title_strategy_finds_nothing(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        assert article.markup is None
+
+    def test_parses_article_by_score(
+        self, requests_mock: MockerCore, url, html, expected_html
+    ):
+        requests_mock.get(url, text=html)
+        article = Articulo(url, strategy="score")
+        assert article.markup == expected_html
+
+    def test_falls_back_to_score(
+        self, requests_mock: MockerCore, url, html, expected_html
+    ):
+        requests_mock.get(url, text=html)
+        article = Articulo(url, strategy="auto")
+        assert article.markup == expected_html
+
+    def test_rejects_unknown_strategy(self, url):
+        with pytest.raises(ValueError):
+            Articulo(url, strategy="unknown")
+
+    @pytest.fixture
+    def expected_html(self, html):
+        soup = BeautifulSoup(html, features="lxml")
+        return str(sanitize_html(soup.find("div", class_="post-content")))
+
+    @pytest.fixture
+    def html(self):
+        return read_html_text("article_without_matching_heading.html")
+
+
+class TestAutoStrategy:
+    def test_prefers_title_strategy(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        by_title = Articulo(url)
+        auto = Articulo(url, strategy="auto")
+        assert auto.markup == by_title.markup
+
+    @pytest.fixture
+    def html(self):
+        return read_html_text("article_with_content_siblings.html")
@@ -0,0 +1,68 @@
+import pytest
+from requests_mock import MockerCore
+
+from articulo import Articulo, Extractor
+from articulo.sanitizer import SanitizerPolicy, UNWRAP
+from articulo.template_cache import TemplateCache
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def html() -> str:
+    return read_html_text("article_with_deeply_nested_content.html")
+
+
+class TestExtractor:
+    def test_extracts_article(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        extract = Extractor()
+        article = extract(url)
+        assert article.title == Articulo(url).title
+        assert article.markup == Articulo(url).markup
+
+    def test_shares_session(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        extract = Extractor(http_headers={"Accept": "text/html"})
+        session = extract.session
+        extract(url).title
+        extract(url).title
+        assert extract.session is session
+        assert requests_mock.call_count == 2
+        assert requests_mock.last_request.headers.get("Accept") == "text/html"
+
+    def test_does_not_create_session_for_content(self, html):
+        extract = Extractor()
+        assert extract(html).title is not None
+        assert extract._Extractor__session is None
+
+    def test_applies_shared_configuration(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        requests_mock.get(url + "other", text=html)
+        cache = TemplateCache()
+        extract = Extractor(
+            template_cache=cache,
+            sanitizer_policy=SanitizerPolicy(actions={"a": UNWRAP}),
+        )
+        assert "href" not in extract(url).markup
+        assert "href" not in extract(url + "other").markup
+        assert cache.hits == 1
+
+    def test_collects_metrics(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        extract = Extractor()
+        extract(url).text
+        extract(html).text
+        metrics = extract.metrics.as_dict()
+        assert extract.metrics.get("articles") == 2
+        assert metrics["counters"]["fetch.count"] == 1
+        assert metrics["counters"]["parse.count"] == 2
+        assert metrics["timings"]["content"] > 0
+
+    def test_rejects_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            Extractor(strategy="unknown")
@@ -0,0 +1,158 @@
+from threading import Event
+
+import pytest
+import requests
+from requests_mock import MockerCore
+
+from articulo import Extractor
+from articulo.exceptions import HTTPErrorException, TransportException
+from articulo.canonical import CanonicalMemo
+from articulo.feed import FeedReader, iter_feed_items
+from .utils.helpers import read_html_bytes, read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def rss() -> bytes:
+    return read_html_bytes("feed_rss.xml")
+
+
+@pytest.fixture
+def atom() -> bytes:
+    return read_html_bytes("feed_atom.xml")
+
+
+@pytest.fixture
+def articles(requests_mock: MockerCore, url):
+    requests_mock.get(url + "first", text=read_html_text("article_simple.html"))
+    requests_mock.get(
+        url + "second", text=read_html_text("article_with_deeply_nested_content.html")
+    )
+    requests_mock.get(url + "missing", status_code=404, reason="Not Found")
+
+
+class TestParsingFeed:
+    def test_parses_rss(self, rss, url):
+        items = list(iter_feed_items(rss, url + "rss.xml"))
+        assert [item.link for item in items] == [
+            url + "first",
+            url + "second",
+            url + "missing",
+        ]
+        assert items[0].guid == "first"
+        assert items[0].title == "http://info.cern.ch - home of the first website"
+        assert items[0].published == "Tue, 06 Aug 1991 00:00:00 GMT"
+        assert items[0].summary == "From here you can browse the first website."
+
+    def test_parses_atom(self, atom, url):
+        [item] = list(iter_feed_items(atom))
+        assert item.link == url + "first"
+        assert item.guid == "urn:uuid:1225c695-cfb8-4ebb-aaaa-80da344efa6a"
+        assert item.published == "1991-08-06T00:00:00Z"
+
+    def test_parses_feed_file(self, tmp_path, rss):
+        file_path = tmp_path / "feed.xml"
+        file_path.write_bytes(rss)
+        assert len(list(iter_feed_items(str(file_path)))) == 3
+
+
+class TestFeedReader:
+    def test_skips_seen_items(self, rss):
+        reader = FeedReader(seen_guids=["first"])
+        assert [item.guid for item in reader.items(rss)] == ["second", "missing"]
+        assert list(reader.items(rss)) == []
+
+    def test_extracts_items(self, articles, rss, url):
+        reader = FeedReader(Extractor(), max_workers=2)
+        results = {result.item.guid: result for result in reader.extract(rss, url)}
+
+        assert results["first"].article.title == (
+            "http://info.cern.ch - home of the first website"
+        )
+        assert results["second"].article.text is not None
+        assert results["missing"].article is None
+        assert isinstance(results["missing"].error, HTTPErrorException)
+
+    def test_extracts_remote_feed(self, requests_mock: MockerCore, articles, rss, url):
+        requests_mock.get(url + "rss.xml", content=rss)
+        reader = FeedReader()
+        guids = {result.item.guid for result in reader.extract(url + "rss.xml")}
+        assert guids == {"first", "second", "missing"}
+
+    def test_discovers_and_extracts_feeds(
+        self, requests_mock: MockerCore, articles, rss, url
+    ):
+        requests_mock.get(url, text=read_html_text("article_with_rss_relative.html"))
+        requests_mock.get(url + "rss.xml", content=rss)
+        reader = FeedReader()
+        assert reader.discover(url) == [url + "rss.xml"]
+        assert len(list(reader.extract_site(url))) == 3
+
+    def test_skips_processed_articles(self, articles, rss, url):
+        memo = CanonicalMemo()
+        memo.add([url + "first?utm_source=feed"], url + "first")
+        reader = FeedReader(canonical_memo=memo)
+        guids = {result.item.guid for result in reader.extract(rss, url)}
+        assert guids == {"second", "missing"}
+        assert memo.find(url + "second") == url + "second"
+        assert memo.find(url + "missing") is None
+
+    def test_returns_connection_errors(self, requests_mock: MockerCore, rss, url):
+        requests_mock.get(url + "first", exc=requests.ConnectTimeout)
+        requests_mock.get(url + "second", exc=requests.ConnectionError)
+        requests_mock.get(url + "missing", status_code=404, reason="Not Found")
+        reader = FeedReader()
+        results = list(reader.extract(rss, url))
+
+        assert len(results) == 3
+        for result in results:
+            assert result.article is None
+        errors = {result.item.guid: result.error for result in results}
+        assert isinstance(errors["first"], TransportException)
+        assert isinstance(errors["first"].__cause__, requests.ConnectTimeout)
+        assert isinstance(errors["second"], TransportException)
+
+    def test_remote_feed_connection_error(self, requests_mock: MockerCore, url):
+        requests_mock.get(url + "rss.xml", exc=requests.ConnectionError)
+        with pytest.raises(TransportException):
+            list(FeedReader().extract(url + "rss.xml"))
+
+    def test_yields_in_order_of_completion(
+        self, requests_mock: MockerCore, articles, rss, url
+    ):
+        released = Event()
+
+        class SlowExtractor(Extractor):
+            def __call__(self, link_or_content):
+                if link_or_content == url + "first":
+                    released.wait(timeout=5)
+                return super().__call__(link_or_content)
+
+        results = FeedReader(SlowExtractor()).extract(rss, url)
+        guids = {next(results).item.guid, next(results).item.guid}
+        released.set()
+        assert guids == {"second", "missing"}
+        assert [result.item.guid for result in results] == ["first"]
+
+    def test_retries_failed_items(self, requests_mock: MockerCore, articles, rss, url):
+        requests_mock.get(url + "second", exc=requests.ConnectionError)
+        reader = FeedReader()
+        failed = {
+            result.item.guid
+            for result in reader.extract(rss, url)
+            if result.error is not None
+        }
+        assert failed == {"second", "missing"}
+        assert reader.seen_guids == {"first"}
+
+        requests_mock.get(
+            url + "second",
+            text=read_html_text("article_with_deeply_nested_content.html"),
+        )
+        results = list(reader.extract(rss, url))
+        assert {result.item.guid for result in results} == {"second", "missing"}
+        assert reader.seen_guids == {"first", "second"}
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.digest import ContentDigest
+from articulo import fingerprint as fingerprint_module
+from articulo.fingerprint import (
+    DuplicateIndex,
+    Fingerprint,
+    FingerprintBuilder,
+    hamming_distance,
+)
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+def build_fingerprint(text: str) -> Fingerprint:
+    return ContentDigest([text]).fingerprint
+
+
+@pytest.fixture
+def long_text() -> str:
+    words = read_html_text("article_without_matching_heading.html").split()
+    return " ".join(words * 3)
+
+
+class TestFingerprint:
+    def test_same_article_from_different_pages(self, requests_mock: MockerCore, url):
+        requests_mock.get(url + "a", text=read_html_text("article_with_content_siblings.html"))
+        requests_mock.get(
+            url + "b", text=read_html_text("article_with_deeply_nested_content.html")
+        )
+        first = Articulo(url + "a").fingerprint
+        second = Articulo(url + "b").fingerprint
+        assert first.exact == second.exact
+        assert first.distance(second) == 0
+
+    def test_no_fingerprint_without_content(self, requests_mock: MockerCore, url):
+        requests_mock.get(url, text=read_html_text("article_with_empty_body.html"))
+        assert Articulo(url).fingerprint is None
+
+    def test_ignores_case_and_markup(self):
+        first = ContentDigest(["Some", "thing ", "is", " HERE"]).fingerprint
+        second = build_fingerprint("something is here")
+        assert first.exact == second.exact
+
+    def test_near_duplicate_is_close(self, long_text):
+        original = build_fingerprint(long_text)
+        edited = build_fingerprint(long_text.replace("scientist", "physicist", 1))
+        other = build_fingerprint(read_html_text("feed_rss.xml"))
+        assert original.exact != edited.exact
+        assert original.distance(edited) <= 3
+        assert original.distance(other) > 3
+
+    def test_short_text(self):
+        fingerprint = build_fingerprint("Hello")
+        assert fingerprint.tokens == 1
+        assert fingerprint.simhash != 0
+
+
+class TestDuplicateIndex:
+    def test_finds_duplicates(self, long_text):
+        index = DuplicateIndex()
+        original = build_fingerprint(long_text)
+        assert index.seen(original, "a") is None
+        assert index.seen(original, "b") == "a"
+        edited = build_fingerprint(long_text.replace("scientist", "physicist", 1))
+        assert index.find(edited) == "a"
+        assert index.find(build_fingerprint("Completely different text")) is None
+        assert len(index) == 1
+
+    def test_finds_within_distance(self):
+        index = DuplicateIndex(max_distance=3)
+        simhash = 0x0123456789ABCDEF
+        index.add(Fingerprint("a", simhash, 10), "a")
+        assert index.find(Fingerprint("b", simhash ^ 0b1111, 10)) is None
+        assert index.find(Fingerprint("c", simhash ^ (1 | 1 << 20 | 1 << 40), 10)) == "a"
+
+    def test_fast_lookup(self, monkeypatch):
+        rnd = random.Random(1)
+        index = DuplicateIndex()
+        fingerprints = [
+            Fingerprint(str(number), rnd.getrandbits(64), 100) for number in range(100000)
+        ]
+        for fingerprint in fingerprints:
+            index.add(fingerprint, fingerprint.exact)
+
+        compared = []
+
+        def counting_distance(first: int, second: int) -> int:
+            compared.append(first)
+            return hamming_distance(first, second)
+
+        monkeypatch.setattr(fingerprint_module, "hamming_distance", counting_distance)
+        queries = [
+            Fingerprint("q" + fingerprint.exact, fingerprint.simhash ^ 0b11, 100)
+            for fingerprint in fingerprints[:1000]
+        ]
+        for query in queries:
+            assert index.find(query) is not None
+        # Bands of 16 bits hold about 1.5 of 100000 random hashes each,
+        # so a lookup compares a few candidates instead of the whole index
+        bands = index.max_distance + 1
+        assert len(compared) / len(queries) / bands < 4
+
+    def test_rejects_wrong_distance(self):
+        with pytest.raises(ValueError):
+            DuplicateIndex(max_distance=64)
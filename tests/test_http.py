@@ -1,6 +1,15 @@
+import gzip
+from io import BytesIO
+
 import pytest
+import requests
 from articulo import Articulo
-from articulo.exceptions import HTTPErrorException, DecodingException
+from articulo.exceptions import (
+    HTTPErrorException,
+    DecodingException,
+    ResponseTooLargeException,
+)
+from articulo.http import get_accept_encoding, iter_body
 from requests_mock import MockerCore
 
 from .utils.helpers import read_html_text, read_html_bytes
@@ -70,3 +79,114 @@ def test_throws_decoding_exception(requests_mock: MockerCore, url, html_ru):
     with pytest.raises(DecodingException) as excetion:
         assert article.title is None
     assert str(excetion.value) == "Document https://info.cern.ch/ cannot be decoded with utf-8 charset"
+
+
+class TrackedBody(BytesIO):
+    """
+    Response body remembering how much of it was read.
+    """
+
+    position = 0
+
+    def read(self, *args) -> bytes:
+        data = super().read(*args)
+        self.position = self.tell()
+        return data
+
+
+@pytest.fixture
+def large_html() -> bytes:
+    head = """<html>
+    <head>
+        <title>Тестовый заголовок</title>
+        <meta name="description" content="Описание страницы">
+        <meta property="og:image" content="/preview.png">
+    </head>
+    <body>"""
+    body = "<p>Текст, который не нужен для метаданных.</p>" * 20000
+    return (head + body + "</body></html>").encode("utf8")
+
+
+def test_head_only_stops_at_head_end(requests_mock: MockerCore, url, large_html):
+    body = TrackedBody(large_html)
+    request = requests_mock.get(url, body=body)
+    article = Articulo(url, head_only=True)
+
+    assert article.title == "Тестовый заголовок"
+    assert article.description == "Описание страницы"
+    assert article.preview == "https://info.cern.ch/preview.png"
+    assert request.last_request.headers.get("Range") == "bytes=0-65535"
+    assert body.position < len(large_html)
+
+
+def test_head_only_respects_byte_budget(requests_mock: MockerCore, url, large_html):
+    body = TrackedBody(large_html.replace(b"</head>", b""))
+    request = requests_mock.get(url, body=body)
+    # Budget cuts the title in the middle of a two-byte character
+    article = Articulo(url, head_only=True, head_max_bytes=53)
+
+    assert article.title == "Тестовый з"
+    assert article.description is None
+    assert request.last_request.headers.get("Range") == "bytes=0-52"
+    assert body.position < len(large_html)
+
+
+def test_head_only_without_range_support(requests_mock: MockerCore, url, html):
+    request = requests_mock.get(
+        url, [{"status_code": 416, "reason": "Range Not Satisfiable"}, {"text": html}]
+    )
+    article = Articulo(url, head_only=True)
+
+    assert article.title == "http://info.cern.ch"
+    assert request.call_count == 2
+    assert "Range" not in request.last_request.headers
+
+
+def test_head_only_throws_http_exception(requests_mock: MockerCore, url):
+    requests_mock.get(url, text="Not Found", status_code=404, reason="Not Found")
+    article = Articulo(url, head_only=True)
+
+    with pytest.raises(HTTPErrorException):
+        assert article.title is None
+
+
+def test_advertises_supported_encodings(requests_mock: MockerCore, url, html):
+    request = requests_mock.get(url, text=html)
+    Articulo(url).title
+    assert request.last_request.headers.get("Accept-Encoding") == get_accept_encoding()
+
+    Articulo(url, http_headers={"accept-encoding": "identity"}).title
+    assert request.last_request.headers.get("Accept-Encoding") == "identity"
+
+
+def test_decompresses_response(requests_mock: MockerCore, url, html):
+    requests_mock.get(
+        url,
+        content=gzip.compress(html.encode("utf8")),
+        headers={"Content-Encoding": "gzip"},
+    )
+    assert Articulo(url).markup == Articulo(html).markup
+
+
+def test_throws_exception_on_compression_bomb(requests_mock: MockerCore, url, html):
+    body = html.encode("utf8") + b" " * 10 * 1024 * 1024
+    requests_mock.get(
+        url, content=gzip.compress(body), headers={"Content-Encoding": "gzip"}
+    )
+    with pytest.raises(ResponseTooLargeException) as exception:
+        Articulo(url).title
+    assert "compression ratio" in str(exception.value)
+
+
+def test_limits_response_size(requests_mock: MockerCore, url, html):
+    requests_mock.get(url, text=html)
+    with requests.get(url, stream=True) as response:
+        with pytest.raises(ResponseTooLargeException) as exception:
+            list(iter_body(response, url, chunk_size=100, max_bytes=len(html) - 1))
+    assert "exceeds" in str(exception.value)
+
+
+def test_throws_decoding_exception_on_cut_character(requests_mock: MockerCore, url):
+    requests_mock.get(url, content="<html><title>Тест".encode()[:-1])
+    with pytest.raises(DecodingException):
+        Articulo(url).title
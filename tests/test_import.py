@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+from .utils.helpers import read_html_text
+
+heavy_modules = ["extruct", "rdflib", "mf2py", "w3lib", "requests"]
+
+
+def get_imported_modules(code: str) -> set[str]:
+    """
+    Runs code in a fresh interpreter and returns names of all the imported modules.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        modules.add(line.rsplit("|", 1)[1].strip().split(".")[0])
+    return modules
+
+
+class TestImportTime:
+    def test_does_not_import_heavy_modules(self):
+        modules = get_imported_modules("import articulo")
+        assert "articulo" in modules
+        for module in heavy_modules:
+            assert module not in modules
+
+    def test_does_not_import_heavy_modules_for_content(self, html):
+        code = (
+            "from articulo import Articulo; "
+            f"article = Articulo({html!r}); "
+            "article.title; article.text; article.description; article.keywords"
+        )
+        modules = get_imported_modules(code)
+        for module in heavy_modules:
+            assert module not in modules
+
+    def test_imports_extruct_on_demand(self, html):
+        code = f"from articulo import Articulo; Articulo({html!r}).has_paywall"
+        assert "extruct" in get_imported_modules(code)
+
+    @pytest.fixture
+    def html(self):
+        return read_html_text("article_simple.html")
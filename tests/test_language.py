@@ -0,0 +1,83 @@
+import pytest
+
+from articulo import Articulo
+from articulo.digest import ContentDigest
+from articulo.language import normalize_language
+from .utils.helpers import read_html_text
+
+
+def build_html(body: str, html_attrs: str = "", head: str = "") -> str:
+    return f"""
+    <html {html_attrs}>
+        <head><title>Title</title>{head}</head>
+        <body><article><h1>Title</h1>
+{body}</article></body>
+    </html>
+    """
+
+
+class TestWordCount:
+    def test_counts_words_of_content(self):
+        article = Articulo(build_html("<p>One <b>two</b>, three-four don't.</p>"))
+        assert article.word_count == 5
+        assert article.word_count == len(article.text.split())
+
+    def test_word_split_by_markup(self):
+        digest = ContentDigest(["some", "thing ", "is", " here"])
+        assert digest.word_count == 3
+
+    def test_reading_time(self):
+        article = Articulo(build_html("<p>" + "word " * 450 + "</p>"))
+        assert article.word_count == 451
+        assert article.reading_time == 3
+
+    def test_no_content(self):
+        article = Articulo(read_html_text("article_with_empty_body.html"))
+        assert article.word_count is None
+        assert article.reading_time is None
+
+
+class TestLanguage:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [("en-US", "en"), ("ru_RU", "ru"), (" DE ", "de"), ("", None), (None, None)],
+    )
+    def test_normalize_language(self, value, expected):
+        assert normalize_language(value) == expected
+
+    def test_html_lang(self):
+        article = Articulo(build_html("<p>Der Text ist nicht lang</p>", 'lang="en-GB"'))
+        assert article.lang == "en"
+
+    def test_og_locale(self):
+        head = '<meta property="og:locale" content="fr_FR">'
+        assert Articulo(build_html("<p>Text</p>", head=head)).lang == "fr"
+
+    def test_content_language(self):
+        head = '<meta http-equiv="Content-Language" content="uk">'
+        assert Articulo(build_html("<p>Text</p>", head=head)).lang == "uk"
+
+    def test_cyrillic_text(self):
+        article = Articulo(build_html("<p>Тестовый текст статьи</p>"))
+        assert article.lang == "ru"
+
+    def test_latin_text(self):
+        article = Articulo(read_html_text("article_simple.html"))
+        assert article.lang == "en"
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("Der Hund und die Katze sind nicht zu Hause", "de"),
+            ("Le chien et le chat ne sont pas dans la maison", "fr"),
+            ("El perro y el gato no están en la casa", "es"),
+            ("Собака и кошка не дома, это так", "ru"),
+            ("Собака і кішка не вдома, це так", "uk"),
+        ],
+    )
+    def test_guessed_language(self, text, expected):
+        assert ContentDigest([text]).language == expected
+
+    def test_unknown_language(self):
+        assert ContentDigest(["12 345"]).language is None
+        assert ContentDigest(["Lorem ipsum"]).language is None
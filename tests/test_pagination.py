@@ -0,0 +1,125 @@
+from threading import current_thread, main_thread
+
+import pytest
+import requests
+from requests_mock import MockerCore
+
+from articulo import Articulo, Extractor
+from articulo.pagination import MultiPageArticle
+from articulo.urls import get_article_url, get_page_number
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/story"
+
+
+@pytest.fixture
+def pages(requests_mock: MockerCore, url) -> dict:
+    return {
+        page_url: requests_mock.get(
+            page_url, text=read_html_text(file_name), complete_qs=True
+        )
+        for page_url, file_name in [
+            (url, "paged_article_1.html"),
+            (url + "?page=1", "paged_article_1.html"),
+            (url + "?page=2", "paged_article_2.html"),
+            (url + "?page=3", "paged_article_3.html"),
+        ]
+    }
+
+
+class TestPageUrls:
+    @pytest.mark.parametrize(
+        "page_url, number",
+        [
+            ("https://info.cern.ch/story?page=2", 2),
+            ("https://info.cern.ch/story?id=1&p=3", 3),
+            ("https://info.cern.ch/story/page/4/", 4),
+            ("https://info.cern.ch/story?page=last", None),
+            ("https://info.cern.ch/story", None),
+        ],
+    )
+    def test_page_number(self, page_url, number):
+        assert get_page_number(page_url) == number
+
+    def test_article_url(self):
+        assert get_article_url("https://info.cern.ch/story?id=1&page=2#top") == (
+            "https://info.cern.ch/story?id=1"
+        )
+        assert get_article_url("https://info.cern.ch/story/page/2") == (
+            "https://info.cern.ch/story"
+        )
+
+
+class TestNextPages:
+    def test_finds_next_and_numbered_pages(self, pages, url):
+        assert Articulo(url).next_pages == [url + "?page=2", url + "?page=3"]
+
+    def test_content_without_url(self):
+        html = read_html_text("paged_article_2.html")
+        assert Articulo(html).next_pages == ["/story?page=3"]
+
+    def test_no_pages(self):
+        assert Articulo(read_html_text("article_simple.html")).next_pages == []
+
+
+class TestMultiPageArticle:
+    def test_joins_pages_in_order(self, pages, url):
+        article = MultiPageArticle(url)
+        assert article.title == "The story of the web"
+        assert article.urls == [url, url + "?page=2", url + "?page=3"]
+        assert article.text.index("first page") < article.text.index("second page")
+        assert article.text.index("second page") < article.text.index("third page")
+        assert article.markup == "\n".join(page.markup for page in article.pages)
+        # Link back to the first page is followed once and its content is skipped
+        assert all(page.call_count == 1 for page in pages.values())
+
+    def test_loads_pages_in_workers(self, requests_mock: MockerCore, pages, url):
+        threads = []
+
+        def respond(file_name):
+            def callback(request, context):
+                threads.append(current_thread())
+                return read_html_text(file_name)
+
+            return callback
+
+        for number in (2, 3):
+            requests_mock.get(
+                f"{url}?page={number}",
+                text=respond(f"paged_article_{number}.html"),
+                complete_qs=True,
+            )
+        assert len(MultiPageArticle(url, max_workers=2).pages) == 3
+        assert len(threads) == 2
+        assert main_thread() not in threads
+
+    def test_page_cap(self, pages, url):
+        article = MultiPageArticle(url, max_pages=2)
+        assert article.urls == [url, url + "?page=2"]
+        assert pages[url + "?page=3"].call_count == 0
+
+    def test_skips_failed_pages(self, requests_mock: MockerCore, pages, url):
+        requests_mock.get(url + "?page=2", status_code=404, complete_qs=True)
+        article = MultiPageArticle(url)
+        assert article.urls == [url, url + "?page=3"]
+
+    def test_skips_pages_with_connection_errors(
+        self, requests_mock: MockerCore, pages, url
+    ):
+        requests_mock.get(url + "?page=2", exc=requests.ConnectTimeout, complete_qs=True)
+        article = MultiPageArticle(url)
+        assert article.urls == [url, url + "?page=3"]
+        assert article.text is not None
+
+    def test_uses_extractor(self, pages, url):
+        extract = Extractor()
+        MultiPageArticle(url, extractor=extract).text
+        assert extract.metrics.get("articles") == 4
+
+    def test_single_page(self, requests_mock: MockerCore, url):
+        requests_mock.get(url, text=read_html_text("article_simple.html"))
+        article = MultiPageArticle(url)
+        assert article.text == Articulo(url).text
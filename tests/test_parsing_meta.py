@@ -274,3 +274,99 @@ class TestParsingPreview:
         )
         soup.head.append(preview_meta)
         return str(soup)
+
+
+class TestMediaCandidates:
+    def test_collects_all_icons_sorted(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        assert [(icon.kind, icon.width) for icon in article.icons] == [
+            ("apple-touch-icon", 180),
+            ("icon", 32),
+            ("shortcut icon", None),
+            ("mask-icon", None),
+        ]
+        assert article.icons[0].url == urljoin(url, "/apple-touch-icon.png")
+        assert article.icon == urljoin(url, "/icon_32.png")
+
+    def test_falls_back_to_apple_touch_icon(self, requests_mock: MockerCore, url):
+        html = (
+            '<html><head><title>Title</title>'
+            '<link rel="apple-touch-icon" href="/apple-touch-icon.png">'
+            "</head><body></body></html>"
+        )
+        requests_mock.get(url, text=html)
+        assert Articulo(url).icon == urljoin(url, "/apple-touch-icon.png")
+
+    def test_prefers_apple_touch_icon_to_mask_icon(
+        self, requests_mock: MockerCore, url
+    ):
+        html = (
+            "<html><head><title>Title</title>"
+            '<link rel="mask-icon" href="/mask.svg" sizes="any">'
+            '<link rel="apple-touch-icon" href="/apple-touch-icon.png" sizes="180x180">'
+            "</head><body></body></html>"
+        )
+        requests_mock.get(url, text=html)
+        assert Articulo(url).icon == urljoin(url, "/apple-touch-icon.png")
+
+    def test_falls_back_to_mask_icon(self, requests_mock: MockerCore, url):
+        html = (
+            "<html><head><title>Title</title>"
+            '<link rel="mask-icon" href="/mask.svg">'
+            "</head><body></body></html>"
+        )
+        requests_mock.get(url, text=html)
+        assert Articulo(url).icon == urljoin(url, "/mask.svg")
+
+    def test_prefers_biggest_og_image(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        assert article.preview == urljoin(url, "/preview_big.png")
+
+    def test_parses_document_once(self, requests_mock: MockerCore, url, html, mocker_parse):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        article.icon
+        article.icons
+        article.preview
+        article.description
+        article.keywords
+        article.rss
+        article.title
+        article.markup
+        assert mocker_parse["count"] == 1
+
+    @pytest.fixture
+    def mocker_parse(self, monkeypatch):
+        import articulo.articulo as articulo_module
+
+        calls = {"count": 0}
+        original = articulo_module.BeautifulSoup
+
+        def counting_soup(*args, **kwargs):
+            calls["count"] += 1
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(articulo_module, "BeautifulSoup", counting_soup)
+        return calls
+
+    @pytest.fixture
+    def html(self, initial_html):
+        soup = BeautifulSoup(initial_html, features="lxml")
+        head = """
+            <link rel="shortcut icon" href="/favicon.ico">
+            <link rel="icon" href="/icon_32.png" sizes="32x32">
+            <link rel="apple-touch-icon" href="/apple-touch-icon.png" sizes="180x180">
+            <link rel="mask-icon" href="/mask.svg" sizes="any">
+            <meta property="og:image" content="/preview_small.png">
+            <meta property="og:image:width" content="200">
+            <meta property="og:image:height" content="100">
+            <meta property="og:image" content="/preview_big.png">
+            <meta property="og:image:width" content="1200">
+            <meta property="og:image:height" content="630">
+            <meta name="twitter:image" content="/twitter.png">
+        """
+        for element in BeautifulSoup(head, "html.parser").find_all(True):
+            soup.head.append(element)
+        return str(soup)
@@ -0,0 +1,214 @@
+import os
+import pickle
+import signal
+import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.shared_memory import SharedMemory
+from threading import Thread
+
+import pytest
+
+from articulo import Articulo
+from articulo import pipeline
+from articulo.exceptions import DecodingException, ResponseTooLargeException
+from articulo.pipeline import Pipeline, SharedBody, read_shared_body
+from .utils.helpers import read_html_bytes, read_html_text
+
+relative_page = b"""
+<html><head>
+    <link rel="canonical" href="canonical">
+    <meta property="og:image" content="/image.png">
+</head></html>
+"""
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/articles/relative")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/articles/relative":
+            body = relative_page
+        elif self.path == "/empty":
+            body = b""
+        else:
+            body = read_html_bytes("article_simple.html")
+        self.send_response(404 if self.path == "/missing" else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def created_blocks(monkeypatch) -> list[str]:
+    names = []
+
+    class RecordingSharedBody(SharedBody):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            names.append(self.descriptor.name)
+
+    monkeypatch.setattr(pipeline, "SharedBody", RecordingSharedBody)
+    return names
+
+
+original_extract_shared_body = pipeline.extract_shared_body
+
+
+def crashing_extract_shared_body(descriptor, options, fields):
+    # Kills the worker the same way the OOM killer does
+    if descriptor.url.endswith("/crash"):
+        os.kill(os.getpid(), signal.SIGKILL)
+    return original_extract_shared_body(descriptor, options, fields)
+
+
+def is_released(name: str) -> bool:
+    try:
+        SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return True
+    return False
+
+
+class TestSharedBody:
+    def test_reads_body(self):
+        body = SharedBody(
+            "https://info.cern.ch/", [b"<p>", "Тест".encode(), b"</p>"], "utf-8"
+        )
+        try:
+            assert read_shared_body(body.descriptor) == "<p>Тест</p>"
+        finally:
+            body.release()
+
+    def test_writes_received_chunks(self):
+        chunks = iter([b"<p>", b"Text", b"</p>"])
+        body = SharedBody("https://info.cern.ch/", chunks, "utf-8")
+        try:
+            assert read_shared_body(body.descriptor) == "<p>Text</p>"
+        finally:
+            body.release()
+
+    def test_body_too_large(self):
+        with pytest.raises(ResponseTooLargeException):
+            SharedBody("https://info.cern.ch/", [b"x" * 10, b"x"], "utf-8", max_size=10)
+
+    def test_reads_body_with_charset(self):
+        body = SharedBody("https://info.cern.ch/", ["Тест".encode("cp1251")], "cp1251")
+        try:
+            assert read_shared_body(body.descriptor) == "Тест"
+        finally:
+            body.release()
+
+    def test_decoding_error(self):
+        body = SharedBody("https://info.cern.ch/", ["Тест".encode("cp1251")], "utf-8")
+        try:
+            with pytest.raises(DecodingException):
+                read_shared_body(body.descriptor)
+        finally:
+            body.release()
+
+    def test_release(self):
+        body = SharedBody("https://info.cern.ch/", [b"<p>Text</p>"], "utf-8")
+        body.release()
+        body.release()
+        assert is_released(body.descriptor.name)
+
+    def test_descriptor_is_small(self):
+        body = SharedBody("https://info.cern.ch/", [b"x" * 4 * 1024 * 1024], "utf-8")
+        try:
+            assert len(pickle.dumps(body.descriptor)) < 256
+        finally:
+            body.release()
+
+
+class TestPipeline:
+    def test_extracts_articles(self, base_url, created_blocks):
+        urls = [f"{base_url}/{index}" for index in range(6)]
+        results = list(
+            Pipeline(parse_workers=2, fields=["title", "text"]).extract(urls)
+        )
+
+        expected = Articulo(read_html_text("article_simple.html"))
+        assert sorted(result.url for result in results) == sorted(urls)
+        for result in results:
+            assert result.error is None
+            assert result.result == {"title": expected.title, "text": expected.text}
+        assert len(created_blocks) == len(urls)
+        assert all(is_released(name) for name in created_blocks)
+
+    def test_errors(self, base_url):
+        results = {
+            result.url: result
+            for result in Pipeline(parse_workers=1, fields=["title"]).extract(
+                [f"{base_url}/missing", f"{base_url}/empty"]
+            )
+        }
+        assert results[f"{base_url}/missing"].error["type"] == "HTTPErrorException"
+        assert results[f"{base_url}/empty"].error["type"] == "NoHTMLException"
+        assert results[f"{base_url}/empty"].result is None
+
+    def test_connection_error(self, base_url):
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            refused_url = f"http://127.0.0.1:{closed.getsockname()[1]}/"
+        results = {
+            result.url: result
+            for result in Pipeline(parse_workers=1, fields=["title"]).extract(
+                [refused_url, f"{base_url}/article"]
+            )
+        }
+        assert results[refused_url].error["type"] == "TransportException"
+        assert results[f"{base_url}/article"].error is None
+
+    def test_worker_crash(self, base_url, monkeypatch, created_blocks):
+        monkeypatch.setattr(
+            pipeline, "extract_shared_body", crashing_extract_shared_body
+        )
+        urls = [f"{base_url}/crash", *(f"{base_url}/{index}" for index in range(5))]
+        results = {
+            result.url: result
+            for result in Pipeline(parse_workers=1, fields=["title"]).extract(urls)
+        }
+        assert sorted(results) == sorted(urls)
+        assert results[f"{base_url}/crash"].error["type"] == "BrokenProcessPool"
+        expected = Articulo(read_html_text("article_simple.html")).title
+        for url in urls[1:]:
+            assert results[url].result == {"title": expected}
+        assert all(is_released(name) for name in created_blocks)
+
+    def test_resolves_links_against_final_url(self, base_url):
+        (result,) = Pipeline(
+            parse_workers=1, fields=["canonical_url", "preview", "source_url"]
+        ).extract([f"{base_url}/moved"])
+        assert result.result == {
+            "canonical_url": f"{base_url}/articles/canonical",
+            "preview": f"{base_url}/image.png",
+            "source_url": f"{base_url}/moved",
+        }
+
+    def test_releases_blocks_when_stopped(self, base_url, created_blocks):
+        urls = [f"{base_url}/{index}" for index in range(10)]
+        results = Pipeline(parse_workers=2, fields=["title"]).extract(urls)
+        next(results)
+        results.close()
+        assert created_blocks
+        assert all(is_released(name) for name in created_blocks)
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError):
+            Pipeline(fields=["secret"])
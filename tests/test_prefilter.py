@@ -0,0 +1,142 @@
+import os
+import time
+
+import pytest
+
+from articulo import Articulo
+from articulo.prefilter import strip_blocks
+from .utils.helpers import read_html_text
+
+fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures_html")
+html_fixtures = sorted(
+    file_name for file_name in os.listdir(fixtures_dir) if file_name.endswith(".html")
+)
+
+
+class TestStripBlocks:
+    def test_removes_blocks(self):
+        html = (
+            "<p>Some<script>var a = '<p>';</script>thing</p>"
+            "<STYLE type='text/css'>p { color: red }</STYLE>"
+            '<svg viewBox="0 0 1 1"><svg><path/></svg><text>Logo</text></svg>'
+        )
+        assert strip_blocks(html) == "<p>Some<!---->thing</p><!----><!---->"
+
+    def test_keeps_json_ld(self):
+        html = '<script type="application/ld+json">{"a": 1}</script><script>1</script>'
+        assert strip_blocks(html) == (
+            '<script type="application/ld+json">{"a": 1}</script><!---->'
+        )
+        assert strip_blocks(html, keep_json_ld=False) == "<!----><!---->"
+
+    def test_keeps_comments(self):
+        html = "<!-- <script>1</script> --><p>Text</p>"
+        assert strip_blocks(html) == html
+
+    def test_self_closed_svg(self):
+        html = "<p>A<svg/>B</p>"
+        assert strip_blocks(html) == html
+
+    def test_not_closed_block(self):
+        assert strip_blocks("<p>Text</p><script>var a = 1;") == "<p>Text</p><!---->"
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<script-loader>Text</script-loader><svg-icon>Icon</svg-icon>",
+            "<style-guide><p>Text</p></style-guide>",
+        ],
+    )
+    def test_keeps_custom_elements(self, html):
+        assert strip_blocks(html) == html
+
+    def test_custom_element_inside_svg(self):
+        html = "<svg><svg-icon></svg-icon></svg>Text</svg>"
+        assert strip_blocks(html) == "<!---->Text</svg>"
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<title>Why <script> tags matter</title><p>Text</p>",
+            "<textarea>Use <style> here</textarea><p>Text</p>",
+            '<p title="<script>">Text</p><p>More</p>',
+            "<p data-code='<svg>'>Text</p><p>More</p>",
+        ],
+    )
+    def test_keeps_tags_inside_text_and_attributes(self, html):
+        assert strip_blocks(html) == html
+        assert strip_blocks(html + "<script>1</script>") == html + "<!---->"
+
+    def test_closing_bracket_in_attribute(self):
+        assert strip_blocks('<script data-x=">">var a;</script>b') == "<!---->b"
+
+    def test_not_closed_comment(self):
+        assert strip_blocks("<p>a</p><!-- <script>1</script>") == (
+            "<p>a</p><!-- <script>1</script>"
+        )
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<a b c d e f g h " * 20000,
+            "<!--" * 20000,
+            "<abcd" * 20000,
+            "<svg>" + "<svg a b c " * 20000,
+            '<a b="' + "<a b c " * 20000,
+            '<a b="<" c ' * 20000,
+            "<script a " * 20000,
+        ],
+    )
+    def test_not_closed_tags_are_scanned_linearly(self, html):
+        # Backtracking over the whole rest of the html at every tag takes minutes here
+        started_at = time.perf_counter()
+        strip_blocks(html)
+        assert time.perf_counter() - started_at < 1
+
+
+class TestPrefilteredArticle:
+    @pytest.mark.parametrize("file_name", html_fixtures)
+    def test_same_results(self, file_name):
+        html = read_html_text(file_name)
+        article = Articulo(html)
+        prefiltered = Articulo(html, prefilter=True)
+        assert prefiltered.title == article.title
+        assert prefiltered.markup == article.markup
+        assert prefiltered.text == article.text
+        assert prefiltered.has_paywall == article.has_paywall
+
+    def test_same_results_with_inline_scripts(self):
+        html = read_html_text("article_with_deeply_nested_content.html").replace(
+            "</h1>",
+            "</h1>\n<script>var data = '" + "x" * 1000 + "';</script>\n"
+            "<style>h1 { color: red }</style>",
+        )
+        article = Articulo(html)
+        prefiltered = Articulo(html, prefilter=True)
+        assert prefiltered.markup == article.markup
+        assert prefiltered.text == article.text
+
+    @pytest.mark.parametrize(
+        "inserted",
+        [
+            "<script-loader>Loader</script-loader><svg-icon>Icon</svg-icon>",
+            '<p title="<script>">Caption</p>',
+            "<textarea><style> text</textarea>",
+        ],
+    )
+    def test_same_results_with_tricky_markup(self, inserted):
+        html = (
+            read_html_text("article_with_deeply_nested_content.html")
+            .replace("<title>", "<title>Why <script> ")
+            .replace("</h1>", "</h1>\n" + inserted)
+        )
+        article = Articulo(html)
+        prefiltered = Articulo(html, prefilter=True)
+        assert prefiltered.title == article.title
+        assert prefiltered.markup == article.markup
+        assert prefiltered.text == article.text
+
+    def test_keeps_structured_data(self):
+        html = read_html_text("article_with_json_ld_body.html")
+        article = Articulo(html, prefilter=True, prefer_json_ld=True)
+        assert article.text.startswith("From here you can browse")
@@ -0,0 +1,138 @@
+from io import StringIO
+
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.render import render_content
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def html() -> str:
+    return read_html_text("article_simple.html")
+
+
+class TestArticleRendering:
+    def test_renders_markdown(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        assert article.markdown.startswith(
+            "# http://info.cern.ch - home of the first website\n\nFrom here you can:\n\n"
+        )
+        assert (
+            "- [Learn about the birth of the web](http://home.web.cern.ch/topics/birth-web)\n"
+            in article.markdown
+        )
+
+    def test_renders_plain_text(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        paragraphs = article.plain_text.strip().split("\n\n")
+        assert paragraphs[0] == "http://info.cern.ch - home of the first website"
+        assert paragraphs[1] == "From here you can:"
+        assert paragraphs[2].split("\n")[0] == "Browse the first website"
+
+    def test_writes_to_stream(self, requests_mock: MockerCore, url, html):
+        requests_mock.get(url, text=html)
+        article = Articulo(url)
+        out = StringIO()
+        article.write_to(out, "text")
+        assert out.getvalue() == article.plain_text
+
+    def test_renders_nothing_without_content(self, requests_mock: MockerCore, url):
+        requests_mock.get(url, text=read_html_text("article_with_empty_body.html"))
+        article = Articulo(url)
+        assert article.markdown is None
+        assert article.plain_text is None
+
+
+class TestContentRenderer:
+    def test_renders_blocks(self, content):
+        out = StringIO()
+        render_content(content, out)
+        assert out.getvalue() == (
+            "> Quote with **bold** text\n"
+            "\n"
+            "1. One\n"
+            "   - Nested\n"
+            "2. Two\n"
+            "\n"
+            "```\n"
+            "x = 1\n"
+            "  y = 2\n"
+            "```\n"
+            "\n"
+            "| A | B |\n"
+            "| --- | --- |\n"
+            "| 1 | 2 |\n"
+        )
+
+    def test_renders_plain_text(self, content):
+        out = StringIO()
+        render_content(content, out, "text")
+        assert out.getvalue() == (
+            "Quote with bold text\n"
+            "\n"
+            "One\n"
+            "Nested\n"
+            "Two\n"
+            "\n"
+            "x = 1\n"
+            "  y = 2\n"
+            "\n"
+            "A\tB\n"
+            "1\t2\n"
+        )
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            ("<ul><li><p>Item</p></li></ul>", "- Item\n"),
+            ("<ol><li><p>One</p><p>More</p></li></ol>", "1. One\n\n   More\n"),
+            ("<p>2*3_4 [x] #tag</p>", "2\\*3\\_4 \\[x\\] #tag\n"),
+            ("<p># Not a heading</p>", "\\# Not a heading\n"),
+            ("<p>1. Not a list</p>", "1\\. Not a list\n"),
+            ("<ul><li>1. Not nested</li></ul>", "- 1\\. Not nested\n"),
+            (
+                "<table><tr><th>a|b</th></tr><tr><td>c</td></tr></table>",
+                "| a\\|b |\n| --- |\n| c |\n",
+            ),
+            ("<p><code>a`b</code> <code>`x`</code></p>", "``a`b`` `` `x` ``\n"),
+            ("<p><code>*x*</code></p>", "`*x*`\n"),
+            ("<pre>```\ncode\n```</pre>", "````\n```\ncode\n```\n````\n"),
+        ],
+    )
+    def test_escapes_markdown(self, html, expected):
+        out = StringIO()
+        render_content(BeautifulSoup(f"<div>{html}</div>", features="lxml").div, out)
+        assert out.getvalue() == expected
+
+    def test_rejects_unknown_format(self, content):
+        with pytest.raises(ValueError):
+            render_content(content, StringIO(), "pdf")
+
+    @pytest.fixture
+    def content(self):
+        html = """
+        <div>
+            <blockquote><p>Quote with <strong>bold</strong> text</p></blockquote>
+            <ol>
+                <li>One<ul><li>Nested</li></ul></li>
+                <li>Two</li>
+            </ol>
+            <pre>x = 1
+  y = 2</pre>
+            <table>
+                <tr><th>A</th><th>B</th></tr>
+                <tr><td>1</td><td>2</td></tr>
+            </table>
+        </div>
+        """
+        return BeautifulSoup(html, features="lxml").find("div")
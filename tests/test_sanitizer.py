@@ -0,0 +1,67 @@
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.sanitizer import DROP, KEEP, UNWRAP, SanitizerPolicy
+from articulo.utils import sanitize_html
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def content():
+    html = """
+    <div class="post">
+        <p class="lead" data-id="1">Lead <a href="/about" class="link">link</a></p>
+        <figure><img src="/img.png" alt="Image" class="wide"></figure>
+        <!-- comment -->
+        <div><span>Nested</span></div>
+        <script>var a;</script>
+    </div>
+    """
+    return BeautifulSoup(html, features="lxml").find("div")
+
+
+class TestSanitizerPolicy:
+    def test_default_policy(self, content):
+        sanitized = sanitize_html(content)
+        assert sanitized.find("script") is None
+        assert sanitized.find("div") is None
+        assert sanitized.find("span") is not None
+        assert sanitized.find("p")["class"] == ["lead"]
+        assert "comment" not in str(sanitized)
+
+    def test_custom_actions(self, content):
+        policy = SanitizerPolicy(actions={"div": KEEP, "figure": DROP, "span": UNWRAP})
+        sanitized = sanitize_html(content, policy)
+        assert sanitized.find("div") is not None
+        assert sanitized.find("figure") is None
+        assert sanitized.find("img") is None
+        assert sanitized.find("span") is None
+        assert "Nested" in sanitized.text
+
+    def test_attributes_whitelist(self, content):
+        policy = SanitizerPolicy(
+            allowed_attrs={"a": ["href"], "img": ["src", "alt"], "*": []}
+        )
+        sanitized = sanitize_html(content, policy)
+        assert sanitized.find("p").attrs == {}
+        assert sanitized.find("a").attrs == {"href": "/about"}
+        assert sanitized.find("img").attrs == {"src": "/img.png", "alt": "Image"}
+
+    def test_rejects_unknown_action(self):
+        with pytest.raises(ValueError):
+            SanitizerPolicy(actions={"div": "explode"})
+
+    def test_applies_policy_to_article(self, requests_mock: MockerCore, url):
+        requests_mock.get(url, text=read_html_text("article_simple.html"))
+        policy = SanitizerPolicy(actions={"a": UNWRAP})
+        article = Articulo(url, sanitizer_policy=policy)
+        assert article.markup is not None
+        assert "<a" not in article.markup
+        assert article.text == Articulo(url).text
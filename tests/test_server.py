@@ -0,0 +1,240 @@
+import http.client
+import json
+import os
+import signal
+import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from articulo import Articulo
+from articulo import server as server_module
+from articulo.__main__ import create_parser
+from articulo.server import ExtractionService, create_server, validate_job
+from .utils.helpers import read_html_bytes, read_html_text
+
+
+class UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str) -> None:
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = read_html_bytes("article_simple.html")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+original_run_job = server_module.run_job
+
+
+def crashing_run_job(job: dict, options: dict, submitted_at: float) -> dict:
+    # Kills the worker the same way the OOM killer does
+    if job.get("html") == "crash":
+        os.kill(os.getpid(), signal.SIGKILL)
+    if job.get("html") == "parent":
+        return {"result": {"parent": os.getppid()}, "timings": {}}
+    return original_run_job(job, options, submitted_at)
+
+
+def run_in_thread(server):
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def request(connection, method: str, path: str, payload=None):
+    body = json.dumps(payload) if payload is not None else None
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.fixture(scope="module")
+def service():
+    with ExtractionService(workers=2) as service:
+        yield service
+
+
+@pytest.fixture(scope="module")
+def address(service):
+    server = run_in_thread(create_server(service, port=0))
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connection(address):
+    connection = http.client.HTTPConnection(*address)
+    yield connection
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def page_url():
+    server = run_in_thread(ThreadingHTTPServer(("127.0.0.1", 0), PageHandler))
+    yield f"http://127.0.0.1:{server.server_address[1]}/article"
+    server.shutdown()
+    server.server_close()
+
+
+class TestValidateJob:
+    @pytest.mark.parametrize(
+        "job",
+        [
+            [],
+            {},
+            {"url": "https://info.cern.ch/", "html": "<html></html>"},
+            {"url": "not a link"},
+            {"html": ""},
+            {"html": "<html></html>", "fields": "title"},
+            {"html": "<html></html>", "fields": ["secret"]},
+        ],
+    )
+    def test_invalid_job(self, job):
+        with pytest.raises(ValueError):
+            validate_job(job)
+
+    def test_unknown_option(self):
+        with pytest.raises(ValueError):
+            ExtractionService(options={"session": None})
+
+
+class TestExtractionService:
+    def test_extracts_html(self, connection):
+        html = read_html_text("article_simple.html")
+        status, response = request(connection, "POST", "/extract", {"html": html})
+        expected = Articulo(html)
+        assert status == 200
+        assert response["result"]["title"] == expected.title
+        assert response["result"]["text"] == expected.text
+        assert response["result"]["word_count"] == expected.word_count
+
+    def test_extracts_url(self, connection, page_url):
+        status, response = request(
+            connection, "POST", "/extract", {"url": page_url, "fields": ["title"]}
+        )
+        assert status == 200
+        assert response["result"] == {
+            "title": "http://info.cern.ch - home of the first website"
+        }
+
+    def test_article_error(self, connection):
+        html = "<html><body><p>Text</p></body></html>"
+        status, response = request(
+            connection, "POST", "/extract", {"html": html, "fields": ["text"]}
+        )
+        assert status == 422
+        assert response["error"]["type"] == "NoTitleException"
+
+    def test_bad_request(self, connection):
+        status, response = request(connection, "POST", "/extract", {"html": ""})
+        assert status == 400
+        assert response["error"]["type"] == "BadRequest"
+
+    def test_negative_content_length(self, address):
+        with socket.create_connection(address) as client:
+            client.sendall(
+                b"POST /extract HTTP/1.1\r\nHost: localhost\r\n"
+                b"Content-Length: -1\r\n\r\n"
+            )
+            client.settimeout(5)
+            response = client.recv(4096)
+        assert response.startswith(b"HTTP/1.0 400")
+
+    def test_not_found(self, connection):
+        status, _ = request(connection, "GET", "/missing")
+        assert status == 404
+
+    def test_health(self, connection):
+        assert request(connection, "GET", "/health") == (200, {"status": "ok"})
+
+    def test_stats(self, connection):
+        html = read_html_text("article_simple.html")
+        request(connection, "POST", "/extract", {"html": html})
+        status, stats = request(connection, "GET", "/stats")
+        assert status == 200
+        assert stats["workers"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["jobs"] >= 1
+        for stage in ["queue", "parse", "content", "job"]:
+            assert stats["stages"][stage]["count"] >= 1
+            assert stats["stages"][stage]["mean_ms"] >= 0
+
+    def test_unix_socket(self, service, tmp_path):
+        path = str(tmp_path / "articulo.sock")
+        server = run_in_thread(create_server(service, socket_path=path))
+        try:
+            connection = UnixConnection(path)
+            html = read_html_text("article_simple.html")
+            status, response = request(
+                connection, "POST", "/extract", {"html": html, "fields": ["title"]}
+            )
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert status == 200
+        assert response["result"]["title"] == Articulo(html).title
+
+
+class TestWorkerCrash:
+    @pytest.fixture
+    def crashing_service(self, monkeypatch):
+        monkeypatch.setattr(server_module, "run_job", crashing_run_job)
+        with ExtractionService(workers=1) as service:
+            server = run_in_thread(create_server(service, port=0))
+            yield service, server.server_address
+            server.shutdown()
+            server.server_close()
+
+    def test_restarts_pool(self, crashing_service):
+        service, address = crashing_service
+        connection = http.client.HTTPConnection(*address)
+        html = read_html_text("article_simple.html")
+        try:
+            status, response = request(
+                connection, "POST", "/extract", {"html": "crash"}
+            )
+            assert status == 503
+            assert response["error"]["type"] == "WorkerCrashed"
+
+            status, response = request(
+                connection, "POST", "/extract", {"html": html, "fields": ["title"]}
+            )
+            assert status == 200
+            assert response["result"]["title"] == Articulo(html).title
+
+            # Workers of the new pool are not forked from the threads of the server
+            status, response = request(
+                connection, "POST", "/extract", {"html": "parent"}
+            )
+            assert response["result"]["parent"] != os.getpid()
+        finally:
+            connection.close()
+        assert service.stats()["restarts"] == 1
+
+
+class TestCommandLine:
+    def test_parses_serve_arguments(self):
+        args = create_parser().parse_args(
+            ["serve", "--socket", "/tmp/articulo.sock", "--workers", "4", "--prefilter"]
+        )
+        assert args.command == "serve"
+        assert args.socket_path == "/tmp/articulo.sock"
+        assert args.workers == 4
+        assert args.prefilter
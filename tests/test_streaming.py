@@ -0,0 +1,97 @@
+import os
+from io import BytesIO
+
+import pytest
+
+from articulo import Articulo
+from articulo.exceptions import NoTitleException
+from articulo.streaming import StreamExtractor
+from .utils.helpers import read_html_bytes, read_html_text
+
+article_fixtures = [
+    "article_simple.html",
+    "article_simple_ru.html",
+    "article_with_content_siblings.html",
+    "article_with_deeply_nested_content.html",
+    "article_with_deeply_nested_heading.html",
+    "article_with_nested_heading.html",
+    "article_with_non_content_tags.html",
+    "article_with_og_title_meta.html",
+    "article_with_siblings.html",
+]
+
+
+class NonSeekableStream(BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+
+class TestStreamExtractor:
+    @pytest.mark.parametrize("file_name", article_fixtures)
+    def test_same_result_as_dom_extraction(self, file_name):
+        article = Articulo(read_html_text(file_name))
+        result = StreamExtractor().extract(read_html_bytes(file_name))
+        assert result.title == article.title
+        assert result.markup == article.markup
+        assert result.text == article.text
+
+    def test_file_path_source(self):
+        file_path = os.path.join(
+            os.path.dirname(__file__), "fixtures_html", "article_simple.html"
+        )
+        result = StreamExtractor().extract(file_path)
+        assert result.title == "http://info.cern.ch - home of the first website"
+        assert "From here you can:" in result.text
+
+    def test_seekable_stream_source(self):
+        stream = BytesIO(read_html_bytes("article_with_siblings.html"))
+        stream.read(10)
+        result = StreamExtractor().extract(stream)
+        assert (
+            result.markup
+            == Articulo(read_html_text("article_with_siblings.html")).markup
+        )
+
+    def test_non_seekable_stream_source(self):
+        stream = NonSeekableStream(read_html_bytes("article_simple.html"))
+        with pytest.raises(ValueError):
+            StreamExtractor().extract(stream)
+
+    def test_no_content(self):
+        result = StreamExtractor().extract(
+            read_html_bytes("article_with_empty_body.html")
+        )
+        assert result.markup is None
+        assert result.text is None
+
+    def test_no_title(self):
+        with pytest.raises(NoTitleException):
+            StreamExtractor().extract(b"<html><body><p>Text</p></body></html>")
+
+    def test_encoding(self):
+        content = read_html_bytes("article_simple_ru.html", "cp1251")
+        result = StreamExtractor(encoding="cp1251").extract(content)
+        assert result.title == Articulo(read_html_text("article_simple_ru.html")).title
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.5, 1.0])
+    def test_threshold(self, threshold):
+        file_name = "article_with_deeply_nested_content.html"
+        article = Articulo(read_html_text(file_name), threshold=threshold)
+        result = StreamExtractor(threshold=threshold).extract(
+            read_html_bytes(file_name)
+        )
+        assert result.markup == article.markup
+
+    def test_title_meta_after_matching_element(self):
+        content = (
+            b"<html><head><title>Site | Page</title></head><body>"
+            b"<h1>Site</h1>"
+            b'<meta property="og:title" content="Real title">'
+            b"<div><h2>Real title</h2><p>Text of the article</p></div>"
+            b"<p>Footer</p>"
+            b"</body></html>"
+        )
+        article = Articulo(content.decode())
+        result = StreamExtractor().extract(content)
+        assert result.title == article.title == "Real title"
+        assert result.markup == article.markup
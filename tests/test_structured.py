@@ -0,0 +1,94 @@
+import pytest
+
+from articulo import Articulo
+from articulo.metrics import Metrics
+from articulo.structured import find_json_ld_article
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def html() -> str:
+    return read_html_text("article_with_json_ld_body.html")
+
+
+def build_html(json_ld: str) -> str:
+    return f"""
+    <html><head><script type='application/ld+json'>{json_ld}</script></head></html>
+    """
+
+
+class TestFindJsonLdArticle:
+    def test_finds_article_in_graph(self, html):
+        article = find_json_ld_article(html)
+        assert article.headline == "http://info.cern.ch - home of the first website"
+        assert article.body.startswith("From here you can browse")
+
+    def test_finds_article_in_list(self):
+        html = build_html(
+            '[{"@type": "Person"}, {"headline": "A", "articleBody": "B"}]'
+        )
+        assert tuple(find_json_ld_article(html)) == ("A", "B")
+
+    @pytest.mark.parametrize(
+        "json_ld",
+        [
+            '{"headline": "Title"}',
+            '{"articleBody": "Text"}',
+            '{"headline": " ", "articleBody": "Text"}',
+            '{"headline": "Title", "articleBody": "Text cut by the publisher..."}',
+            '{"headline": "Title", "articleBody": "Text", "isAccessibleForFree": false}',
+            '{"headline": "Title", "articleBody": ',
+        ],
+    )
+    def test_skips_incomplete_article(self, json_ld):
+        assert find_json_ld_article(build_html(json_ld)) is None
+
+    def test_strips_tags_and_entities(self):
+        html = build_html(
+            '{"headline": "Caf&eacute; &amp; bar", "articleBody": '
+            '"<p>First &lt;line&gt; with <b>bold</b> text.</p>\\n'
+            '<p>Second line.<br>Third line.</p>"}'
+        )
+        article = find_json_ld_article(html)
+        assert article.headline == "Café & bar"
+        assert article.body == "First <line> with bold text.\nSecond line.\nThird line."
+
+    def test_skips_article_cut_inside_markup(self):
+        html = build_html(
+            '{"headline": "Title", "articleBody": "<p>Text cut by the publisher...</p>"}'
+        )
+        assert find_json_ld_article(html) is None
+
+    def test_no_json_ld(self):
+        assert find_json_ld_article(read_html_text("article_simple.html")) is None
+
+
+class TestJsonLdFastPath:
+    def test_reads_title_and_text(self, html):
+        metrics = Metrics()
+        article = Articulo(html, prefer_json_ld=True, metrics=metrics)
+        assert article.title == "http://info.cern.ch - home of the first website"
+        assert article.text == find_json_ld_article(html).body
+        assert article.word_count == len(article.text.split())
+        assert metrics.get("json_ld.hit") == 1
+        assert metrics.get("parse.count") == 0
+        assert metrics.get("content.count") == 0
+
+    def test_markup_is_found_in_document(self, html):
+        article = Articulo(html, prefer_json_ld=True)
+        assert article.markup == Articulo(html).markup
+
+    def test_falls_back_to_document(self):
+        html = read_html_text("article_with_json_ld_paywall.html")
+        metrics = Metrics()
+        article = Articulo(html, prefer_json_ld=True, metrics=metrics)
+        assert article.title == Articulo(html).title
+        assert article.text == Articulo(html).text
+        assert metrics.get("json_ld.miss") == 1
+        assert metrics.get("content.count") == 1
+
+    def test_disabled_by_default(self, html):
+        metrics = Metrics()
+        article = Articulo(html, metrics=metrics)
+        assert article.text != find_json_ld_article(html).body
+        assert metrics.get("json_ld.count") == 0
@@ -0,0 +1,79 @@
+import pytest
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.template_cache import TemplateCache
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+@pytest.fixture
+def other_url() -> str:
+    return "https://info.cern.ch/other"
+
+
+class TestTemplateCache:
+    def test_remembers_content_path(
+        self, requests_mock: MockerCore, url, other_url, html
+    ):
+        requests_mock.get(url, text=html)
+        requests_mock.get(other_url, text=html)
+        cache = TemplateCache()
+
+        first = Articulo(url, template_cache=cache)
+        second = Articulo(other_url, template_cache=cache)
+
+        assert first.markup == second.markup == Articulo(url).markup
+        assert "info.cern.ch" in cache
+        assert cache.misses == 1
+        assert cache.hits == 1
+
+    def test_falls_back_on_different_template(
+        self, requests_mock: MockerCore, url, other_url, html, other_html
+    ):
+        requests_mock.get(url, text=html)
+        requests_mock.get(other_url, text=other_html)
+        cache = TemplateCache()
+
+        Articulo(url, template_cache=cache).markup
+        article = Articulo(other_url, template_cache=cache)
+
+        assert article.markup == Articulo(other_url).markup
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_skips_content_without_url(self, html):
+        cache = TemplateCache()
+        assert Articulo(html, template_cache=cache).markup is not None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TemplateCache(max_size=2)
+        cache.put("a.com", [("article", "", ())])
+        cache.put("b.com", [("main", "", ())])
+        cache.get("a.com")
+        cache.put("c.com", [("div", "", ("content",))])
+        assert "a.com" in cache
+        assert "b.com" not in cache
+        assert "c.com" in cache
+
+    def test_persists_paths(self, tmp_path):
+        cache = TemplateCache()
+        cache.put("a.com", [("main", "", ()), ("div", "post", ("content", "wide"))])
+        file_path = tmp_path / "cache.json"
+        cache.save(file_path)
+
+        loaded = TemplateCache.load(file_path)
+        assert loaded.get("a.com") == cache.get("a.com")
+
+    @pytest.fixture
+    def html(self):
+        return read_html_text("article_with_deeply_nested_content.html")
+
+    @pytest.fixture
+    def other_html(self):
+        return read_html_text("article_with_content_siblings.html")
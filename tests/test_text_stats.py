@@ -0,0 +1,55 @@
+import pytest
+from bs4 import BeautifulSoup
+
+from articulo.stats import TextStats
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(
+        read_html_text("article_with_deeply_nested_content.html"), features="lxml"
+    )
+
+
+class TestTextStats:
+    def test_counts_chars_like_text_property(self, soup):
+        stats = TextStats(soup)
+        for element in soup.find_all(True):
+            assert stats.chars(element) == len(element.text)
+
+    def test_counts_words(self, soup):
+        stats = TextStats(soup)
+        for element in soup.find_all(True):
+            assert stats.words(element) == len(element.text.split())
+
+    def test_counts_link_chars(self, soup):
+        stats = TextStats(soup)
+        links_length = sum(len(link.text) for link in soup.find_all("a"))
+        assert stats.link_chars(soup.body) == links_length
+        assert stats.link_chars(soup.find("h1")) == 0
+        assert 0 < stats.link_density(soup.find("ul")) < 1
+
+    def test_ignores_scripts_and_comments(self):
+        soup = BeautifulSoup(
+            "<body><p>text</p><script>var a;</script><!-- comment --></body>",
+            features="lxml",
+        )
+        stats = TextStats(soup)
+        assert stats.chars(soup.body) == len(soup.body.text) == 4
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<p>foo<b>bar</b></p>",
+            "<p>foo <b>bar</b></p>",
+            "<p>foo<b> bar</b>baz</p>",
+            "<p><i>fo</i><b>o</b><a>bar</a> baz</p>",
+            "<p>foo<!-- comment -->bar<br>baz</p>",
+        ],
+    )
+    def test_counts_words_across_tags(self, html):
+        soup = BeautifulSoup(html, features="lxml")
+        stats = TextStats(soup)
+        for element in soup.find_all(True):
+            assert stats.words(element) == len(element.text.split())
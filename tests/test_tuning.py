@@ -0,0 +1,70 @@
+from copy import copy
+
+import pytest
+
+from articulo import Articulo
+from articulo.metrics import Metrics
+from articulo.utils import sanitize_html
+from .utils.helpers import read_html_text
+
+thresholds = [0.0, 0.2, 0.5, 0.7, 0.9, 1.0]
+
+
+class TestEvaluateThresholds:
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "article_simple.html",
+            "article_with_deeply_nested_content.html",
+            "article_with_deeply_nested_heading.html",
+            "article_with_nested_heading.html",
+            "article_with_siblings.html",
+        ],
+    )
+    def test_same_containers_as_separate_articles(self, file_name):
+        html = read_html_text(file_name)
+        evaluations = Articulo(html).evaluate_thresholds(thresholds)
+        assert [evaluation.threshold for evaluation in evaluations] == thresholds
+        for evaluation in evaluations:
+            article = Articulo(html, threshold=evaluation.threshold)
+            assert str(sanitize_html(copy(evaluation.content))) == article.markup
+            assert evaluation.chars == len(evaluation.content.text)
+
+    def test_parses_once(self):
+        metrics = Metrics()
+        article = Articulo(
+            read_html_text("article_with_deeply_nested_content.html"), metrics=metrics
+        )
+        evaluations = article.evaluate_thresholds(thresholds)
+        assert metrics.get("parse.count") == 1
+        assert evaluations[0].content.name == "body"
+        assert evaluations[-1].content.name == "div"
+        assert evaluations[0].chars > evaluations[-1].chars
+
+    def test_keeps_order_and_duplicates(self):
+        article = Articulo(read_html_text("article_with_deeply_nested_content.html"))
+        evaluations = article.evaluate_thresholds([1.0, 0.0, 1.0])
+        assert [evaluation.threshold for evaluation in evaluations] == [1.0, 0.0, 1.0]
+        assert evaluations[0] == evaluations[2]
+
+    def test_no_content(self):
+        article = Articulo(read_html_text("article_with_empty_body.html"))
+        evaluations = article.evaluate_thresholds([0.5])
+        assert evaluations[0].content is None
+        assert evaluations[0].chars == 0
+
+    def test_max_iterations(self):
+        html = (
+            "<html><head><title>Title</title></head><body>"
+            + "<p>Text around the deeply nested title.</p>"
+            + "<div>" * 120
+            + "<h1>Title</h1>"
+            + "</div>" * 120
+            + "</body></html>"
+        )
+        article = Articulo(html)
+        resolved, pending = article.evaluate_thresholds([0.5, 1.0])
+        assert resolved.content.name == "body"
+        assert resolved.chars > 0
+        assert pending.content is None
+        assert pending.chars == 0
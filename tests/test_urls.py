@@ -0,0 +1,106 @@
+from urllib.parse import urlparse, urlunparse
+
+import pytest
+from bs4 import BeautifulSoup
+from requests_mock import MockerCore
+
+from articulo import Articulo
+from articulo.urls import UrlResolver
+from .utils.helpers import read_html_text
+
+
+@pytest.fixture
+def url() -> str:
+    return "https://info.cern.ch/"
+
+
+def resolve_with_path_replacement(page_url: str, link: str) -> str:
+    """
+    Previous implementation of the link resolution, kept for comparison.
+    """
+    return str(urlunparse(urlparse(page_url)._replace(path=link)))
+
+
+class TestUrlResolver:
+    @pytest.mark.parametrize(
+        "page_url,link,expected",
+        [
+            (
+                "https://info.cern.ch/a/b.html",
+                "/rss.xml",
+                "https://info.cern.ch/rss.xml",
+            ),
+            (
+                "https://info.cern.ch/a/b.html",
+                "rss.xml",
+                "https://info.cern.ch/a/rss.xml",
+            ),
+            (
+                "https://info.cern.ch/a/b/c.html",
+                "../rss.xml",
+                "https://info.cern.ch/a/rss.xml",
+            ),
+            (
+                "https://info.cern.ch/a?page=2",
+                "/icon.png",
+                "https://info.cern.ch/icon.png",
+            ),
+            (
+                "https://info.cern.ch/",
+                "/icon.png?v=3",
+                "https://info.cern.ch/icon.png?v=3",
+            ),
+            (
+                "https://info.cern.ch/",
+                "//cdn.cern.ch/icon.png",
+                "https://cdn.cern.ch/icon.png",
+            ),
+            (
+                "https://info.cern.ch/",
+                "http://home.cern/icon.png",
+                "http://home.cern/icon.png",
+            ),
+        ],
+    )
+    def test_resolves_links(self, page_url, link, expected):
+        assert UrlResolver(page_url).resolve(link) == expected
+
+    def test_uses_base_href(self):
+        resolver = UrlResolver("https://info.cern.ch/a/b.html", "/static/")
+        assert resolver.resolve("icon.png") == "https://info.cern.ch/static/icon.png"
+
+    def test_uses_absolute_base_href_without_page_url(self):
+        resolver = UrlResolver(None, "https://cdn.cern.ch/")
+        assert resolver.resolve("icon.png") == "https://cdn.cern.ch/icon.png"
+
+    def test_keeps_links_without_base(self):
+        assert UrlResolver(None).resolve("/icon.png") == "/icon.png"
+
+    def test_reads_base_href_from_document(self):
+        soup = BeautifulSoup(
+            '<html><head><base href="https://cdn.cern.ch/"></head></html>',
+            features="lxml",
+        )
+        resolver = UrlResolver.from_document("https://info.cern.ch/", soup)
+        assert resolver.resolve("rss.xml") == "https://cdn.cern.ch/rss.xml"
+
+
+class TestComparingWithPreviousResolution:
+    @pytest.mark.parametrize(
+        "fixture", ["article_with_rss.html", "article_with_rss_relative.html"]
+    )
+    def test_gives_same_results_on_fixtures(
+        self, requests_mock: MockerCore, url, fixture
+    ):
+        html = read_html_text(fixture)
+        requests_mock.get(url, text=html)
+        soup = BeautifulSoup(html, features="lxml")
+        links = [
+            link["href"]
+            for link in soup.find_all("link", attrs={"type": "application/rss+xml"})
+        ]
+        expected = [
+            link if urlparse(link).scheme else resolve_with_path_replacement(url, link)
+            for link in links
+        ]
+        assert Articulo(url).rss == expected